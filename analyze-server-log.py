@@ -0,0 +1,316 @@
+#!/usr/bin/env python3
+"""
+Script to summarise request latency and compile times from a Next dev server log
+
+Reads server.log (or stdin) one line at a time and keeps a fixed-size
+quantile sketch per route, so a log of any length takes the same memory.
+A route's first request after the server started, or after the route was
+compiled, is counted as a cold hit; the rest are warm. --follow keeps
+reading as the dev server appends and reprints the report every few
+seconds.
+"""
+
+import argparse
+import json
+import math
+import os
+import re
+import sys
+import time
+
+DEFAULT_LOG = "server.log"
+
+# " GET /tools/word-counter 200 in 451ms", " ✓ Compiled /tools/word-counter in 396ms",
+# " ✓ Ready in 959ms", with or without the dev server's colour codes
+LINE_RE = re.compile(
+    r'^\s*(?:'
+    r'(?P<method>GET|HEAD|POST|PUT|PATCH|DELETE|OPTIONS) (?P<path>\S+) (?P<status>\d{3}) in (?P<time>[\d.]+)(?P<unit>ms|s)'
+    r'|\S* ?Compiled (?:(?P<route>/\S*) )?in (?P<compile_time>[\d.]+)(?P<compile_unit>ms|s)'
+    r'|\S* ?Ready in (?P<ready_time>[\d.]+)(?P<ready_unit>ms|s)'
+    r')'
+)
+ANSI_RE = re.compile(r'\x1b\[[0-9;]*m')
+
+# Routes recompiled by a hot reload aren't named in the log
+HMR_ROUTE = "(hot reload)"
+
+
+class QuantileSketch:
+    """Log-bucketed histogram with a bounded relative error (DDSketch style)
+
+    Every value lands in bucket ceil(log(value, gamma)), so any quantile is
+    off by at most `accuracy` relative to the true value. Past max_buckets
+    the lowest buckets are merged, which keeps memory fixed and only
+    coarsens the smallest values.
+    """
+
+    def __init__(self, accuracy=0.01, max_buckets=1024):
+        self.gamma = (1 + accuracy) / (1 - accuracy)
+        self.log_gamma = math.log(self.gamma)
+        self.max_buckets = max_buckets
+        self.buckets = {}
+        self.zeros = 0
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, value):
+        self.count += 1
+        self.total += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+        if value <= 0:
+            self.zeros += 1
+            return
+        key = math.ceil(math.log(value) / self.log_gamma)
+        self.buckets[key] = self.buckets.get(key, 0) + 1
+        if len(self.buckets) > self.max_buckets:
+            lowest, second = sorted(self.buckets)[:2]
+            self.buckets[second] += self.buckets.pop(lowest)
+
+    def quantile(self, q):
+        """Approximate value at quantile q (0..1), or None if empty"""
+        if not self.count:
+            return None
+        # Nearest rank: the smallest value with at least q of the values at or below it
+        rank = max(math.ceil(q * self.count) - 1, 0)
+        seen = self.zeros
+        if rank < seen:
+            return 0.0
+        for key in sorted(self.buckets):
+            seen += self.buckets[key]
+            if seen > rank:
+                # Midpoint of the bucket, clamped to what was actually seen
+                value = 2 * self.gamma ** key / (self.gamma + 1)
+                return min(max(value, self.min), self.max)
+        return self.max
+
+    def merged(self, other):
+        """A new sketch holding the values of both (built with the same accuracy)"""
+        sketch = QuantileSketch()
+        sketch.gamma, sketch.log_gamma, sketch.max_buckets = self.gamma, self.log_gamma, self.max_buckets
+        for source in (self, other):
+            for key, count in source.buckets.items():
+                sketch.buckets[key] = sketch.buckets.get(key, 0) + count
+            sketch.zeros += source.zeros
+            sketch.count += source.count
+            sketch.total += source.total
+            sketch.min = min(sketch.min, source.min)
+            sketch.max = max(sketch.max, source.max)
+        while len(sketch.buckets) > sketch.max_buckets:
+            lowest, second = sorted(sketch.buckets)[:2]
+            sketch.buckets[second] += sketch.buckets.pop(lowest)
+        return sketch
+
+    def mean(self):
+        return self.total / self.count if self.count else None
+
+
+class RouteStats:
+    """Latency sketches (cold and warm hits) and compile times for one route"""
+
+    def __init__(self):
+        self.cold = QuantileSketch()
+        self.warm = QuantileSketch()
+        self.compiles = QuantileSketch()
+        self.statuses = {}
+
+    def requests(self):
+        return self.cold.count + self.warm.count
+
+
+class LogAnalyzer:
+    """Feed it log lines; it keeps per-route statistics"""
+
+    def __init__(self):
+        self.routes = {}
+        self.ready = QuantileSketch()
+        self.lines = 0
+        self.matched = 0
+        # Routes served since the last compile of each (or the last restart)
+        self._warm = set()
+
+    def route(self, path):
+        if path not in self.routes:
+            self.routes[path] = RouteStats()
+        return self.routes[path]
+
+    def feed(self, line):
+        self.lines += 1
+        if '\x1b' in line:
+            line = ANSI_RE.sub('', line)
+        match = LINE_RE.match(line)
+        if match is None:
+            return
+        self.matched += 1
+
+        method, path, status, value, unit = match.group("method", "path", "status", "time", "unit")
+        if method:
+            # Query strings don't change which page was compiled
+            path = path.split('?')[0]
+            stats = self.route(path)
+            (stats.warm if path in self._warm else stats.cold).add(to_ms(value, unit))
+            self._warm.add(path)
+            stats.statuses[status] = stats.statuses.get(status, 0) + 1
+        elif match.group("compile_time"):
+            path = match.group("route") or HMR_ROUTE
+            self.route(path).compiles.add(to_ms(match.group("compile_time"), match.group("compile_unit")))
+            if path == HMR_ROUTE:
+                # A hot reload may have recompiled anything
+                self._warm.clear()
+            else:
+                self._warm.discard(path)
+        else:
+            # A (re)started server has nothing compiled yet
+            self.ready.add(to_ms(match.group("ready_time"), match.group("ready_unit")))
+            self._warm.clear()
+
+    def report(self):
+        """Summary as plain data, routes by request count"""
+        routes = {}
+        for path, stats in sorted(self.routes.items(), key=lambda item: (-item[1].requests(), item[0])):
+            routes[path] = {
+                "requests": stats.requests(),
+                "statuses": stats.statuses,
+                # Sketches merge exactly, so the overall one is built on demand
+                "latency_ms": summarise(stats.cold.merged(stats.warm)),
+                "cold_ms": summarise(stats.cold),
+                "warm_ms": summarise(stats.warm),
+                "compile_ms": summarise(stats.compiles),
+            }
+        return {
+            "lines": self.lines,
+            "matched": self.matched,
+            "starts": self.ready.count,
+            "ready_ms": summarise(self.ready),
+            "routes": routes,
+        }
+
+
+def to_ms(value, unit):
+    return float(value) * 1000 if unit == 's' else float(value)
+
+
+def summarise(sketch):
+    if not sketch.count:
+        return None
+    return {
+        "count": sketch.count,
+        "mean": round(sketch.mean(), 1),
+        "p50": round(sketch.quantile(0.50), 1),
+        "p95": round(sketch.quantile(0.95), 1),
+        "p99": round(sketch.quantile(0.99), 1),
+        "max": round(sketch.max, 1),
+    }
+
+
+def format_ms(value):
+    if value is None:
+        return "-"
+    return f"{value / 1000:.1f}s" if value >= 10000 else f"{value:.0f}ms"
+
+
+def print_report(report, out=None):
+    """Print the summary as a table"""
+    print(f"{report['lines']} line(s), {report['matched']} recognised, {report['starts']} server start(s)", file=out)
+    if not report["routes"]:
+        print("No requests or compiles found", file=out)
+        return
+    print(f"\n{'route':<40} {'reqs':>5} {'p50':>7} {'p95':>7} {'p99':>7} {'max':>7}  "
+          f"{'cold p50':>8} {'warm p50':>8}  {'compiles':>8} {'compile p50':>11} {'compile max':>11}", file=out)
+    for path, route in report["routes"].items():
+        latency = route["latency_ms"] or {}
+        compile_ms = route["compile_ms"] or {}
+        print(
+            f"{path:<40} {route['requests']:>5} {format_ms(latency.get('p50')):>7} "
+            f"{format_ms(latency.get('p95')):>7} {format_ms(latency.get('p99')):>7} "
+            f"{format_ms(latency.get('max')):>7}  "
+            f"{format_ms((route['cold_ms'] or {}).get('p50')):>8} {format_ms((route['warm_ms'] or {}).get('p50')):>8}  "
+            f"{compile_ms.get('count', 0):>8} {format_ms(compile_ms.get('p50')):>11} "
+            f"{format_ms(compile_ms.get('max')):>11}",
+            file=out,
+        )
+
+
+def follow(f, analyzer, interval, show):
+    """Keep reading f as it grows, calling show() every interval seconds until Ctrl+C"""
+    path = None if f is sys.stdin else f.name
+    # Report as soon as the existing lines are read
+    next_report = 0
+    # The start of a line the server is still writing
+    partial = ''
+    try:
+        while True:
+            line = f.readline()
+            if line:
+                if not line.endswith('\n'):
+                    partial += line
+                    continue
+                analyzer.feed(partial + line)
+                partial = ''
+                continue
+            if time.monotonic() >= next_report:
+                show()
+                next_report = time.monotonic() + interval
+            # A truncated or replaced log starts again from the top
+            if path and os.path.exists(path):
+                st = os.stat(path)
+                if st.st_size < f.tell() or st.st_ino != os.fstat(f.fileno()).st_ino:
+                    f.close()
+                    f = open(path, 'r', encoding='utf-8', errors='replace')
+                    partial = ''
+                    continue
+            time.sleep(0.2)
+    finally:
+        if path:
+            f.close()
+
+
+def main():
+    """Summarise a dev server log"""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("log", nargs="?", default=DEFAULT_LOG,
+                        help="log file, or - for stdin (default: %(default)s)")
+    parser.add_argument("--follow", "-f", action="store_true",
+                        help="keep reading as the log grows and reprint the report until Ctrl+C")
+    parser.add_argument("--interval", type=float, default=5.0, metavar="SECONDS",
+                        help="how often --follow reprints the report (default: %(default)s)")
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args()
+
+    analyzer = LogAnalyzer()
+
+    def show():
+        report = analyzer.report()
+        if args.json:
+            json.dump(report, sys.stdout, indent=2)
+            print()
+        else:
+            print_report(report)
+        sys.stdout.flush()
+
+    try:
+        f = sys.stdin if args.log == '-' else open(args.log, 'r', encoding='utf-8', errors='replace')
+    except OSError as e:
+        print(f"❌ Could not read {args.log}: {e.strerror}", file=sys.stderr)
+        return 1
+    try:
+        if args.follow:
+            try:
+                follow(f, analyzer, args.interval, show)
+            except KeyboardInterrupt:
+                print("\n✓ Stopped following", file=sys.stderr)
+        else:
+            for line in f:
+                analyzer.feed(line)
+    finally:
+        if f is not sys.stdin:
+            f.close()
+    show()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
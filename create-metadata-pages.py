@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Script to generate every tool's metadata page.tsx from content/pages.json
+"""
+
+import argparse
+import os
+import sys
+
+from toolshub_codemod.changes import add_since_argument, since_from_args
+from toolshub_codemod.engine import ToolFiles, apply_transforms, get_transforms, walk_tools
+from toolshub_codemod.pages import (
+    PAGES_FILE, dump_pages, load_pages, page_style, read_page_metadata, render_page,
+)
+from toolshub_codemod.parallel import (
+    FAILED, SKIPPED, UPDATED, ToolResult, add_jobs_argument, report, run_tools,
+)
+from toolshub_codemod.roots import add_root_argument, roots_from_args, tools_path
+from toolshub_codemod.writeback import Change, add_dry_run_argument, open_batch, read_text
+
+# Pages rendered in server SEO mode keep their seo-content slot
+SEO_SLOT_TRANSFORMS = get_transforms(["seo-page-slot"])
+
+def create_metadata_page(tool_key, meta, tools_dir):
+    """Render one tool's page.tsx from its manifest entry"""
+    tool_dir = os.path.join(tools_dir, tool_key)
+    file_path = os.path.join(tool_dir, "page.tsx")
+
+    if not os.path.exists(os.path.join(tool_dir, "client.tsx")):
+        return ToolResult(tool_key, FAILED, f"❌ No client.tsx for {tool_key}")
+
+    # Keep a hand-written page's formatting so only metadata changes show up
+    original = read_text(file_path)
+    try:
+        content = render_page(tool_key, meta, page_style(original))
+    except ValueError as e:
+        return ToolResult(tool_key, FAILED, f"❌ {e}")
+
+    if './seo-content"' in original:
+        content, _, errors = apply_transforms(tool_key, content, SEO_SLOT_TRANSFORMS, ToolFiles(tool_dir))
+        if errors:
+            return ToolResult(tool_key, FAILED, f"⚠️  {tool_key}: {'; '.join(errors)}")
+
+    if content == original:
+        return ToolResult(tool_key, SKIPPED, f"✓ {tool_key} page is up to date")
+    change = Change(file_path, content, original if os.path.exists(file_path) else None)
+    return ToolResult(tool_key, UPDATED, f"✓ Generated page.tsx for {tool_key}", change)
+
+def extract_pages(roots, log):
+    """Rebuild the manifest from the generateToolMetadata() calls in existing pages"""
+    pages = {}
+    for root in roots:
+        for tool_key in walk_tools(tools_path(root)):
+            meta = read_page_metadata(read_text(os.path.join(tools_path(root), tool_key, "page.tsx")))
+            if meta is not None:
+                pages.setdefault(tool_key, meta)
+    with open(PAGES_FILE, 'w', encoding='utf-8') as f:
+        f.write(dump_pages(pages))
+    print(f"✓ Wrote {len(pages)} page(s) to {PAGES_FILE}", file=log)
+
+def main():
+    """Generate page.tsx for every tool in the manifest"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    add_jobs_argument(parser)
+    add_root_argument(parser)
+    add_since_argument(parser)
+    add_dry_run_argument(parser)
+    parser.add_argument("--extract", action="store_true",
+                        help=f"rebuild {os.path.relpath(PAGES_FILE)} from the existing pages instead")
+    args = parser.parse_args()
+    roots = roots_from_args(parser, args)
+    # Keep stdout a clean patch when previewing
+    log = sys.stderr if args.dry_run else sys.stdout
+
+    if args.extract:
+        extract_pages(roots, log)
+        return 0
+
+    since = since_from_args(parser, args, roots)
+    pages = load_pages()
+
+    print("=" * 70, file=log)
+    print("Generating Metadata Pages", file=log)
+    print("=" * 70, file=log)
+
+    success_count = 0
+    changed = []
+    for root in roots:
+        if len(roots) > 1:
+            print(f"\n{root}", file=log)
+        batch = open_batch(args.dry_run, root, roots)
+        results = run_tools(
+            create_metadata_page, pages, jobs=args.jobs, batch=batch,
+            tools_dir=tools_path(root), tools=since and since[root],
+        )
+        counts = report(results, log)
+        success_count += counts[UPDATED] + counts[SKIPPED]
+        changed += getattr(batch, "changed", [])
+
+    print("=" * 70, file=log)
+    print(f"✓ Successfully generated {success_count}/{len(pages) * len(roots)} pages", file=log)
+    print("=" * 70, file=log)
+
+    # A dry run fails if anything would change
+    return 1 if changed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,7 +1,7 @@
 #!/bin/bash
 # Quick script to manually add basic SEO content markers to remaining tools
 
-cd /home/mobeen/Desktop/Work/Personal/timio
+cd "$(dirname "$0")"
 
 echo "Phase 3 SEO Content Status:"
 echo "=========================="
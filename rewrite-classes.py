@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Script to rewrite Tailwind classes across the site from a rewrite table
+"""
+
+import argparse
+import os
+import sys
+
+from toolshub_codemod.classes import (
+    RewriteTableError, load_table, rewrite_files, source_files, table_path,
+)
+from toolshub_codemod.parallel import add_jobs_argument
+from toolshub_codemod.roots import add_root_argument, roots_from_args
+from toolshub_codemod.writeback import add_dry_run_argument, open_batch
+
+DEFAULT_TABLE = "remove-gradients"
+
+def main():
+    """Apply a class rewrite table to every className under src/"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("paths", nargs="*", metavar="PATH",
+                        help="files or directories to rewrite, relative to each root (default: src)")
+    parser.add_argument("--table", default=DEFAULT_TABLE,
+                        help="rewrite table: a name from content/class-rewrites/ or a JSON file "
+                             "(default: %(default)s)")
+    parser.add_argument("--all-strings", action="store_true",
+                        help="rewrite every string literal, not just className values "
+                             "(for classes kept in variables and lookup tables)")
+    add_jobs_argument(parser)
+    add_root_argument(parser)
+    add_dry_run_argument(parser)
+    args = parser.parse_args()
+    roots = roots_from_args(parser, args)
+    try:
+        table = load_table(table_path(args.table))
+    except (OSError, ValueError, RewriteTableError) as e:
+        parser.error(f"--table: {e}")
+    # Keep stdout a clean patch when previewing
+    log = sys.stderr if args.dry_run else sys.stdout
+
+    print("=" * 70, file=log)
+    print(f"Rewriting Classes ({args.table}, {len(table)} rules)", file=log)
+    print("=" * 70, file=log)
+
+    changed = []
+    replaced = 0
+    failed = 0
+    for root in roots:
+        if len(roots) > 1:
+            print(f"\n{root}", file=log)
+        files = source_files([os.path.join(root, path) for path in args.paths or ["src"]])
+        batch = open_batch(args.dry_run, root, roots)
+        try:
+            for path, change, count, error in rewrite_files(files, table, args.jobs, args.all_strings):
+                name = os.path.relpath(path, root)
+                if error:
+                    failed += 1
+                    print(f"⚠️  Skipped {name}: {error}", file=log)
+                elif change is not None and batch.stage(*change):
+                    replaced += count
+                    print(f"✓ Rewrote {count} class pattern(s) in {name}", file=log)
+        except BaseException:
+            batch.abort()
+            raise
+        batch.commit()
+        changed += getattr(batch, "changed", [])
+
+    print("=" * 70, file=log)
+    print(f"✓ {replaced} rewrite(s), {failed} file(s) skipped", file=log)
+    print("=" * 70, file=log)
+
+    # A dry run fails if anything would change
+    if args.dry_run:
+        return 1 if changed else 0
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,37 @@
+"""
+analyze-server-log.py --follow
+"""
+
+import pytest
+
+from toolshub_codemod.transforms import _load_script
+
+analyze = _load_script("analyze-server-log.py")
+
+
+class Stop(Exception):
+    pass
+
+
+def test_follow_joins_a_line_written_in_two_parts(tmp_path):
+    log = tmp_path / "server.log"
+    log.write_text(" GET / 200 in 43", encoding="utf-8")
+    analyzer = analyze.LogAnalyzer()
+    shows = []
+
+    def show():
+        shows.append(analyzer.report())
+        if len(shows) == 1:
+            # The dev server finishes the line after the first read hit EOF
+            with open(log, 'a', encoding="utf-8") as f:
+                f.write("17ms\n")
+        elif analyzer.lines or len(shows) > 50:
+            raise Stop
+
+    with pytest.raises(Stop):
+        analyze.follow(open(log, 'r', encoding="utf-8"), analyzer, 0, show)
+
+    assert shows[0]["lines"] == 0
+    report = analyzer.report()
+    assert report["lines"] == 1
+    assert report["routes"]["/"]["latency_ms"]["max"] == 4317.0
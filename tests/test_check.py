@@ -0,0 +1,51 @@
+"""
+Read-only tools tree check
+"""
+
+from toolshub_codemod.check import check_tool
+
+CLIENT = 'export default function WordCounterClient() {\n  return <div />\n}\n'
+PAGE = (
+    'import WordCounterClient from "./client"\n\n'
+    'export default function WordCounterPage() {\n  return <WordCounterClient />\n}\n'
+)
+PAGE_ONLY = (
+    '"use client"\n\n'
+    'export default function ColorPaletteGeneratorPage() {\n  return <div />\n}\n'
+)
+
+
+def write_tool(tools_dir, tool, **files):
+    tool_dir = tools_dir / tool
+    tool_dir.mkdir(parents=True)
+    for name, content in files.items():
+        (tool_dir / name.replace('_', '.')).write_text(content, encoding="utf-8")
+
+
+def checks(problems):
+    return sorted((problem.check, problem.file) for problem in problems)
+
+
+def test_client_and_page_tool_is_clean(tmp_path):
+    write_tool(tmp_path, "word-counter", client_tsx=CLIENT, page_tsx=PAGE)
+    assert check_tool(str(tmp_path), "word-counter", False) == []
+
+
+def test_page_only_tool_is_clean(tmp_path):
+    write_tool(tmp_path, "color-palette-generator", page_tsx=PAGE_ONLY)
+    assert check_tool(str(tmp_path), "color-palette-generator", False) == []
+
+
+def test_missing_client_reported_when_page_is_not_the_tool(tmp_path):
+    write_tool(tmp_path, "word-counter", page_tsx=PAGE)
+    assert checks(check_tool(str(tmp_path), "word-counter", False)) == [
+        ("layout", "client.tsx"),
+    ]
+
+
+def test_missing_client_and_page_export(tmp_path):
+    write_tool(tmp_path, "word-counter", page_tsx='export default function Other() {}\n')
+    assert checks(check_tool(str(tmp_path), "word-counter", False)) == [
+        ("layout", "client.tsx"),
+        ("page-export", "page.tsx"),
+    ]
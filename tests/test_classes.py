@@ -0,0 +1,85 @@
+"""
+Table-driven class rewriting
+"""
+
+import os
+import shutil
+import subprocess
+
+import pytest
+
+from toolshub_codemod.classes import ClassRewriter, RewriteTableError, load_table, table_path
+
+REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# The sed expressions of the retired remove-gradients.sh, which
+# content/class-rewrites/remove-gradients.json replaces
+REMOVE_GRADIENTS_SED = [
+    's/bg-gradient-to-r from-blue-[0-9]* to-purple-[0-9]*/bg-blue-600/g',
+    's/bg-gradient-to-r from-blue-[0-9]* via-purple-[0-9]* to-pink-[0-9]*/bg-blue-600/g',
+    's/bg-gradient-to-r from-orange-[0-9]* to-pink-[0-9]*/bg-orange-500/g',
+    's/bg-gradient-to-r from-green-[0-9]* to-emerald-[0-9]*/bg-green-500/g',
+    's/bg-gradient-to-r from-purple-[0-9]* to-pink-[0-9]*/bg-purple-500/g',
+    's/bg-gradient-to-r from-indigo-[0-9]* to-purple-[0-9]*/bg-indigo-600/g',
+    's/bg-gradient-to-r from-pink-[0-9]* to-rose-[0-9]*/bg-pink-500/g',
+    's/bg-gradient-to-r from-cyan-[0-9]* to-blue-[0-9]*/bg-cyan-500/g',
+    's/bg-gradient-to-br from-[^ ]* to-[^ ]*/bg-blue-100/g',
+    's/bg-gradient-to-[a-z]* from-[^ ]*/bg-blue-50/g',
+    's/text-gradient/text-blue-600 font-bold/g',
+    's/hover:bg-gradient-to-r hover:from-[^ ]* hover:to-[^ ]*/hover:bg-blue-50/g',
+    's/group-hover:bg-gradient-to-r group-hover:from-[^ ]* group-hover:to-[^ ]*/group-hover:bg-blue-50/g',
+    's/group-hover:text-gradient/group-hover:text-blue-600/g',
+    's/from-\\([a-z]*\\)-\\([0-9]*\\)\\/\\([0-9]*\\) to-\\([a-z]*\\)-\\([0-9]*\\)\\/\\([0-9]*\\)/bg-\\1-\\2 opacity-\\3/g',
+]
+
+
+def test_matches_whole_tokens_only():
+    rewriter = ClassRewriter({"from-blue-500": "bg-blue-500"})
+    assert rewriter.rewrite("hover:from-blue-500x from-blue-5000 from-blue-500") == (
+        "hover:from-blue-500x from-blue-5000 bg-blue-500", 1,
+    )
+    assert rewriter.rewrite("hover:from-blue-500") == ("hover:from-blue-500", 0)
+
+
+def test_wildcards_stay_within_a_token():
+    rewriter = ClassRewriter({"from-{color}-{shade}": "bg-{color}-{shade}", "to-*": ""})
+    assert rewriter.rewrite("p-4 from-red-500 to-blue-600 m-2") == ("p-4 bg-red-500 m-2", 2)
+    assert rewriter.rewrite("from-red-500/50") == ("from-red-500/50", 0)
+
+
+def test_longest_match_wins():
+    rewriter = ClassRewriter({
+        "bg-gradient-to-r": "bg-gray-100",
+        "bg-gradient-to-r from-blue-*": "bg-blue-100",
+        "bg-gradient-to-r from-blue-* to-purple-*": "bg-blue-600",
+    })
+    assert rewriter.rewrite("bg-gradient-to-r from-blue-500 to-purple-600 p-4") == ("bg-blue-600 p-4", 1)
+    assert rewriter.rewrite("bg-gradient-to-r from-blue-500 p-4") == ("bg-blue-100 p-4", 1)
+    assert rewriter.rewrite("bg-gradient-to-r p-4") == ("bg-gray-100 p-4", 1)
+
+
+def test_earlier_entry_wins_a_tie():
+    rewriter = ClassRewriter({"from-blue-*": "first", "from-*-500": "second"})
+    assert rewriter.rewrite("from-blue-500") == ("first", 1)
+
+
+def test_unknown_placeholder_in_replacement():
+    with pytest.raises(RewriteTableError):
+        ClassRewriter({"from-{color}-500": "bg-{shade}"})
+
+
+@pytest.mark.skipif(shutil.which("sed") is None, reason="needs sed")
+def test_same_output_as_remove_gradients_sh(tmp_path):
+    client = os.path.join(REPO, "src", "app", "tools", "css-minifier", "client.tsx")
+    with open(client, 'r', encoding='utf-8') as f:
+        source = f.read()
+    args = ["sed"]
+    for expression in REMOVE_GRADIENTS_SED:
+        args += ["-e", expression]
+    expected = subprocess.run(args + [client], capture_output=True, text=True, check=True).stdout
+
+    rewriter = ClassRewriter(load_table(table_path("remove-gradients")))
+    content, count = rewriter.rewrite_source(source)
+
+    assert count > 0
+    assert content == expected
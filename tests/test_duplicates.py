@@ -0,0 +1,54 @@
+"""
+Near-duplicate detection of tool prose
+"""
+
+from toolshub_codemod.duplicates import find_duplicates, jaccard, shingles
+
+PROSE = (
+    "Convert your text between formats instantly in the browser. Paste any text into the input box "
+    "and the converted result appears as you type, ready to copy or download. Nothing is uploaded, "
+    "every conversion runs locally, and the tool works offline once the page has loaded. Use it to "
+    "prepare data for spreadsheets, clean up exported reports or check encodings before publishing."
+)
+OTHER_PROSE = (
+    "Calculate your body mass index from height and weight in metric or imperial units. The chart "
+    "shows which range the result falls in, from underweight to obese, and explains what each band "
+    "means for adults. Remember that the index ignores muscle mass, age and sex, so treat it as a "
+    "rough screening figure and talk to a doctor about anything that worries you."
+)
+
+
+def write_tool(root, tool, text):
+    tool_dir = root / "src" / "app" / "tools" / tool
+    tool_dir.mkdir(parents=True)
+    (tool_dir / "client.tsx").write_text(
+        "export default function Client() {\n"
+        f"  return (\n    <div>\n      <p>{text}</p>\n    </div>\n  )\n}}\n",
+        encoding="utf-8",
+    )
+
+
+def test_near_duplicate_pair_is_reported(tmp_path):
+    write_tool(tmp_path, "text-converter-a", PROSE)
+    # One sentence reworded: well above the threshold, but not identical
+    write_tool(tmp_path, "text-converter-b", PROSE.replace("Nothing is uploaded", "No data is sent anywhere"))
+    write_tool(tmp_path, "bmi-calculator", OTHER_PROSE)
+
+    report = find_duplicates(str(tmp_path), jobs=1)
+
+    assert report["tools"] == 3
+    assert [pair["tools"] for pair in report["pairs"]] == [["text-converter-a", "text-converter-b"]]
+    similarity = report["pairs"][0]["similarity"]
+    assert 0.5 <= similarity < 1.0
+    assert abs(report["pairs"][0]["estimate"] - similarity) < 0.2
+
+
+def test_distinct_pair_is_not_reported(tmp_path):
+    write_tool(tmp_path, "text-converter", PROSE)
+    write_tool(tmp_path, "bmi-calculator", OTHER_PROSE)
+    assert jaccard(shingles(PROSE), shingles(OTHER_PROSE)) < 0.1
+
+    report = find_duplicates(str(tmp_path), jobs=1)
+
+    assert report["tools"] == 2
+    assert report["pairs"] == []
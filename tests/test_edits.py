@@ -0,0 +1,97 @@
+"""
+Piece-table edit buffer
+"""
+
+import pytest
+
+from toolshub_codemod.edits import EditBuffer, EditConflict
+from toolshub_codemod.engine import Transform, apply_transforms
+
+TEXT = "0123456789"
+
+
+@pytest.mark.parametrize("first, second", [
+    ((2, 5), (4, 7)),
+    ((4, 7), (2, 5)),
+    ((2, 8), (4, 5)),
+    ((4, 5), (2, 8)),
+    ((3, 6), (3, 4)),
+    ((3, 6), (4, 4)),
+])
+def test_overlapping_edits_conflict(first, second):
+    buffer = EditBuffer(TEXT)
+    buffer.replace(*first, "x")
+    with pytest.raises(EditConflict):
+        buffer.replace(*second, "y")
+    assert buffer.text() == TEXT[:first[0]] + "x" + TEXT[first[1]:]
+
+
+def test_adjacent_edits_do_not_conflict():
+    buffer = EditBuffer(TEXT)
+    buffer.replace(2, 4, "a")
+    buffer.replace(4, 6, "b")
+    buffer.insert(6, "c")
+    buffer.insert(2, "d")
+    assert buffer.text() == "01adbc6789"
+
+
+def test_inserts_at_one_offset_keep_their_order():
+    buffer = EditBuffer(TEXT)
+    for text in ("a", "b", "c"):
+        buffer.insert(5, text)
+    buffer.insert(2, "z")
+    assert buffer.text() == "01z234abc56789"
+
+
+def test_insert_and_replace_at_one_offset_keep_their_order():
+    buffer = EditBuffer(TEXT)
+    buffer.replace(5, 8, "R")
+    buffer.insert(5, "I")
+    assert buffer.text() == "01234RI89"
+
+    buffer = EditBuffer(TEXT)
+    buffer.insert(5, "I")
+    buffer.replace(5, 8, "R")
+    assert buffer.text() == "01234IR89"
+
+
+def test_sub_uses_original_offsets_after_an_earlier_replace():
+    buffer = EditBuffer("foo bar foo baz")
+    buffer.replace(0, 3, "longer")
+    assert buffer.sub(r"ba(\w)", r"BA\1") == 2
+    assert buffer.text() == "longer BAr foo BAz"
+
+
+def test_sub_is_all_or_nothing():
+    buffer = EditBuffer("foo bar foo")
+    buffer.replace(9, 11, "XX")
+    with pytest.raises(EditConflict):
+        buffer.sub("foo", "F")
+    assert buffer.text() == "foo bar fXX"
+
+
+def test_rollback():
+    buffer = EditBuffer(TEXT)
+    buffer.insert(0, "a")
+    mark = buffer.mark()
+    buffer.replace(3, 4, "b")
+    assert buffer.edited_since(mark)
+    buffer.rollback(mark)
+    assert buffer.text() == "a" + TEXT
+
+
+def test_conflicting_transform_retries_on_the_edited_text():
+    def first(tool, buffer):
+        buffer.replace(0, 3, "one")
+
+    def second(tool, buffer):
+        buffer.sub("abc", "two")
+
+    transforms = [
+        Transform("first", "client.tsx", first, edits=True),
+        Transform("second", "client.tsx", second, edits=True),
+    ]
+    content, applied, errors = apply_transforms("tool", "abc abc", transforms)
+    assert errors == []
+    assert applied == ["first", "second"]
+    assert content == "one two"
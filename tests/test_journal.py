@@ -0,0 +1,57 @@
+"""
+Undo journal: append-only records read back in order
+"""
+
+import os
+
+from toolshub_codemod.journal import Journal, load_journal, undo_changes
+
+
+def commit(journal, path, text):
+    """Journal and then make one write, as WriteBatch.commit does"""
+    before = path.read_text(encoding="utf-8") if path.exists() else None
+    journal.record([(str(path), before, text)])
+    path.write_text(text, encoding="utf-8")
+
+
+def test_commits_append_without_rewriting(tmp_path):
+    journal = Journal(str(tmp_path), "run-1")
+    target = tmp_path / "client.tsx"
+    commit(journal, target, "one\n")
+    with open(journal.path, 'rb') as f:
+        first = f.read()
+    commit(journal, target, "one\ntwo\n")
+    commit(journal, tmp_path / "new.tsx", "created\n")
+    with open(journal.path, 'rb') as f:
+        assert f.read().startswith(first)
+
+    loaded = load_journal(str(tmp_path), "run-1")
+    assert loaded["run"] == "run-1"
+    assert [[entry["path"] for entry in c["files"]] for c in loaded["commits"]] == [
+        ["client.tsx"], ["client.tsx"], ["new.tsx"],
+    ]
+
+
+def test_undo_unwinds_every_commit(tmp_path):
+    target = tmp_path / "client.tsx"
+    target.write_text("original\n", encoding="utf-8")
+    journal = Journal(str(tmp_path), "run-1")
+    commit(journal, target, "original\nfirst\n")
+    commit(journal, target, "second\n")
+    commit(journal, tmp_path / "new.tsx", "created\n")
+
+    restore, _, conflicts = undo_changes(str(tmp_path), load_journal(str(tmp_path), "run-1"))
+    assert conflicts == {}
+    assert restore == {str(target): "original\n", str(tmp_path / "new.tsx"): None}
+
+
+def test_truncated_last_record_is_ignored(tmp_path):
+    journal = Journal(str(tmp_path), "run-1")
+    commit(journal, tmp_path / "client.tsx", "one\n")
+    size = os.path.getsize(journal.path)
+    commit(journal, tmp_path / "client.tsx", "two\n")
+    # A crash partway through appending the second commit
+    with open(journal.path, 'r+b') as f:
+        f.truncate(size + (os.path.getsize(journal.path) - size) // 2)
+
+    assert len(load_journal(str(tmp_path), "run-1")["commits"]) == 1
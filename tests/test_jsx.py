@@ -0,0 +1,109 @@
+"""
+TSX scanner: default export root and section insertion point
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+from toolshub_codemod.jsx import JsxError, class_strings, default_export_root, find_insertion_point
+
+DIV_PAGE = '''export default function Page() {
+  return (
+    <div className="page">
+      <div className="container">
+        <h1>Title</h1>
+        <div className="content">
+          <p>Body</p>
+        </div>
+      </div>
+    </div>
+  )
+}
+'''
+
+LAYOUT_PAGE = '''export default function Page() {
+  return (
+    <>
+      <ToolPageLayout title="Tool">
+        <p>Body</p>
+      </ToolPageLayout>
+    </>
+  )
+}
+'''
+
+
+def before_last(source, tag):
+    """Offset find_insertion_point should return: before the last closing tag's indentation"""
+    return source.rindex('\n', 0, source.rindex(tag))
+
+
+def test_div_chain():
+    assert find_insertion_point(DIV_PAGE, "div") == before_last(DIV_PAGE, "</div>\n      </div>")
+    assert find_insertion_point(DIV_PAGE) == find_insertion_point(DIV_PAGE, "div")
+    assert find_insertion_point(DIV_PAGE, "ToolPageLayout") is None
+
+
+def test_tool_page_layout_root():
+    expected = before_last(LAYOUT_PAGE, "</ToolPageLayout>")
+    assert find_insertion_point(LAYOUT_PAGE, "ToolPageLayout") == expected
+    assert find_insertion_point(LAYOUT_PAGE) == expected
+    assert find_insertion_point(LAYOUT_PAGE, "div") is None
+
+
+def test_closing_tags_in_strings_templates_and_comments():
+    source = DIV_PAGE.replace('  return (', '''  const html = "</div></div>"
+  const other = '</div>'
+  const tpl = `</div> ${"</div>"} </div>`
+  // </div></div></div>
+  /* </div>
+     </div> */
+  const re = /<\\/div>/g
+  return (''').replace('<p>Body</p>', '<p>{"</div>"} {`</div>`} {/* </div> */}</p>')
+    assert find_insertion_point(source, "div") == before_last(source, "</div>\n      </div>")
+
+
+@pytest.mark.parametrize("generic", [
+    "<T,>(x: T) => x",
+    "<T extends string>(x: T): T => x",
+    "<T, U>(x: T, y: U) => y",
+])
+def test_generic_arrow_functions(generic):
+    source = f"const outside = {generic}\n" + DIV_PAGE.replace(
+        '  return (', f"  const inside = {generic}\n  const el = <span>{{inside(1)}}</span>\n  return (",
+    )
+    root = default_export_root(source)
+    assert root.name == "div"
+    assert find_insertion_point(source, "div") == before_last(source, "</div>\n      </div>")
+
+
+def test_type_arguments_are_not_jsx():
+    source = DIV_PAGE.replace('  return (', '  const [s] = useState<string[]>([])\n  return (')
+    assert find_insertion_point(source, "div") == before_last(source, "</div>\n      </div>")
+
+
+def test_no_default_export():
+    source = DIV_PAGE.replace("export default function", "export function")
+    with pytest.raises(JsxError):
+        default_export_root(source)
+    assert find_insertion_point(source) is None
+
+
+def test_class_strings():
+    source = (
+        'export default function P() {\n'
+        '  return <div className="a b"><p className={cn("c", x && `d ${y}`)} /></div>\n'
+        '}\n'
+    )
+    assert sorted(source[start:end] for start, end in class_strings(source)) == ["a b", "c", "d "]
+
+
+def test_scanner_benchmark_runs_without_warnings():
+    result = subprocess.run(
+        [sys.executable, "-W", "error", "-m", "toolshub_codemod.scanbench", "--repeat", "1", "--whitespace", "10"],
+        capture_output=True, text=True,
+    )
+    assert result.returncode == 0, result.stderr
+    assert "whitespace-10.tsx" in result.stdout
@@ -0,0 +1,40 @@
+"""
+Rendering tool pages from the metadata manifest
+"""
+
+import os
+
+import pytest
+
+from toolshub_codemod.engine import walk_tools
+from toolshub_codemod.pages import PAGE_STYLE, page_style, read_page_metadata, render_page
+from toolshub_codemod.roots import tools_path
+
+REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+TOOLS_DIR = tools_path(REPO)
+
+
+def read_page(tool):
+    with open(os.path.join(TOOLS_DIR, tool, "page.tsx"), 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+# Pages the manifest covers, hand-written in several formats
+MANIFEST_PAGES = [tool for tool in walk_tools(TOOLS_DIR) if read_page_metadata(read_page(tool))]
+
+
+@pytest.mark.parametrize("tool", MANIFEST_PAGES)
+def test_rendering_an_existing_page_changes_nothing(tool):
+    content = read_page(tool)
+    assert render_page(tool, read_page_metadata(content), page_style(content)) == content
+
+
+def test_new_page_uses_the_shared_format():
+    meta = {"toolName": "Word Counter", "description": "Count words.", "category": "Text",
+            "keywords": ["a", "b"]}
+    content = render_page("word-counter", meta, page_style(''))
+    assert page_style('') == PAGE_STYLE
+    assert content.startswith('import { generateToolMetadata } from "@/components/seo/tool-seo"\n')
+    assert '  toolDescription: "Count words.",\n' in content
+    assert '    "b"\n  ],\n  toolPath: "/tools/word-counter"\n})\n' in content
+    assert content.endswith("  return <WordCounterClient />\n}\n")
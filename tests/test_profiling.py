@@ -0,0 +1,37 @@
+"""
+Profiler counters of engine runs
+"""
+
+import os
+import shutil
+
+from toolshub_codemod.engine import run
+from toolshub_codemod.profiling import Profiler
+from toolshub_codemod.writeback import DiffSink, WriteBatch
+
+REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def tools_dir(tmp_path):
+    tools = tmp_path / "src" / "app" / "tools"
+    shutil.copytree(os.path.join(REPO, "src", "app", "tools", "word-counter"), tools / "word-counter")
+    return str(tools)
+
+
+def profile(tools, batch):
+    profiler = Profiler()
+    results = list(run(tools, batch=batch, profiler=profiler))
+    return profiler.counters, results
+
+
+def test_dry_run_writes_no_bytes(tmp_path, capsys):
+    counters, _ = profile(tools_dir(tmp_path), DiffSink())
+    assert counters.get("files changed")
+    assert "bytes written" not in counters
+
+
+def test_bytes_written_on_commit(tmp_path):
+    tools = tools_dir(tmp_path)
+    counters, results = profile(tools, WriteBatch())
+    changed = {result.path for result in results if result.applied}
+    assert counters["bytes written"] == sum(os.path.getsize(path) for path in changed)
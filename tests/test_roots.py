@@ -0,0 +1,38 @@
+"""
+Runs over several roots
+"""
+
+import os
+import shutil
+
+from toolshub_codemod import cli
+
+REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def checkout(path):
+    shutil.copytree(
+        os.path.join(REPO, "src", "app", "tools", "word-counter"), path / "src" / "app" / "tools" / "word-counter",
+    )
+    return path
+
+
+def test_dry_run_headers_name_their_root(tmp_path, capsys):
+    roots = [checkout(tmp_path / "site-a"), checkout(tmp_path / "site-b")]
+    args = ["run", "--dry-run", "--no-cache"]
+    for root in roots:
+        args += ["--root", str(root)]
+
+    assert cli.main(args) == 1
+
+    headers = [line for line in capsys.readouterr().out.splitlines() if line.startswith("+++ ")]
+    assert headers
+    assert len(set(headers)) == len(headers)
+    assert {header.split('/')[1] for header in headers} == {"site-a", "site-b"}
+
+
+def test_single_root_headers_stay_relative_to_it(tmp_path, capsys):
+    root = checkout(tmp_path / "site-a")
+    assert cli.main(["run", "--dry-run", "--no-cache", "--root", str(root)]) == 1
+    headers = [line for line in capsys.readouterr().out.splitlines() if line.startswith("+++ ")]
+    assert headers == ["+++ b/src/app/tools/word-counter/client.tsx"]
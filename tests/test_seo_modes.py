@@ -0,0 +1,81 @@
+"""
+SEO sections across --seo-mode runs
+"""
+
+import os
+import shutil
+
+import pytest
+
+from toolshub_codemod import cli
+from toolshub_codemod.sections import SEO_COMPONENT_FILE, SEO_MARKER, SEO_SLOT
+from toolshub_codemod.transforms import SEO_CONTENT, _load_script
+
+REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+TOOLS = ("hash-generator", "word-counter")
+
+
+@pytest.fixture
+def root(tmp_path):
+    """A scratch root holding a couple of real tools"""
+    for tool in TOOLS:
+        shutil.copytree(
+            os.path.join(REPO, "src", "app", "tools", tool), tmp_path / "src" / "app" / "tools" / tool,
+        )
+    return tmp_path
+
+
+def read(root, tool, filename):
+    path = root / "src" / "app" / "tools" / tool / filename
+    return path.read_text(encoding="utf-8") if path.exists() else ""
+
+
+def snapshot(root):
+    return {
+        (tool, name): read(root, tool, name)
+        for tool in TOOLS
+        for name in ("client.tsx", "page.tsx", SEO_COMPONENT_FILE)
+    }
+
+
+def run(root, *args):
+    return cli.main(["run", "--root", str(root), "--no-cache", *args])
+
+
+def test_client_run_after_server_run_keeps_one_section(root):
+    assert run(root, "--seo-mode", "server") == 0
+    after_server = snapshot(root)
+
+    assert run(root) == 0
+
+    assert snapshot(root) == after_server
+    for tool in TOOLS:
+        client = read(root, tool, "client.tsx")
+        assert SEO_SLOT in client
+        assert SEO_MARKER not in client
+        assert read(root, tool, SEO_COMPONENT_FILE).count(SEO_MARKER) == 1
+
+
+def test_phase_script_skips_server_mode_tool(root):
+    assert run(root, "--seo-mode", "server") == 0
+    after_server = snapshot(root)
+
+    phase4 = _load_script("add-seo-phase4.py")
+    assert phase4.main(4, phase4.__doc__, ["--root", str(root), "--no-cache"]) == 0
+
+    assert snapshot(root) == after_server
+
+
+def test_hand_written_about_section_is_left_alone(root):
+    client = root / "src" / "app" / "tools" / "word-counter" / "client.tsx"
+    title = SEO_CONTENT["word-counter"]["title"]
+    source = client.read_text(encoding="utf-8").replace(
+        "      </ToolPageLayout>", f"        <h2>About {title}</h2>\n      </ToolPageLayout>", 1,
+    )
+    client.write_text(source, encoding="utf-8")
+
+    assert run(root, "--only", "seo-content") == 0
+    phase5 = _load_script("add-seo-phase5.py")
+    assert phase5.main(5, phase5.__doc__, ["--root", str(root), "--no-cache"]) == 0
+
+    assert client.read_text(encoding="utf-8") == source
@@ -0,0 +1,62 @@
+"""
+Tailwind source manifest coverage
+"""
+
+import os
+
+from toolshub_codemod.check import tailwind_uncovered
+from toolshub_codemod.tailwind import (
+    BLOCK_BEGIN, BLOCK_END, glob_regex, render_block, source_globs, uncovered_files, update_globals,
+)
+
+NARROW = f'''@import "tailwindcss" source(none);
+
+{BLOCK_BEGIN}
+@source "./**/*.{{ts,tsx}}";
+@source "../components/**/*.tsx";
+{BLOCK_END}
+'''
+
+
+def test_glob_regex():
+    pattern = glob_regex("src/**/*.{ts,tsx}")
+    assert pattern.fullmatch("src/app/page.tsx")
+    assert pattern.fullmatch("src/layout.ts")
+    assert not pattern.fullmatch("src/app/page.jsx")
+    assert not pattern.fullmatch("docs/page.tsx")
+    assert glob_regex("src/lib").fullmatch("src/lib/utils.ts")
+
+
+def test_narrow_globs_miss_new_dirs_and_extensions():
+    names = [
+        os.path.join("src", "app", "page.tsx"),
+        os.path.join("src", "components", "Card.tsx"),
+        os.path.join("src", "components", "Legacy.jsx"),
+        os.path.join("src", "hooks", "useTheme.ts"),
+    ]
+    assert uncovered_files(NARROW, names) == names[2:]
+
+
+def test_automatic_detection_covers_everything():
+    css = '@import "tailwindcss";\n'
+    assert uncovered_files(css, [os.path.join("src", "hooks", "useTheme.ts")]) == []
+
+
+def test_excluded_glob():
+    css = NARROW + '@source not "./legacy";\n'
+    assert uncovered_files(css, [os.path.join("src", "app", "legacy", "old.tsx")]) == [
+        os.path.join("src", "app", "legacy", "old.tsx"),
+    ]
+
+
+def test_generated_block_covers_src(tmp_path):
+    app = tmp_path / "src" / "app"
+    app.mkdir(parents=True)
+    (tmp_path / "src" / "hooks").mkdir()
+    (tmp_path / "src" / "hooks" / "useTheme.jsx").write_text('export const x = "p-4"\n')
+    (app / "globals.css").write_text(NARROW)
+    assert tailwind_uncovered(str(tmp_path)) == [os.path.join("src", "hooks", "useTheme.jsx")]
+
+    css = update_globals(NARROW, render_block(source_globs(str(tmp_path)), []))
+    (app / "globals.css").write_text(css)
+    assert tailwind_uncovered(str(tmp_path)) == []
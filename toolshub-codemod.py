@@ -0,0 +1,11 @@
+#!/usr/bin/env python3
+"""
+Run the toolshub codemod pipeline (see toolshub_codemod/)
+"""
+
+import sys
+
+from toolshub_codemod.cli import main
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,18 @@
+"""
+toolshub-codemod: single-pass codemods for the src/app/tools tree
+"""
+
+from .edits import EditBuffer, EditConflict
+from .engine import (
+    TOOLS_DIR,
+    FileResult,
+    Transform,
+    TransformError,
+    apply_transforms,
+    get_transforms,
+    register,
+    run,
+    to_pascal_case,
+    walk_tools,
+)
+from . import transforms  # noqa: F401  (registers the built-in pipeline)
@@ -0,0 +1,214 @@
+"""
+Benchmark the codemod pipeline over synthetic tool trees
+
+    python3 -m toolshub_codemod.bench [--sizes 50,500,5000] [--output FILE] [--compare FILE]
+
+Each tree is built in a temp directory from real pages (emoji-translator
+and ascii-to-text by default), put back into their pre-migration state so
+every transform has work to do: client.tsx exports XxxPage, and page.tsx
+imports and renders the name of the page it was copied from. Every tool
+gets an SEO content record, so seo-content injects a section everywhere.
+
+Each script's transform, and the whole pipeline, is timed end to end
+through engine.run() and again with a Profiler attached, for the walk,
+read, transform and write phases. The best of --repeat runs is kept and
+results are saved as JSON; --compare prints the end-to-end change
+against an earlier results file.
+"""
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+from . import engine
+from .content import INDEX_FILE
+from .engine import TOOLS_DIR, get_transforms, to_pascal_case
+from .profiling import Profiler
+from .transforms import SEO_CONTENT
+
+DEFAULT_SIZES = (50, 500, 5000)
+DEFAULT_TEMPLATES = ("emoji-translator", "ascii-to-text")
+DEFAULT_OUTPUT = "toolshub-codemod-bench.json"
+# A record with every list filled, copied for each synthetic tool
+SEO_RECORD = "word-counter"
+
+# Script -> the transforms it runs, plus the whole pipeline in one sweep.
+# The add-seo-* scripts wrap seo-content with their own phase filtering and
+# reporting, so that row times the transform alone
+SCRIPTS = {
+    "update-client-exports.py": ["client-exports"],
+    "seo-content (engine)": ["seo-content"],
+    "fix-imports.py": ["fix-imports"],
+    "fix-page-functions.py": ["fix-page-functions"],
+    "toolshub-codemod run": None,
+}
+
+PHASES = ("walk", "read", "transform", "write")
+
+
+def build_tree(root, size, templates=DEFAULT_TEMPLATES, tools_dir=TOOLS_DIR):
+    """Write a synthetic project with size tools under root; returns (tools dir, content dir)"""
+    sources = {}
+    for template in templates:
+        pages = {}
+        for filename in ("client.tsx", "page.tsx"):
+            with open(os.path.join(tools_dir, template, filename), 'r', encoding='utf-8') as f:
+                pages[filename] = f.read()
+        sources[template] = pages
+    with open(os.path.join(SEO_CONTENT.content_dir, f"{SEO_RECORD}.json"), 'r', encoding='utf-8') as f:
+        record = f.read()
+
+    synthetic_tools = os.path.join(root, "src", "app", "tools")
+    content_dir = os.path.join(root, "content", "seo")
+    os.makedirs(content_dir)
+    index = {}
+    for i in range(size):
+        template = templates[i % len(templates)]
+        tool = f"{template}-{i:05d}"
+        tool_dir = os.path.join(synthetic_tools, tool)
+        os.makedirs(tool_dir)
+
+        # Undo the client export rename so client-exports has work to do
+        client = sources[template]["client.tsx"].replace(
+            f"export default function {to_pascal_case(template)}Client()",
+            f"export default function {to_pascal_case(tool)}Page()",
+        )
+        with open(os.path.join(tool_dir, "client.tsx"), 'w', encoding='utf-8') as f:
+            f.write(client)
+        # page.tsx still names the template's components, which the fix-* transforms correct
+        with open(os.path.join(tool_dir, "page.tsx"), 'w', encoding='utf-8') as f:
+            f.write(sources[template]["page.tsx"])
+
+        with open(os.path.join(content_dir, f"{tool}.json"), 'w', encoding='utf-8') as f:
+            f.write(record)
+        index[tool] = 5
+
+    with open(os.path.join(content_dir, INDEX_FILE), 'w', encoding='utf-8') as f:
+        json.dump(index, f, indent=2)
+    return synthetic_tools, content_dir
+
+
+def time_end_to_end(tools_dir, transforms):
+    """Wall time of one engine.run() sweep and the number of files it changed"""
+    t0 = time.perf_counter()
+    changed = sum(1 for result in engine.run(tools_dir, transforms) if result.applied)
+    return time.perf_counter() - t0, changed
+
+
+def time_phases(tools_dir, transforms):
+    """Phase and per-transform timers from a profiled engine.run() sweep"""
+    profiler = Profiler()
+    for _ in engine.run(tools_dir, transforms, profiler=profiler):
+        pass
+    phases = {phase: profiler.timers.get(phase, [0.0])[0] for phase in PHASES}
+    per_transform = {t.name: profiler.timers.get(f"transform/{t.name}", [0.0])[0] for t in transforms}
+    return phases, per_transform
+
+
+def bench_size(size, repeat, templates):
+    """Benchmark every script against a fresh copy of a size-tool tree"""
+    rows = []
+    with tempfile.TemporaryDirectory(prefix=f"toolshub-bench-{size}-") as tmp:
+        pristine = os.path.join(tmp, "pristine")
+        _, content_dir = build_tree(pristine, size, templates)
+        work = os.path.join(tmp, "work")
+
+        original_dir = SEO_CONTENT.content_dir
+        SEO_CONTENT.content_dir = content_dir
+        SEO_CONTENT.invalidate()
+        try:
+            for script, names in SCRIPTS.items():
+                transforms = get_transforms(names)
+                row = {"size": size, "script": script, "transforms": [t.name for t in transforms]}
+                end_to_end = []
+                phased = []
+                for _ in range(repeat):
+                    for measure, samples in ((time_end_to_end, end_to_end), (time_phases, phased)):
+                        shutil.rmtree(work, ignore_errors=True)
+                        shutil.copytree(os.path.join(pristine, "src"), os.path.join(work, "src"))
+                        # Records stay loaded between runs, as in a watch session; drop them
+                        SEO_CONTENT.invalidate()
+                        samples.append(measure(os.path.join(work, "src", "app", "tools"), transforms))
+                row["end_to_end_s"], row["files_changed"] = min(end_to_end)
+                row["phases_s"], row["transforms_s"] = min(phased, key=lambda sample: sum(sample[0].values()))
+                row["per_tool_ms"] = row["end_to_end_s"] * 1000 / size
+                rows.append(row)
+        finally:
+            SEO_CONTENT.content_dir = original_dir
+            SEO_CONTENT.invalidate()
+    return rows
+
+
+def git_revision():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def print_rows(rows, baseline=None):
+    """Print a results table, with the change against baseline rows if given"""
+    previous = {(r["size"], r["script"]): r for r in baseline or []}
+    print(f"{'tools':>6}  {'script':<26} {'total s':>8} {'ms/tool':>8}  "
+          + ' '.join(f"{phase:>9}" for phase in PHASES)
+          + ("  vs baseline" if baseline else ""))
+    for row in rows:
+        line = (f"{row['size']:>6}  {row['script']:<26} {row['end_to_end_s']:>8.3f} {row['per_tool_ms']:>8.3f}  "
+                + ' '.join(f"{row['phases_s'][phase]:>9.3f}" for phase in PHASES))
+        before = previous.get((row["size"], row["script"]))
+        if before:
+            change = (row["end_to_end_s"] / before["end_to_end_s"] - 1) * 100
+            line += f"  {change:+.1f}%"
+        print(line)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the codemod pipeline over synthetic tool trees")
+    parser.add_argument("--sizes", default=','.join(map(str, DEFAULT_SIZES)),
+                        help="comma-separated tree sizes (default: %(default)s)")
+    parser.add_argument("--templates", default=','.join(DEFAULT_TEMPLATES),
+                        help="tools whose pages are copied into the trees (default: %(default)s)")
+    parser.add_argument("--repeat", type=int, default=1, help="runs per measurement, best kept (default: 1)")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT, help="JSON results file (default: %(default)s)")
+    parser.add_argument("--compare", metavar="FILE", help="earlier results to compare against")
+    args = parser.parse_args(argv)
+
+    sizes = [int(size) for size in args.sizes.split(',')]
+    templates = tuple(args.templates.split(','))
+    baseline = None
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)["results"]
+
+    rows = []
+    for size in sizes:
+        print(f"Benchmarking {size} tools...", file=sys.stderr)
+        rows.extend(bench_size(size, args.repeat, templates))
+
+    print_rows(rows, baseline)
+    results = {
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "revision": git_revision(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "repeat": args.repeat,
+        "templates": list(templates),
+        "results": rows,
+    }
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2)
+    print(f"\n✓ Results written to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
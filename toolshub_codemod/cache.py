@@ -0,0 +1,99 @@
+"""
+Persistent content-hash cache for incremental codemod runs
+
+Each entry is keyed by file path and records the source hash, the hash of
+the config that produced it and the transform version. A file whose size
+and mtime still match its entry is known to be unchanged and can be
+skipped without being opened.
+"""
+
+import hashlib
+import json
+import os
+
+CACHE_FILE = ".toolshub-codemod-cache.json"
+CACHE_FORMAT = 1
+
+
+def hash_text(text):
+    """sha256 of a str"""
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def hash_config(config):
+    """Stable hash of a tool config (tuples and lists hash the same)"""
+    return hash_text(json.dumps(config, sort_keys=True, ensure_ascii=False))
+
+
+def add_cache_argument(parser):
+    """Add the shared --no-cache option to a script's argument parser"""
+    parser.add_argument(
+        "--no-cache", dest="use_cache", action="store_false",
+        help=f"ignore and do not update {CACHE_FILE}",
+    )
+
+
+class ContentCache:
+    """Path -> {source, config, version, size, mtime_ns} map persisted as JSON"""
+
+    def __init__(self, path=CACHE_FILE):
+        self.path = path
+        self.entries = {}
+        self.dirty = False
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get("format") == CACHE_FORMAT:
+            self.entries = data.get("entries", {})
+
+    def is_fresh(self, file_path, config_hash, version):
+        """True if file_path is untouched since it was recorded with this config and version"""
+        entry = self.entries.get(file_path)
+        if entry is None or entry["config"] != config_hash or entry["version"] != version:
+            return False
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            return False
+        return entry["size"] == st.st_size and entry["mtime_ns"] == st.st_mtime_ns
+
+    def matches_source(self, file_path, content, config_hash, version):
+        """True if already-read content is what was recorded, even though its stat changed"""
+        entry = self.entries.get(file_path)
+        return (
+            entry is not None
+            and entry["config"] == config_hash
+            and entry["version"] == version
+            and entry["source"] == hash_text(content)
+        )
+
+    def record(self, file_path, config_hash, version, content=None):
+        """Remember file_path's current state; reads the file if content isn't given"""
+        if content is None:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                content = f.read()
+        st = os.stat(file_path)
+        self.entries[file_path] = {
+            "source": hash_text(content),
+            "config": config_hash,
+            "version": version,
+            "size": st.st_size,
+            "mtime_ns": st.st_mtime_ns,
+        }
+        self.dirty = True
+
+    def forget(self, file_path):
+        if self.entries.pop(file_path, None) is not None:
+            self.dirty = True
+
+    def save(self):
+        """Write the cache back if anything changed"""
+        if not self.dirty:
+            return
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({"format": CACHE_FORMAT, "entries": self.entries}, f, indent=1, sort_keys=True)
+        os.replace(tmp_path, self.path)
+        self.dirty = False
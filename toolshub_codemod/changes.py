@@ -0,0 +1,147 @@
+"""
+Git-aware change detection for --since
+
+Asks git which files changed since a ref (committed, staged, unstaged or
+untracked) and maps them to the tools worth scheduling: tools with a
+changed file under src/app/tools/<tool>/, tools whose content record
+changed, tools that were added to or moved between phases in index.json,
+tools whose entry in the page metadata manifest changed, and every tool
+of a phase whose script (and so SEO_TEMPLATE) changed.
+"""
+
+import functools
+import json
+import os
+import subprocess
+
+from .content import CONTENT_DIR, INDEX_FILE, load_index
+from .pages import PAGES_FILE
+from .roots import tools_path
+from .transforms import SCRIPTS_DIR, SEO_PHASES
+
+
+class GitError(Exception):
+    """Raised when git can't answer (not a checkout, unknown ref)"""
+
+
+def git(directory, *args):
+    """stdout of a git command run in directory"""
+    try:
+        proc = subprocess.run(
+            ["git", "-C", directory, *args], capture_output=True, text=True, check=True
+        )
+    except FileNotFoundError:
+        raise GitError("git is not installed")
+    except subprocess.CalledProcessError as e:
+        raise GitError(e.stderr.strip() or f"git {args[0]} failed")
+    return proc.stdout
+
+
+def toplevel(directory):
+    """The work tree directory belongs to, or None outside a git checkout"""
+    try:
+        return git(directory, "rev-parse", "--show-toplevel").strip()
+    except GitError:
+        return None
+
+
+@functools.lru_cache(maxsize=None)
+def changed_files(top, ref):
+    """Absolute paths in the work tree at top that differ from ref, untracked files included"""
+    paths = set()
+    # --no-renames lists both sides of a rename
+    for name in git(top, "diff", "--name-only", "--no-renames", "-z", ref, "--").split('\0'):
+        if name:
+            paths.add(os.path.join(top, name))
+    status = git(top, "status", "--porcelain", "-z", "--no-renames", "--untracked-files=all")
+    for entry in status.split('\0'):
+        # "XY path", with paths relative to the top of the work tree
+        if entry:
+            paths.add(os.path.join(top, entry[3:]))
+    return frozenset(paths)
+
+
+def _repo_changes(directory, ref):
+    top = toplevel(directory)
+    return (top, changed_files(top, ref)) if top else (None, frozenset())
+
+
+def _under(path, directory):
+    rel = os.path.relpath(path, directory)
+    return None if rel == os.curdir or rel.startswith(os.pardir) else rel
+
+
+def _entry_changes(top, ref, changed, path):
+    """Keys of the JSON object at path whose value differs at ref (all of them if it didn't exist)"""
+    if path not in changed or not os.path.exists(path):
+        return set()
+    with open(path, 'r', encoding='utf-8') as f:
+        current = json.load(f)
+    try:
+        old = json.loads(git(top, "show", f"{ref}:{os.path.relpath(path, top)}"))
+    except (GitError, ValueError):
+        old = {}
+    return {key for key, value in current.items() if old.get(key) != value}
+
+
+def changed_tools(root, ref, content_dir=CONTENT_DIR):
+    """Names of the tool directories under root worth re-running since ref"""
+    root_top, root_changed = _repo_changes(root, ref)
+    if root_top is None:
+        raise GitError(f"{root} is not a git checkout")
+    tools = set()
+    tools_dir = os.path.realpath(tools_path(root))
+    for path in root_changed:
+        rel = _under(os.path.realpath(path), tools_dir)
+        if rel:
+            tools.add(rel.split(os.sep)[0])
+
+    # The content store and phase scripts may live in another checkout than root
+    content_top, content_changed = _repo_changes(content_dir, ref)
+    if content_top is not None:
+        content_dir = os.path.realpath(content_dir)
+        for path in content_changed:
+            name = _under(os.path.realpath(path), content_dir)
+            if name and name != INDEX_FILE and name.endswith(".json") and os.sep not in name:
+                tools.add(name[:-len(".json")])
+        tools |= _entry_changes(content_top, ref, content_changed, os.path.join(content_dir, INDEX_FILE))
+
+    # Entries in the page metadata manifest
+    pages_top, pages_changed = _repo_changes(os.path.dirname(PAGES_FILE), ref)
+    if pages_top is not None:
+        tools |= _entry_changes(pages_top, ref, pages_changed, os.path.realpath(PAGES_FILE))
+
+    _, script_changed = _repo_changes(SCRIPTS_DIR, ref)
+    changed_phases = {
+        phase for phase, script in SEO_PHASES.items()
+        if os.path.realpath(os.path.join(SCRIPTS_DIR, script)) in script_changed
+    }
+    if changed_phases:
+        tools |= {tool for tool, phase in load_index(content_dir).items() if phase in changed_phases}
+
+    # Deleted tools have nothing left to rewrite
+    return {tool for tool in tools if os.path.isdir(os.path.join(tools_dir, tool))}
+
+
+def tools_since(roots, ref):
+    """{root: changed tools} for --since, or None to run everything"""
+    if ref is None:
+        return None
+    return {root: changed_tools(root, ref) for root in roots}
+
+
+def since_from_args(parser, args, roots):
+    """tools_since(roots, args.since), reporting git failures as usage errors"""
+    try:
+        return tools_since(roots, args.since)
+    except GitError as e:
+        parser.error(f"--since: {e}")
+
+
+def add_since_argument(parser):
+    """Add the shared --since option to a script's argument parser"""
+    parser.add_argument(
+        "--since", metavar="REF",
+        help="only process tools changed since a git ref, committed or not, "
+             "or whose SEO content or phase changed",
+    )
@@ -0,0 +1,169 @@
+"""
+Read-only consistency check of the tools tree
+
+Reports what the fix-* scripts and the SEO phases would otherwise find by
+rewriting files: client and page exports not named after the tool, a
+page.tsx that doesn't import and render XxxClient, SEO sections that don't
+match the content store, tool directories missing from ALL_TOOLS in
+src/lib/constants.ts (or ALL_TOOLS entries with no directory), and source
+files under src/ that the @source globs in globals.css don't reach.
+
+Files are mapped with mmap and searched for fixed byte strings, on a
+thread pool across tool directories; nothing is decoded or written.
+"""
+
+import mmap
+import os
+import re
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+from .engine import to_pascal_case, walk_tools
+from .roots import tools_path
+from .sections import SEO_COMPONENT_FILE, SEO_MARKER, SEO_SLOT
+from .tailwind import GLOBALS_CSS, source_files, uncovered_files
+from .transforms import SEO_CONTENT
+
+CONSTANTS_FILE = os.path.join("src", "lib", "constants.ts")
+
+Problem = namedtuple("Problem", ["tool", "check", "file", "message"])
+
+_ALL_TOOLS_RE = re.compile(rb'export const ALL_TOOLS\b[^=]*=\s*\[')
+_HREF_RE = re.compile(rb'href:\s*["\']/tools/([^"\'/]+)/?["\']')
+
+
+class MappedFile:
+    """A file's bytes through mmap, or an empty buffer for missing and empty files"""
+
+    def __init__(self, path):
+        self.exists = os.path.exists(path)
+        self.data = None
+        if self.exists and os.path.getsize(path):
+            with open(path, 'rb') as f:
+                self.data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def __contains__(self, needle):
+        return self.data is not None and self.data.find(needle) != -1
+
+    def close(self):
+        if self.data is not None:
+            self.data.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+
+def listed_tools(root):
+    """Tool keys linked from ALL_TOOLS in root's constants.ts, or None if it can't be found"""
+    with MappedFile(os.path.join(root, CONSTANTS_FILE)) as constants:
+        data = constants.data
+        if data is None:
+            return None
+        match = _ALL_TOOLS_RE.search(data)
+        if match is None:
+            return None
+        # The array ends at the first ] back at column 0
+        end = data.find(b'\n]', match.end())
+        if end == -1:
+            end = len(data)
+        return {m.group(1).decode('utf-8') for m in _HREF_RE.finditer(data, match.end(), end)}
+
+
+def check_tool(tools_dir, tool, has_config):
+    """Problems with one tool directory"""
+    class_name = to_pascal_case(tool)
+    client_name = f"{class_name}Client".encode()
+    page_export = f"export default function {class_name}Page(".encode()
+    tool_dir = os.path.join(tools_dir, tool)
+    problems = []
+    with MappedFile(os.path.join(tool_dir, "client.tsx")) as client, \
+            MappedFile(os.path.join(tool_dir, "page.tsx")) as page:
+        if not client.exists:
+            # A page.tsx that is the tool itself, not a wrapper, needs no client
+            if page_export not in page or b'from "./client"' in page:
+                problems.append(Problem(tool, "layout", "client.tsx", "no client.tsx"))
+        elif b"export default function " + client_name + b"(" not in client:
+            problems.append(Problem(tool, "client-export", "client.tsx",
+                                    f"default export is not {class_name}Client"))
+
+        if not page.exists:
+            problems.append(Problem(tool, "layout", "page.tsx", "no page.tsx"))
+        elif not client.exists:
+            # page.tsx is the whole tool; there is no client to import
+            if page_export not in page:
+                problems.append(Problem(tool, "page-export", "page.tsx",
+                                        f"default export is not {class_name}Page"))
+        else:
+            if page_export not in page:
+                problems.append(Problem(tool, "page-export", "page.tsx",
+                                        f"default export is not {class_name}Page"))
+            if b"import " + client_name + b' from "./client"' not in page:
+                problems.append(Problem(tool, "client-import", "page.tsx",
+                                        f'no import {class_name}Client from "./client"'))
+            # Server SEO mode hands the section over as a prop
+            server_return = f"return <{class_name}Client seoContent={{<{class_name}SeoContent />}} />"
+            if b"return <" + client_name + b" />" not in page and server_return.encode() not in page:
+                problems.append(Problem(tool, "client-return", "page.tsx",
+                                        f"does not return <{class_name}Client />"))
+
+        marker = SEO_MARKER.encode()
+        has_section = marker in client
+        if not has_section and SEO_SLOT.encode() in client:
+            with MappedFile(os.path.join(tool_dir, SEO_COMPONENT_FILE)) as component:
+                has_section = marker in component
+        if has_config and not has_section and client.exists:
+            problems.append(Problem(tool, "seo-section", "client.tsx",
+                                    "has an SEO content record but no SEO section"))
+        elif has_section and not has_config:
+            problems.append(Problem(tool, "seo-section", "client.tsx",
+                                    "has an SEO section but no SEO content record"))
+    return problems
+
+
+def tailwind_uncovered(root):
+    """Source files under root's src/ outside the committed @source globs"""
+    try:
+        with open(os.path.join(root, GLOBALS_CSS), 'r', encoding='utf-8') as f:
+            css = f.read()
+    except FileNotFoundError:
+        return []
+    return uncovered_files(css, [os.path.relpath(path, root) for path in source_files(root)])
+
+
+def check_root(root, jobs=None):
+    """Check every tool under root; returns a report dict"""
+    start = time.perf_counter()
+    tools_dir = tools_path(root)
+    tools = list(walk_tools(tools_dir))
+    configs = SEO_CONTENT.index()
+    with ThreadPoolExecutor(max_workers=jobs or min(32, (os.cpu_count() or 1) + 4)) as executor:
+        results = executor.map(lambda tool: check_tool(tools_dir, tool, tool in configs), tools)
+        problems = [problem for tool_problems in results for problem in tool_problems]
+
+    listed = listed_tools(root)
+    if listed is None:
+        problems.append(Problem(None, "all-tools", CONSTANTS_FILE, "no ALL_TOOLS array found"))
+    else:
+        problems += [
+            Problem(tool, "all-tools", CONSTANTS_FILE, "directory is not listed in ALL_TOOLS")
+            for tool in tools if tool not in listed
+        ]
+        problems += [
+            Problem(tool, "all-tools", CONSTANTS_FILE, "listed in ALL_TOOLS but has no directory")
+            for tool in sorted(listed - set(tools))
+        ]
+    problems += [
+        Problem(None, "tailwind", name, f"no @source glob in {GLOBALS_CSS} covers it")
+        for name in tailwind_uncovered(root)
+    ]
+    return {
+        "root": root,
+        "tools": len(tools),
+        "problems": [problem._asdict() for problem in problems],
+        "elapsed_s": round(time.perf_counter() - start, 4),
+    }
@@ -0,0 +1,238 @@
+"""
+Table-driven Tailwind class rewriting
+
+A rewrite table maps class patterns to replacements, e.g.
+
+    "bg-gradient-to-r from-blue-* to-purple-*": "bg-blue-600",
+    "from-{color}-{shade}/{alpha} to-*": "bg-{color}-{shade} opacity-{alpha}",
+
+A pattern is a run of whole class tokens. In a token, * matches anything
+and {name} matches one segment (no -, / or :) that the replacement can
+reuse. All patterns are compiled into one token trie, so each class list
+is read once, left to right: at every token the trie offers every pattern
+that could start there, the longest match wins (the earlier table entry
+on a tie), and scanning carries on after it. Replacements are not
+rescanned.
+"""
+
+import json
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+
+from .edits import EditBuffer
+from .jsx import JsxError, class_strings
+from .writeback import Change
+
+REWRITES_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "content", "class-rewrites"
+)
+SOURCE_EXTENSIONS = (".tsx", ".jsx")
+
+_TOKEN_RE = re.compile(r'\S+')
+_PLACEHOLDER_RE = re.compile(r'\{(\w+)\}|\*')
+
+
+class RewriteTableError(Exception):
+    """Raised for a rewrite table that can't be compiled"""
+
+
+class _Node:
+    __slots__ = ("exact", "globs", "rule")
+
+    def __init__(self):
+        # token -> node, and (literal prefix, regex, node) for tokens with wildcards
+        self.exact = {}
+        self.globs = []
+        # (priority, replacement) if a pattern ends here
+        self.rule = None
+
+
+def _compile_token(token):
+    """Literal prefix and regex for one pattern token with * or {name} in it"""
+    pattern = []
+    position = 0
+    for match in _PLACEHOLDER_RE.finditer(token):
+        pattern.append(re.escape(token[position:match.start()]))
+        if match.group(1):
+            pattern.append(f"(?P<{match.group(1)}>[^-/:\\s]+)")
+        else:
+            pattern.append(r"\S*?")
+        position = match.end()
+    pattern.append(re.escape(token[position:]))
+    prefix = token[:_PLACEHOLDER_RE.search(token).start()]
+    return prefix, re.compile(''.join(pattern) + r'\Z')
+
+
+class ClassRewriter:
+    """Apply a rewrite table to class lists"""
+
+    def __init__(self, table):
+        self.table = dict(table)
+        self.root = _Node()
+        for priority, (pattern, replacement) in enumerate(self.table.items()):
+            tokens = pattern.split()
+            if not tokens:
+                raise RewriteTableError("empty pattern")
+            names = set(re.findall(r'\{(\w+)\}', pattern))
+            unknown = set(re.findall(r'\{(\w+)\}', replacement)) - names
+            if unknown:
+                raise RewriteTableError(f"{pattern!r}: replacement uses {', '.join(sorted(unknown))}")
+            node = self.root
+            for token in tokens:
+                node = self._child(node, token)
+            if node.rule is None:
+                node.rule = (priority, replacement)
+
+    def _child(self, node, token):
+        if not _PLACEHOLDER_RE.search(token):
+            return node.exact.setdefault(token, _Node())
+        prefix, regex = _compile_token(token)
+        for other_prefix, other_regex, child in node.globs:
+            if other_regex.pattern == regex.pattern:
+                return child
+        child = _Node()
+        node.globs.append((prefix, regex, child))
+        return child
+
+    def match(self, tokens, i):
+        """(end, replacement) for the best pattern starting at tokens[i], or None"""
+        best = None
+        # (node, index of the next token, captures so far)
+        stack = [(self.root, i, {})]
+        while stack:
+            node, j, captures = stack.pop()
+            if node.rule is not None and j > i:
+                priority, replacement = node.rule
+                if best is None or j > best[0] or (j == best[0] and priority < best[1]):
+                    best = (j, priority, replacement, captures)
+            if j == len(tokens):
+                continue
+            token = tokens[j]
+            child = node.exact.get(token)
+            if child is not None:
+                stack.append((child, j + 1, captures))
+            for prefix, regex, child in node.globs:
+                if not token.startswith(prefix):
+                    continue
+                match = regex.match(token)
+                if match is None:
+                    continue
+                groups = match.groupdict()
+                # A name used twice in a pattern has to match the same text
+                if any(captures.get(name, value) != value for name, value in groups.items()):
+                    continue
+                stack.append((child, j + 1, {**captures, **groups} if groups else captures))
+        if best is None:
+            return None
+        end, _, replacement, captures = best
+        return end, replacement.format(**captures) if captures else replacement
+
+    def rewrite(self, classes):
+        """classes with every pattern replaced, and the number of replacements"""
+        spans = [(m.start(), m.end()) for m in _TOKEN_RE.finditer(classes)]
+        tokens = [classes[start:end] for start, end in spans]
+        pieces = []
+        position = 0
+        count = 0
+        i = 0
+        while i < len(tokens):
+            found = self.match(tokens, i)
+            if found is None:
+                i += 1
+                continue
+            end, replacement = found
+            start = spans[i][0]
+            stop = spans[end - 1][1]
+            if not replacement:
+                # Take the whitespace before a deleted run with it
+                start = spans[i - 1][1] if i else start
+                if not i and end < len(spans):
+                    stop = spans[end][0]
+            pieces.append(classes[position:start])
+            pieces.append(replacement)
+            position = stop
+            count += 1
+            i = end
+        if not count:
+            return classes, 0
+        pieces.append(classes[position:])
+        return ''.join(pieces), count
+
+    def rewrite_source(self, source, all_strings=False):
+        """source with every className class list rewritten, and the number of replacements"""
+        buffer = EditBuffer(source)
+        total = 0
+        for start, end in class_strings(source, all_strings=all_strings):
+            classes, count = self.rewrite(source[start:end])
+            if count:
+                buffer.replace(start, end, classes)
+                total += count
+        return buffer.text(), total
+
+
+def load_table(path):
+    """Pattern -> replacement from a JSON rewrite table"""
+    with open(path, 'r', encoding='utf-8') as f:
+        table = json.load(f)
+    if not isinstance(table, dict) or not all(isinstance(v, str) for v in table.values()):
+        raise RewriteTableError(f"{path}: expected an object of pattern -> replacement strings")
+    return table
+
+
+def table_path(name):
+    """A table given by name (from content/class-rewrites/) or by path"""
+    if os.sep in name or name.endswith(".json"):
+        return name
+    return os.path.join(REWRITES_DIR, f"{name}.json")
+
+
+def source_files(paths):
+    """TSX/JSX files under paths (files or directories), sorted"""
+    files = []
+    for path in paths:
+        if os.path.isfile(path):
+            files.append(path)
+            continue
+        for directory, dirnames, filenames in os.walk(path):
+            dirnames[:] = [d for d in dirnames if not d.startswith('.') and d != "node_modules"]
+            files.extend(os.path.join(directory, f) for f in filenames if f.endswith(SOURCE_EXTENSIONS))
+    return sorted(files)
+
+
+# One rewriter per worker process, built from the first table it is sent
+_worker_rewriter = None
+
+
+def rewrite_file(path, table, all_strings=False):
+    """(path, Change or None, replacements, error) for one file"""
+    global _worker_rewriter
+    if _worker_rewriter is None or _worker_rewriter.table != table:
+        _worker_rewriter = ClassRewriter(table)
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            source = f.read()
+    except OSError as e:
+        return path, None, 0, e.strerror
+    try:
+        content, count = _worker_rewriter.rewrite_source(source, all_strings)
+    except JsxError as e:
+        return path, None, 0, str(e)
+    change = Change(path, content, source) if content != source else None
+    return path, change, count, None
+
+
+def rewrite_files(files, table, jobs=1, all_strings=False):
+    """rewrite_file() over files, across jobs worker processes, in file order"""
+    if jobs == 0:
+        jobs = os.cpu_count() or 1
+    if jobs <= 1 or len(files) <= 1:
+        for path in files:
+            yield rewrite_file(path, table, all_strings)
+        return
+    workers = min(jobs, len(files))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(
+            rewrite_file, files, [table] * len(files), [all_strings] * len(files),
+            chunksize=max(1, len(files) // (workers * 4)),
+        )
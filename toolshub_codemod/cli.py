@@ -0,0 +1,446 @@
+"""
+Command line interface for toolshub-codemod
+"""
+
+import argparse
+import json
+import os
+import sys
+
+from . import engine
+from .cache import add_cache_argument
+from .changes import add_since_argument, since_from_args
+from .check import check_root
+from .content import INDEX_FILE
+from .duplicates import DEFAULT_NUM_PERM, DEFAULT_SHINGLE_SIZE, DEFAULT_THRESHOLD, find_duplicates
+from .journal import LATEST, JournalError, discard, list_runs, load_journal, summary, undo_changes
+from .jsonld import JSONLD_DIR, generate
+from .profiling import Profiler, add_profile_arguments
+from .roots import RootsRun, add_root_argument, root_labels, roots_from_args, tools_path
+from .tailwind import (
+    GLOBALS_CSS, INVENTORY_FILE, TailwindConfigError, build_inventory, render_block,
+    source_globs, tailwind_version, uncovered_files, update_globals,
+)
+from .transforms import SEO_CONTENT
+from .watch import PollingWatcher, affected, debounced, open_watcher
+from .writeback import add_dry_run_argument, open_batch
+
+
+def print_results(results, log, labels=None):
+    """Print each change from (root, FileResult) pairs; returns (updated, failed)"""
+    updated = 0
+    failed = 0
+    for root, result in results:
+        # Name the checkout only when there is more than one
+        where = f"[{labels[root]}] " if labels else ""
+        if result.applied:
+            updated += 1
+            print(f"✓ {where}Updated {result.tool}/{result.filename} ({', '.join(result.applied)})", file=log)
+        for error in result.errors:
+            failed += 1
+            print(f"⚠️  {where}{result.tool}/{result.filename}: {error}", file=log)
+    return updated, failed
+
+
+def run_pipeline(args, root, transforms, cache, tools=None):
+    """One engine pass over a single root, printing each change; returns (updated, failed, batch)"""
+    batch = open_batch(args.dry_run, root, args.roots)
+    results = engine.run(tools_path(root), transforms, cache=cache, batch=batch, tools=tools)
+    updated, failed = print_results(((root, result) for result in results), _log(args))
+    return updated, failed, batch
+
+
+def _log(args):
+    # Keep stdout a clean patch when previewing
+    return sys.stderr if args.dry_run else sys.stdout
+
+
+def _summary(args, updated, failed, changed):
+    if args.dry_run:
+        print(f"\n{len(changed)} file(s) would change, {failed} problem(s)", file=sys.stderr)
+    else:
+        print(f"\n✓ {updated} file(s) updated, {failed} problem(s)")
+
+
+def cmd_run(args):
+    """Apply the transform pipeline to every tool in one sweep, over each root at once"""
+    names = args.only.split(',') if args.only else None
+    transforms = engine.get_transforms(names, args.seo_mode)
+
+    profiler = Profiler(args.profile_capture) if args.profile or args.profile_capture else None
+    run = RootsRun(args.roots, transforms, args.dry_run, args.use_cache, profiler, args.since_tools)
+    labels = root_labels(args.roots) if len(args.roots) > 1 else None
+    updated, failed = print_results(run, _log(args), labels)
+    _summary(args, updated, failed, run.changed)
+
+    if profiler is not None:
+        profiler.print_report(_log(args))
+        profiler.write_json(args.profile_output)
+        print(f"\n✓ Profile written to {args.profile_output}", file=_log(args))
+
+    if args.watch:
+        root = args.roots[0]
+        return watch_pipeline(args, root, transforms, run.caches[root])
+    if args.dry_run:
+        return 1 if run.changed or failed else 0
+    return 1 if failed else 0
+
+
+def watch_pipeline(args, root, transforms, cache):
+    """Re-run the affected transforms for each debounced burst of changes
+
+    The cache, the content store and the loaded phase templates stay in
+    memory between runs, so a save only costs the files it touched.
+    """
+    log = _log(args)
+    content_dir = SEO_CONTENT.content_dir
+    watched = [(tools_path(root), True)]
+    if os.path.isdir(content_dir):
+        watched.append((content_dir, False))
+    watcher = open_watcher(watched, poll=args.poll)
+    mode = "polling" if isinstance(watcher, PollingWatcher) else "inotify"
+    print(f"\nWatching {tools_path(root)} ({mode}), Ctrl+C to stop", file=log)
+
+    try:
+        for paths in debounced(watcher, args.debounce):
+            work, content_tools = affected(paths, tools_path(root), transforms, content_dir)
+            for tool in content_tools:
+                SEO_CONTENT.invalidate(None if tool == INDEX_FILE else tool)
+            for filenames, tools in work.items():
+                group = [t for t in transforms if t.filename in filenames]
+                updated, failed, batch = run_pipeline(args, root, group, cache, tools)
+                # Our own writes echo back as events; stay quiet when nothing happened
+                if updated or failed:
+                    _summary(args, updated, failed, getattr(batch, "changed", ()))
+    except KeyboardInterrupt:
+        print("\n✓ Stopped watching", file=log)
+    finally:
+        watcher.close()
+    return 0
+
+
+def cmd_jsonld(args):
+    """Write precomputed HowTo/FAQ JSON-LD for every tool whose content changed"""
+    log = _log(args)
+    labels = root_labels(args.roots) if len(args.roots) > 1 else None
+    changed = []
+    written = 0
+    for root in args.roots:
+        where = f"[{labels[root]}] " if labels else ""
+        tools = args.since_tools[root] if args.since_tools else None
+        batch = open_batch(args.dry_run, root, args.roots)
+        try:
+            tools_written, unchanged, stale = generate(root, batch, tools=tools, force=args.force)
+        except BaseException:
+            batch.abort()
+            raise
+        batch.commit()
+        for tool in tools_written:
+            print(f"✓ {where}Wrote {JSONLD_DIR}/{tool}.json", file=log)
+        for tool in stale:
+            print(f"⚠️  {where}{JSONLD_DIR}/{tool}.json has no content record any more", file=log)
+        written += len(tools_written)
+        changed.extend(getattr(batch, "changed", ()))
+        print(f"  {where}{unchanged} tool(s) unchanged", file=log)
+
+    if args.dry_run:
+        print(f"\n{len(changed)} file(s) would change", file=sys.stderr)
+        return 1 if changed else 0
+    print(f"\n✓ {written} JSON-LD file(s) written")
+    return 0
+
+
+def cmd_check(args):
+    """Report naming, SEO and ALL_TOOLS problems without touching any file"""
+    reports = [check_root(root, args.jobs) for root in args.roots]
+    total = sum(len(report["problems"]) for report in reports)
+    if args.json:
+        json.dump({"roots": reports, "problems": total}, sys.stdout, indent=2, ensure_ascii=False)
+        print()
+        return 1 if total else 0
+
+    labels = root_labels(args.roots) if len(args.roots) > 1 else None
+    for report in reports:
+        where = f"[{labels[report['root']]}] " if labels else ""
+        for problem in report["problems"]:
+            name = f"{problem['tool']}/{problem['file']}" if problem["tool"] and problem["check"] != "all-tools" \
+                else problem["file"]
+            tool = f" ({problem['tool']})" if problem["check"] == "all-tools" and problem["tool"] else ""
+            print(f"⚠️  {where}{name}{tool}: {problem['message']}")
+    tools = sum(report["tools"] for report in reports)
+    elapsed = sum(report["elapsed_s"] for report in reports)
+    mark = "❌" if total else "✓"
+    print(f"\n{mark} {total} problem(s) in {tools} tool(s), checked in {elapsed:.3f}s")
+    return 1 if total else 0
+
+
+def cmd_tailwind(args):
+    """Index the Tailwind classes in use and regenerate the globals.css source manifest"""
+    log = _log(args)
+    labels = root_labels(args.roots) if len(args.roots) > 1 else None
+    changed = []
+    failed = 0
+    for root in args.roots:
+        where = f"[{labels[root]}] " if labels else ""
+        inventory = build_inventory(root)
+        for name, error in inventory["errors"].items():
+            print(f"⚠️  {where}Skipped {name}: {error}", file=log)
+        print(f"✓ {where}{len(inventory['classes'])} class(es) in use, "
+              f"{len(inventory['safelist'])} only in SEO configs", file=log)
+
+        version = tailwind_version(root)
+        # @source inline() arrived in Tailwind 4.1
+        inline = version is None or version >= (4, 1)
+        if inventory["safelist"] and not inline:
+            print(f"⚠️  {where}tailwindcss {'.'.join(map(str, version))} has no @source inline(); "
+                  f"not safelisting {' '.join(inventory['safelist'])}", file=log)
+
+        if not args.dry_run:
+            output = os.path.join(root, args.output)
+            with open(output, 'w', encoding='utf-8') as f:
+                json.dump({"tailwindcss": '.'.join(map(str, version)) if version else None, **inventory},
+                          f, indent=2, ensure_ascii=False)
+                f.write('\n')
+            print(f"✓ {where}Wrote {args.output}", file=log)
+
+        path = os.path.join(root, GLOBALS_CSS)
+        batch = open_batch(args.dry_run, root, args.roots)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                css = f.read()
+            names = {name for names in inventory["classes"].values() for name in names}
+            uncovered = uncovered_files(css, sorted(names))
+            # A real run rewrites the block below, which covers them again
+            mark = "❌" if args.dry_run else "⚠️ "
+            for name in uncovered:
+                print(f"{mark} {where}{name} has classes but no @source glob in {GLOBALS_CSS} covers it",
+                      file=log)
+            if uncovered and args.dry_run:
+                failed += 1
+            block = render_block(source_globs(root), inventory["safelist"], inline)
+            if batch.stage(path, update_globals(css, block), css):
+                print(f"✓ {where}Updated {GLOBALS_CSS}", file=log)
+            else:
+                print(f"  {where}{GLOBALS_CSS} unchanged", file=log)
+        except (OSError, TailwindConfigError) as e:
+            batch.abort()
+            failed += 1
+            print(f"❌ {where}{GLOBALS_CSS}: {getattr(e, 'strerror', None) or e}", file=log)
+            continue
+        except BaseException:
+            batch.abort()
+            raise
+        batch.commit()
+        changed.extend(getattr(batch, "changed", ()))
+
+    if args.dry_run:
+        print(f"\n{len(changed)} file(s) would change", file=sys.stderr)
+        return 1 if changed or failed else 0
+    return 1 if failed else 0
+
+
+def cmd_undo(args):
+    """Restore the files a journaled run changed, or list the runs that can be undone"""
+    labels = root_labels(args.roots) if len(args.roots) > 1 else None
+    if args.run_id is None:
+        for root in args.roots:
+            where = f"[{labels[root]}] " if labels else ""
+            runs = list_runs(root)
+            if not runs:
+                print(f"  {where}No journaled runs")
+            for run_id in runs:
+                try:
+                    run, started, files, command = summary(load_journal(root, run_id))
+                except JournalError as e:
+                    print(f"⚠️  {where}{e}")
+                    continue
+                print(f"{where}{run}  {started}  {files:>4} file(s)  {command}")
+        return 0
+
+    log = _log(args)
+    plans = {}
+    failed = False
+    for root in args.roots:
+        where = f"[{labels[root]}] " if labels else ""
+        try:
+            journal = load_journal(root, args.run_id)
+        except JournalError as e:
+            print(f"❌ {where}{e}", file=log)
+            failed = True
+            continue
+        restore, originals, conflicts = undo_changes(root, journal)
+        for path, reason in sorted(conflicts.items()):
+            print(f"⚠️  {where}{os.path.relpath(path, root)}: {reason}", file=log)
+        failed = failed or bool(conflicts)
+        plans[root] = (journal["run"], restore, originals, conflicts)
+    # All or nothing unless told otherwise
+    if failed and not args.force:
+        print("\n❌ Nothing restored (--force restores the files without conflicts)", file=log)
+        return 1
+
+    changed = []
+    restored = 0
+    for root, (run_id, restore, originals, conflicts) in plans.items():
+        where = f"[{labels[root]}] " if labels else ""
+        batch = open_batch(args.dry_run, root, args.roots)
+        try:
+            for path, content in sorted(restore.items()):
+                name = os.path.relpath(path, root)
+                if content is None:
+                    batch.remove(path)
+                    print(f"✓ {where}Removed {name}", file=log)
+                else:
+                    batch.stage(path, content, originals[path])
+                    print(f"✓ {where}Restored {name}", file=log)
+        except BaseException:
+            batch.abort()
+            raise
+        batch.commit()
+        changed.extend(getattr(batch, "changed", ()))
+        restored += len(restore)
+        # Keep the journal while it still has files to restore
+        if not args.dry_run and not conflicts:
+            discard(root, run_id)
+
+    if args.dry_run:
+        print(f"\n{len(changed)} file(s) would change", file=sys.stderr)
+        return 1 if changed else 0
+    print(f"\n✓ {restored} file(s) restored")
+    return 1 if failed else 0
+
+
+def cmd_duplicates(args):
+    """Report pairs of tools whose SEO prose is nearly the same"""
+    if not 0 < args.threshold <= 1:
+        print("❌ --threshold must be between 0 and 1", file=sys.stderr)
+        return 2
+    if args.shingle_size < 1 or args.num_perm < 1:
+        print("❌ --shingle-size and --num-perm must be at least 1", file=sys.stderr)
+        return 2
+    reports = [
+        find_duplicates(root, args.threshold, args.shingle_size, args.num_perm, args.jobs)
+        for root in args.roots
+    ]
+    total = sum(len(report["pairs"]) for report in reports)
+    if args.json:
+        json.dump({"roots": reports, "pairs": total}, sys.stdout, indent=2, ensure_ascii=False)
+        print()
+        return 1 if total else 0
+
+    labels = root_labels(args.roots) if len(args.roots) > 1 else None
+    for report in reports:
+        where = f"[{labels[report['root']]}] " if labels else ""
+        for pair in report["pairs"]:
+            first, second = pair["tools"]
+            print(f"⚠️  {where}{first} ~ {second}: {pair['similarity']:.0%} similar")
+    tools = sum(report["tools"] for report in reports)
+    candidates = sum(report["candidates"] for report in reports)
+    elapsed = sum(report["elapsed_s"] for report in reports)
+    mark = "❌" if total else "✓"
+    print(f"\n{mark} {total} near-duplicate pair(s) at {args.threshold:.0%} or more among {tools} tool(s); "
+          f"{candidates} candidate pair(s) compared in {elapsed:.2f}s")
+    return 1 if total else 0
+
+
+def cmd_list(args):
+    """Print the registered pipeline"""
+    for transform in engine.get_transforms(engine.list_transforms()):
+        mode = f"{transform.mode} mode only" if transform.mode else ""
+        print(f"{transform.name:<22} {transform.filename:<12} {mode}".rstrip())
+    return 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="toolshub-codemod",
+        description="Single-pass codemods for the src/app/tools tree",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="apply the transform pipeline")
+    add_root_argument(run_parser)
+    run_parser.add_argument("--only", metavar="NAMES",
+                            help="comma-separated transforms to apply (default: all)")
+    add_cache_argument(run_parser)
+    add_since_argument(run_parser)
+    add_dry_run_argument(run_parser)
+    run_parser.add_argument("--seo-mode", choices=engine.SEO_MODES, default=engine.DEFAULT_MODE,
+                            help="splice SEO sections into client.tsx, move them into a "
+                                 "seo-content.tsx server component, or remove them from client.tsx "
+                                 "(default: %(default)s)")
+    add_profile_arguments(run_parser)
+    run_parser.add_argument("--watch", action="store_true",
+                            help="keep running and re-apply transforms to tools as they change "
+                                 "(single root only)")
+    run_parser.add_argument("--debounce", type=float, default=0.3, metavar="SECONDS",
+                            help="quiet period that ends a burst of saves (default: %(default)s)")
+    run_parser.add_argument("--poll", action="store_true",
+                            help="watch by polling instead of inotify")
+    run_parser.set_defaults(func=cmd_run)
+
+    jsonld_parser = subparsers.add_parser("jsonld", help="precompute HowTo/FAQ JSON-LD from the SEO content")
+    add_root_argument(jsonld_parser)
+    add_since_argument(jsonld_parser)
+    add_dry_run_argument(jsonld_parser)
+    jsonld_parser.add_argument("--force", action="store_true",
+                               help="rebuild every tool, even those the manifest says are current")
+    jsonld_parser.set_defaults(func=cmd_jsonld)
+
+    check_parser = subparsers.add_parser("check", help="report naming, SEO and ALL_TOOLS problems (read-only)")
+    add_root_argument(check_parser)
+    check_parser.add_argument("--jobs", "-j", type=int, default=0, metavar="N",
+                              help="check tools on N threads (default: 0, one per CPU plus a few)")
+    check_parser.add_argument("--json", action="store_true",
+                              help="print a JSON report instead of one line per problem")
+    check_parser.set_defaults(func=cmd_check)
+
+    tailwind_parser = subparsers.add_parser(
+        "tailwind", help="index Tailwind classes and regenerate the globals.css source manifest",
+    )
+    add_root_argument(tailwind_parser)
+    add_dry_run_argument(tailwind_parser)
+    tailwind_parser.add_argument("--output", default=INVENTORY_FILE, metavar="FILE",
+                                 help="class inventory to write, relative to each root (default: %(default)s)")
+    tailwind_parser.set_defaults(func=cmd_tailwind)
+
+    duplicates_parser = subparsers.add_parser(
+        "duplicates", help="report tools with near-duplicate SEO prose (MinHash/LSH, read-only)",
+    )
+    add_root_argument(duplicates_parser)
+    duplicates_parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, metavar="J",
+                                   help="lowest Jaccard similarity to report (default: %(default)s)")
+    duplicates_parser.add_argument("--shingle-size", type=int, default=DEFAULT_SHINGLE_SIZE, metavar="N",
+                                   help="words per shingle (default: %(default)s)")
+    duplicates_parser.add_argument("--num-perm", type=int, default=DEFAULT_NUM_PERM, metavar="N",
+                                   help="MinHash signature length (default: %(default)s)")
+    duplicates_parser.add_argument("--jobs", "-j", type=int, default=0, metavar="N",
+                                   help="read tools in N worker processes (default: 0, one per CPU)")
+    duplicates_parser.add_argument("--json", action="store_true",
+                                   help="print a JSON report instead of one line per pair")
+    duplicates_parser.set_defaults(func=cmd_duplicates)
+
+    undo_parser = subparsers.add_parser("undo", help="restore the files a run changed, from its journal")
+    undo_parser.add_argument("run_id", nargs="?", metavar="RUN_ID",
+                             help=f"run to undo, or {LATEST} (default: list the journaled runs)")
+    add_root_argument(undo_parser)
+    add_dry_run_argument(undo_parser)
+    undo_parser.add_argument("--force", action="store_true",
+                             help="restore what can be restored even if other files changed since the run")
+    undo_parser.set_defaults(func=cmd_undo)
+
+    list_parser = subparsers.add_parser("list", help="list registered transforms")
+    list_parser.set_defaults(func=cmd_list)
+
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.command in ("run", "jsonld", "check", "tailwind", "undo", "duplicates"):
+        args.roots = roots_from_args(parser, args)
+        if getattr(args, "watch", False) and len(args.roots) > 1:
+            parser.error("--watch takes a single --root")
+        if args.command in ("run", "jsonld"):
+            args.since_tools = since_from_args(parser, args, args.roots)
+    return args.func(args)
@@ -0,0 +1,90 @@
+"""
+Per-tool SEO content store
+
+Each tool's SEO copy lives in content/seo/<tool>.json, with index.json
+mapping tool keys to the phase that introduced them (in phase order). Only
+the index is read up front; a tool's record is read and parsed the first
+time that tool is looked up.
+"""
+
+import json
+import os
+from collections.abc import Mapping
+
+from .cache import hash_text
+
+CONTENT_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "content", "seo"
+)
+INDEX_FILE = "index.json"
+
+
+def load_index(content_dir=CONTENT_DIR):
+    """Map tool key -> phase number, in the order the tools were added"""
+    with open(os.path.join(content_dir, INDEX_FILE), 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def record_path(tool_key, content_dir=CONTENT_DIR):
+    """Path of one tool's content record"""
+    return os.path.join(content_dir, f"{tool_key}.json")
+
+
+class ContentStore(Mapping):
+    """Read-only mapping of tool key -> SEO config, loaded one record at a time
+
+    phase restricts the store to the tools a single phase introduced.
+    Records are lists in JSON; features and use_cases items stay as
+    [title, desc] pairs, which the section template unpacks the same way.
+    """
+
+    def __init__(self, phase=None, content_dir=CONTENT_DIR):
+        self.phase = phase
+        self.content_dir = content_dir
+        self._keys = None
+        self._records = {}
+
+    def index(self):
+        """Map tool key -> phase for the tools in this store, in index order"""
+        if self._keys is None:
+            index = load_index(self.content_dir)
+            # A dict keeps index order and gives constant-time membership
+            self._keys = {k: p for k, p in index.items() if self.phase is None or p == self.phase}
+        return self._keys
+
+    def __getitem__(self, tool_key):
+        if tool_key not in self._records:
+            if tool_key not in self.index():
+                raise KeyError(tool_key)
+            with open(record_path(tool_key, self.content_dir), 'r', encoding='utf-8') as f:
+                self._records[tool_key] = json.load(f)
+        return self._records[tool_key]
+
+    def __contains__(self, tool_key):
+        return tool_key in self.index()
+
+    def __iter__(self):
+        return iter(self.index())
+
+    def __len__(self):
+        return len(self.index())
+
+    def invalidate(self, tool_key=None):
+        """Drop a cached record (or the index and every record) after it changed on disk"""
+        if tool_key is None:
+            self._keys = None
+            self._records.clear()
+        else:
+            self._records.pop(tool_key, None)
+
+    def record_hash(self, tool_key):
+        """Hash of a tool's raw record, for cache keys, without parsing it"""
+        if tool_key not in self:
+            return None
+        with open(record_path(tool_key, self.content_dir), 'rb') as f:
+            return hash_text(f.read().decode('utf-8'))
+
+
+def load_phase(phase, content_dir=CONTENT_DIR):
+    """The configs one SEO phase script injects"""
+    return ContentStore(phase, content_dir)
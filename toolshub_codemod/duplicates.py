@@ -0,0 +1,209 @@
+"""
+Near-duplicate detection for the tools' SEO prose
+
+Each tool's text is its content record's prose (intro, what_is, features,
+steps, use_cases) plus the JSX text its pages actually render: the
+client.tsx and seo-content.tsx markup, injected sections included, and
+the page.tsx metadata description. The text is cut into word shingles and
+summarised as a MinHash signature: one SHAKE-128 digest per shingle
+supplies all num_perm 32-bit hash values, and the signature keeps the
+minimum of each. LSH banding then buckets signatures by slices of rows,
+so only tools sharing a bucket are compared, and those candidate pairs
+are checked against the exact Jaccard similarity of their shingle sets.
+Reading and hashing the tools (mostly JSX parsing) runs across worker
+processes.
+"""
+
+import hashlib
+import html
+import os
+import re
+import struct
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import combinations
+
+from .engine import walk_tools
+from .jsx import JsxError, default_export_root
+from .pages import read_page_metadata
+from .roots import tools_path
+from .sections import SEO_COMPONENT_FILE
+from .transforms import SEO_CONTENT
+
+DEFAULT_THRESHOLD = 0.5
+DEFAULT_SHINGLE_SIZE = 3
+DEFAULT_NUM_PERM = 128
+
+# Record fields that hold prose; list items are [title, desc] pairs or plain steps
+PROSE_FIELDS = ("title", "intro", "what_is")
+LIST_FIELDS = ("features", "steps", "use_cases")
+
+_WORD_RE = re.compile(r"[a-z0-9]+(?:'[a-z]+)?")
+
+
+def record_text(record):
+    """The prose of one content record as a list of strings"""
+    parts = [record[field] for field in PROSE_FIELDS if record.get(field)]
+    for field in LIST_FIELDS:
+        for item in record.get(field, ()):
+            parts.extend([item] if isinstance(item, str) else item)
+    return parts
+
+
+def jsx_text(source):
+    """Text nodes under a file's default export, or [] if it can't be parsed"""
+    try:
+        root = default_export_root(source)
+    except JsxError:
+        return []
+    return [
+        source[child.start:child.end]
+        for element in root.walk()
+        for child in element.children
+        if child.kind == "text"
+    ]
+
+
+def _read(path):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
+
+
+def tool_text(tools_dir, tool):
+    """Everything a tool says about itself, as one string"""
+    parts = record_text(SEO_CONTENT[tool]) if tool in SEO_CONTENT else []
+    for filename in ("client.tsx", SEO_COMPONENT_FILE):
+        source = _read(os.path.join(tools_dir, tool, filename))
+        if source:
+            parts.extend(jsx_text(source))
+    page = _read(os.path.join(tools_dir, tool, "page.tsx"))
+    meta = read_page_metadata(page) if page else None
+    if meta:
+        parts.append(meta["description"])
+    return html.unescape(' '.join(parts))
+
+
+def shingles(text, size=DEFAULT_SHINGLE_SIZE):
+    """Set of size-word shingles of text, lowercased"""
+    words = _WORD_RE.findall(text.lower())
+    if len(words) < size:
+        return {' '.join(words)} if words else set()
+    return {' '.join(words[i:i + size]) for i in range(len(words) - size + 1)}
+
+
+def minhash(shingle_set, num_perm=DEFAULT_NUM_PERM):
+    """MinHash signature of a shingle set as a tuple of num_perm ints"""
+    unpack = struct.Struct(f'<{num_perm}I').unpack
+    rows = [unpack(hashlib.shake_128(shingle.encode('utf-8')).digest(4 * num_perm)) for shingle in shingle_set]
+    if not rows:
+        return None
+    return tuple(map(min, zip(*rows)))
+
+
+def jaccard(a, b):
+    if not a and not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+def lsh_params(num_perm, threshold):
+    """(bands, rows) minimising false positives plus false negatives around threshold
+
+    A pair with similarity s lands in a shared bucket with probability
+    1 - (1 - s**rows)**bands; both error areas are integrated numerically.
+    """
+    steps = 200
+
+    def area(low, high, probability):
+        width = (high - low) / steps
+        return sum(probability(low + (i + 0.5) * width) for i in range(steps)) * width
+
+    best = None
+    for rows in range(1, num_perm + 1):
+        bands = num_perm // rows
+        false_positives = area(0.0, threshold, lambda s: 1 - (1 - s ** rows) ** bands)
+        false_negatives = area(threshold, 1.0, lambda s: (1 - s ** rows) ** bands)
+        error = false_positives + false_negatives
+        if best is None or error < best[0]:
+            best = (error, bands, rows)
+    return best[1], best[2]
+
+
+def candidate_pairs(signatures, bands, rows):
+    """Pairs of keys whose signatures agree on every row of at least one band"""
+    pairs = set()
+    for band in range(bands):
+        buckets = {}
+        for key, signature in signatures.items():
+            buckets.setdefault(signature[band * rows:(band + 1) * rows], []).append(key)
+        for keys in buckets.values():
+            if len(keys) > 1:
+                pairs.update(combinations(keys, 2))
+    return pairs
+
+
+def tool_signature(tools_dir, tool, shingle_size=DEFAULT_SHINGLE_SIZE, num_perm=DEFAULT_NUM_PERM):
+    """(tool, shingle set, MinHash signature) for one tool"""
+    shingle_set = shingles(tool_text(tools_dir, tool), shingle_size)
+    return tool, shingle_set, minhash(shingle_set, num_perm)
+
+
+def tool_signatures(tools_dir, tools, shingle_size, num_perm, jobs=1):
+    """tool_signature() for every tool, across jobs worker processes"""
+    if jobs == 0:
+        jobs = os.cpu_count() or 1
+    if jobs <= 1 or len(tools) <= 1:
+        for tool in tools:
+            yield tool_signature(tools_dir, tool, shingle_size, num_perm)
+        return
+    workers = min(jobs, len(tools))
+    count = len(tools)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(
+            tool_signature, [tools_dir] * count, tools, [shingle_size] * count, [num_perm] * count,
+            chunksize=max(1, count // (workers * 4)),
+        )
+
+
+def find_duplicates(root, threshold=DEFAULT_THRESHOLD, shingle_size=DEFAULT_SHINGLE_SIZE,
+                    num_perm=DEFAULT_NUM_PERM, jobs=0):
+    """Near-duplicate tool pairs under root; returns a report dict"""
+    start = time.perf_counter()
+    tools_dir = tools_path(root)
+    sets = {}
+    signatures = {}
+    for tool, shingle_set, signature in tool_signatures(
+            tools_dir, list(walk_tools(tools_dir)), shingle_size, num_perm, jobs):
+        # Tools with no text have nothing to compare
+        if signature is not None:
+            sets[tool] = shingle_set
+            signatures[tool] = signature
+
+    bands, rows = lsh_params(num_perm, threshold)
+    candidates = candidate_pairs(signatures, bands, rows)
+    pairs = []
+    for a, b in candidates:
+        # Report in tool order however the buckets paired them
+        a, b = sorted((a, b))
+        similarity = jaccard(sets[a], sets[b])
+        if similarity >= threshold:
+            estimate = sum(x == y for x, y in zip(signatures[a], signatures[b])) / num_perm
+            pairs.append({
+                "tools": [a, b],
+                "similarity": round(similarity, 3),
+                "estimate": round(estimate, 3),
+            })
+    pairs.sort(key=lambda pair: (-pair["similarity"], pair["tools"]))
+    return {
+        "root": root,
+        "tools": len(sets),
+        "threshold": threshold,
+        "bands": bands,
+        "rows": rows,
+        "candidates": len(candidates),
+        "pairs": pairs,
+        "elapsed_s": round(time.perf_counter() - start, 4),
+    }
@@ -0,0 +1,101 @@
+"""
+Piece-table edit buffer shared by chained transforms
+
+Transforms registered with edits=True don't build a new string per
+change: they record replacements against the text the run started with,
+and the engine joins original pieces and replacement text once, after the
+last of them. Edits may not overlap; where a later transform's edit does,
+the engine applies the earlier ones and lets it retry on the result.
+"""
+
+import bisect
+import re
+
+
+class EditConflict(Exception):
+    """Raised when an edit overlaps one already recorded"""
+
+
+class EditBuffer:
+    """Non-overlapping (start, end, text) edits against one original text
+
+    Offsets always refer to original. An insert is an empty range; inserts
+    at the same offset, and an insert at the start of a replaced range, keep
+    the order they were recorded in.
+    """
+
+    def __init__(self, text):
+        self.original = text
+        # (start, seq, end, text), sorted; seq orders edits starting at one offset
+        self._edits = []
+        self._seq = 0
+
+    def replace(self, start, end, text):
+        """Replace original[start:end] with text; returns False if that changes nothing"""
+        if not 0 <= start <= end <= len(self.original):
+            raise IndexError(f"edit {start}:{end} outside the text")
+        if self.original[start:end] == text:
+            return False
+        edit = (start, self._seq, end, text)
+        # Everything from the first edit starting at or after end is clear
+        index = bisect.bisect_left(self._edits, (end,))
+        for other_start, _, other_end, _ in reversed(self._edits[:index]):
+            if other_start < end and start < other_end:
+                raise EditConflict(f"edit at {start}:{end} overlaps an earlier one at {other_start}:{other_end}")
+            # Replaced ranges are disjoint, so none before this one reaches start
+            if other_start < start and other_start < other_end:
+                break
+        self._edits.insert(bisect.bisect(self._edits, edit), edit)
+        self._seq += 1
+        return True
+
+    def insert(self, offset, text):
+        return self.replace(offset, offset, text)
+
+    def delete(self, start, end):
+        return self.replace(start, end, '')
+
+    def sub(self, pattern, repl, count=0, flags=0):
+        """re.sub() over original as recorded edits; returns the number of changes"""
+        if isinstance(pattern, str):
+            pattern = re.compile(pattern, flags)
+        mark = self.mark()
+        changed = 0
+        try:
+            for n, match in enumerate(pattern.finditer(self.original)):
+                if count and n >= count:
+                    break
+                text = repl(match) if callable(repl) else match.expand(repl)
+                if self.replace(match.start(), match.end(), text):
+                    changed += 1
+        except EditConflict:
+            # All or nothing, like the re.sub() it stands in for
+            self.rollback(mark)
+            raise
+        return changed
+
+    def mark(self):
+        """A point rollback() can return to"""
+        return self._seq
+
+    def rollback(self, mark):
+        """Drop every edit recorded since mark"""
+        self._edits = [edit for edit in self._edits if edit[1] < mark]
+        self._seq = mark
+
+    def edited_since(self, mark):
+        return self._seq > mark
+
+    def text(self):
+        """The original with every edit applied"""
+        if not self._edits:
+            return self.original
+        pieces = []
+        position = 0
+        for start, _, end, text in self._edits:
+            pieces.append(self.original[position:start])
+            pieces.append(text)
+            # An insert recorded after a replacement at the same offset follows it
+            position = max(position, end)
+        pieces.append(self.original[position:])
+        return ''.join(pieces)
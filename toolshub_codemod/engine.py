@@ -0,0 +1,301 @@
+"""
+Single-pass codemod engine for the src/app/tools tree
+
+Transforms register against a file name (client.tsx, page.tsx) and the
+engine walks the tools directory once, feeding each file through every
+registered transform in memory before writing it back at most once.
+Transforms registered with files=True also get the tool's ToolFiles, so
+they can read sibling files and emit new ones. Transforms registered with
+edits=True record their changes in an EditBuffer shared with the ones
+before them instead of returning a new string.
+"""
+
+import os
+from collections import namedtuple
+
+from . import profiling
+from .cache import hash_config
+from .edits import EditBuffer, EditConflict
+from .profiling import NULL_PROFILER
+from .writeback import WriteBatch
+
+TOOLS_DIR = os.path.join("src", "app", "tools")
+
+# Where SEO sections live: spliced into client.tsx, or in a server component;
+# remove takes generated sections out of client.tsx again
+SEO_MODES = ("client", "server", "remove")
+DEFAULT_MODE = "client"
+
+FileResult = namedtuple("FileResult", ["tool", "filename", "path", "applied", "errors"])
+
+_REGISTRY = {}
+
+
+class TransformError(Exception):
+    """Raised by a transform that cannot be applied to a file"""
+
+
+class Transform:
+    """A named rewrite applied to one file in every tool directory"""
+
+    def __init__(self, name, filename, func, version=1, config=None, mode=None, files=False, edits=False):
+        self.name = name
+        self.filename = filename
+        self.func = func
+        self.version = version
+        # Optional callable returning the per-tool config a transform depends on
+        self.config = config
+        # Only part of the default pipeline in this mode (None: every mode)
+        self.mode = mode
+        self.files = files
+        # Called with an EditBuffer to record edits in, rather than the text
+        self.edits = edits
+
+    def __call__(self, tool, content, files=None):
+        if self.files:
+            return self.func(tool, content, files)
+        return self.func(tool, content)
+
+    def __repr__(self):
+        return f"Transform({self.name!r}, {self.filename!r})"
+
+
+class ToolFiles:
+    """One tool directory as transforms see it during a run
+
+    read() returns what an earlier transform emitted this run, falling back
+    to disk; emit() queues a whole file for the engine to write alongside
+    the one being transformed.
+    """
+
+    def __init__(self, tool_dir):
+        self.tool_dir = tool_dir
+        self.emitted = {}
+        self.emitters = {}
+        self.transform = None
+
+    def read(self, filename):
+        if filename in self.emitted:
+            return self.emitted[filename]
+        try:
+            with open(os.path.join(self.tool_dir, filename), 'r', encoding='utf-8') as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    def emit(self, filename, content):
+        self.emitted[filename] = content
+        self.emitters[filename] = self.transform
+
+
+def to_pascal_case(s):
+    """Convert kebab-case to PascalCase"""
+    return ''.join(word.capitalize() for word in s.split('-'))
+
+
+def register(name, filename, version=1, config=None, mode=None, files=False, edits=False):
+    """Decorator that adds a transform to the pipeline, in registration order"""
+    def decorator(func):
+        _REGISTRY[name] = Transform(name, filename, func, version, config, mode, files, edits)
+        return func
+    return decorator
+
+
+def get_transforms(names=None, mode=DEFAULT_MODE):
+    """Return registered transforms in pipeline order, optionally filtered by name
+
+    Without names, this is the default pipeline for mode; named transforms
+    are returned whatever their mode.
+    """
+    if names is None:
+        return [t for t in _REGISTRY.values() if t.mode in (None, mode)]
+    unknown = [name for name in names if name not in _REGISTRY]
+    if unknown:
+        raise KeyError(f"Unknown transform(s): {', '.join(unknown)}")
+    return [t for t in _REGISTRY.values() if t.name in names]
+
+
+def list_transforms():
+    """Names of every registered transform, in pipeline order"""
+    return list(_REGISTRY)
+
+
+def walk_tools(tools_dir):
+    """Yield tool directory names under tools_dir in sorted order"""
+    with os.scandir(tools_dir) as entries:
+        tools = sorted(entry.name for entry in entries if entry.is_dir())
+    yield from tools
+
+
+def apply_transforms(tool, content, transforms, files=None, profiler=NULL_PROFILER):
+    """Run content through transforms, returning (content, applied, errors)
+
+    Consecutive edits transforms share one EditBuffer, so their changes are
+    joined into a new string once rather than once per transform.
+    """
+    applied = []
+    errors = []
+    buffer = None
+    for transform in transforms:
+        if files is not None:
+            files.transform = transform.name
+        if transform.edits:
+            if buffer is None:
+                buffer = EditBuffer(content)
+            buffer, edited, error = _record_edits(tool, buffer, transform, files, profiler)
+            if error is not None:
+                errors.append(f"{transform.name}: {error}")
+            elif edited:
+                applied.append(transform.name)
+            continue
+
+        # Plain transforms see every edit made so far
+        if buffer is not None:
+            content = buffer.text()
+            buffer = None
+        try:
+            with profiler.transform(transform.name):
+                new_content = transform(tool, content, files)
+        except TransformError as e:
+            errors.append(f"{transform.name}: {e}")
+            continue
+        if new_content != content:
+            applied.append(transform.name)
+            content = new_content
+    if buffer is not None:
+        content = buffer.text()
+    return content, applied, errors
+
+
+def _record_edits(tool, buffer, transform, files, profiler):
+    """Run an edits transform; returns (buffer, edited, error)
+
+    A transform whose edit overlaps an earlier transform's gets a second
+    go against a fresh buffer over the text with those edits applied.
+    """
+    for retry in (False, True):
+        mark = buffer.mark()
+        try:
+            with profiler.transform(transform.name):
+                transform(tool, buffer, files)
+        except EditConflict as e:
+            buffer.rollback(mark)
+            if retry or mark == 0:
+                return buffer, False, e
+            profiler.count("edit conflicts")
+            buffer = EditBuffer(buffer.text())
+            continue
+        except TransformError as e:
+            buffer.rollback(mark)
+            return buffer, False, e
+        return buffer, buffer.edited_since(mark), None
+
+
+def pipeline_key(tool, transforms):
+    """(config hash, version) a cached file must match to skip this pipeline"""
+    configs = [t.config(tool) if t.config else None for t in transforms]
+    version = ','.join(f"{t.name}@{t.version}" for t in transforms)
+    return hash_config(configs), version
+
+
+def run(tools_dir, transforms=None, cache=None, batch=None, tools=None, profiler=None):
+    """Walk tools_dir once, applying the pipeline and yielding a FileResult per file
+
+    Files whose cache entry still matches are skipped without being opened
+    and yield nothing. Changed files are staged in batch (a WriteBatch by
+    default, or a DiffSink for a dry run) and only reach disk once the
+    whole walk has finished; if the walk is interrupted, nothing is written.
+    tools restricts the walk to the given tool directories, and a
+    profiling.Profiler collects phase timers and counters.
+    """
+    if transforms is None or all(isinstance(t, str) for t in transforms):
+        transforms = get_transforms(transforms)
+    if batch is None:
+        batch = WriteBatch()
+    if profiler is None:
+        profiler = NULL_PROFILER
+
+    # Group by target file so each file is read and written at most once
+    by_file = {}
+    for transform in transforms:
+        by_file.setdefault(transform.filename, []).append(transform)
+
+    # Cache entries stat the file, so they're recorded after the commit
+    records = []
+    # Bytes count as written once the commit has renamed them into place
+    staged_bytes = {}
+    with profiling.activate(profiler):
+        try:
+            with profiler.timer("walk"):
+                tool_names = list(walk_tools(tools_dir)) if tools is None else sorted(tools)
+            for tool in tool_names:
+                files = ToolFiles(os.path.join(tools_dir, tool))
+                for filename, group in by_file.items():
+                    path = os.path.join(tools_dir, tool, filename)
+                    with profiler.timer("walk"):
+                        exists = os.path.isfile(path)
+                    if not exists:
+                        continue
+                    profiler.count("files scanned")
+
+                    if cache is not None:
+                        with profiler.timer("cache"):
+                            config_hash, version = pipeline_key(tool, group)
+                            fresh = cache.is_fresh(path, config_hash, version)
+                        if fresh:
+                            profiler.count("files skipped (cache)")
+                            continue
+
+                    with profiler.timer("read"):
+                        with open(path, 'r', encoding='utf-8') as f:
+                            content = f.read()
+                            profiler.count("bytes read", os.fstat(f.fileno()).st_size)
+
+                    if cache is not None and cache.matches_source(path, content, config_hash, version):
+                        # Touched but byte-identical: refresh the stat, skip the work
+                        cache.record(path, config_hash, version, content)
+                        profiler.count("files skipped (cache)")
+                        continue
+
+                    with profiler.timer("transform"):
+                        new_content, applied, errors = apply_transforms(tool, content, group, files, profiler)
+                    with profiler.timer("write"):
+                        changed = batch.stage(path, new_content, content)
+                    if changed:
+                        profiler.count("files changed")
+                        staged_bytes[path] = len(new_content.encode('utf-8'))
+
+                    if cache is not None:
+                        if errors:
+                            cache.forget(path)
+                        else:
+                            records.append((path, config_hash, version, new_content, changed))
+
+                    yield FileResult(tool, filename, path, applied, errors)
+
+                # Files emitted by transforms are written with the rest of the batch
+                for filename, new_content in files.emitted.items():
+                    path = os.path.join(tools_dir, tool, filename)
+                    with profiler.timer("write"):
+                        changed = batch.stage(path, new_content)
+                    if changed:
+                        profiler.count("files changed")
+                        staged_bytes[path] = len(new_content.encode('utf-8'))
+                        yield FileResult(tool, filename, path, [files.emitters[filename]], [])
+        except BaseException:
+            batch.abort()
+            raise
+        else:
+            with profiler.timer("write"):
+                committed = set(batch.commit())
+            written = sum(size for path, size in staged_bytes.items() if path in committed)
+            if written:
+                profiler.count("bytes written", written)
+            if cache is not None:
+                for path, config_hash, version, content, changed in records:
+                    # A dry run commits nothing, so changed files stay stale
+                    if not changed or path in committed:
+                        cache.record(path, config_hash, version, content)
+        finally:
+            if cache is not None:
+                cache.save()
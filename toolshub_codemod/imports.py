@@ -0,0 +1,149 @@
+"""
+Named-import table for one module (lucide-react icons, mostly)
+
+Parses every `import { ... } from "module"` in a file, including the
+`import { A } , Info from "module"` shape the old Info regex left behind,
+and works out the edits that leave a single well-formed statement: names
+deduplicated, required names added, unused ones dropped. The statement
+keeps the file's quotes, semicolons and one-name-per-line layout.
+"""
+
+import re
+from collections import namedtuple
+
+from .edits import EditBuffer
+from .jsx import JsxError, identifiers
+
+LUCIDE = "lucide-react"
+
+# specifiers: the text of each name as written, e.g. "Info" or "Info as InfoIcon"
+ImportStatement = namedtuple(
+    "ImportStatement", ["start", "end", "specifiers", "quote", "semicolon", "indent", "trailing_comma"]
+)
+
+# Around the escaped module name
+_IMPORT_HEAD = r'^[ \t]*import\s*\{(?P<names>[^}]*)\}(?:\s*,(?P<extra>[\w$\s,]*?))?\s*from\s*(?P<quote>["\'])'
+_IMPORT_TAIL = r'(?P=quote)(?P<semicolon>;?)[ \t]*\n?'
+_ANY_IMPORT_RE = re.compile(r'^[ \t]*import\b[^;]*?from\s*["\'][^"\']+["\'];?[ \t]*\n', re.M)
+
+
+def _import_re(module):
+    return re.compile(_IMPORT_HEAD + re.escape(module) + _IMPORT_TAIL, re.M)
+
+
+def local_name(specifier):
+    """The name a specifier binds: Info for "Info" and InfoIcon for "Info as InfoIcon" """
+    return specifier.split(' as ')[-1].strip()
+
+
+def find_imports(content, module):
+    """Every named import of module, in file order"""
+    statements = []
+    for match in _import_re(module).finditer(content):
+        raw = match.group("names").split(',')
+        if match.group("extra"):
+            raw += match.group("extra").split(',')
+        specifiers = [' '.join(name.split()) for name in raw if name.strip()]
+        indent = None
+        if '\n' in match.group("names"):
+            for line in match.group("names").split('\n'):
+                if line.strip():
+                    indent = line[:len(line) - len(line.lstrip())]
+                    break
+        statements.append(ImportStatement(
+            match.start(), match.end(), specifiers, match.group("quote"),
+            match.group("semicolon"), indent, match.group("names").rstrip().endswith(','),
+        ))
+    return statements
+
+
+def render_import(specifiers, module, quote='"', semicolon='', indent=None, trailing_comma=False):
+    """One import statement (with its newline), one name per line if indent is given"""
+    if indent is None:
+        names = '{ ' + ', '.join(specifiers) + ' }'
+    else:
+        names = '{\n' + ',\n'.join(indent + s for s in specifiers) + (',' if trailing_comma else '') + '\n}'
+    return f"import {names} from {quote}{module}{quote}{semicolon}\n"
+
+
+def used_names(content, statements):
+    """Identifiers content uses outside the given import statements, or None if it can't be scanned"""
+    blanked = []
+    position = 0
+    for statement in statements:
+        blanked.append(content[position:statement.start])
+        # Same length, so offsets and line structure survive
+        blanked.append(re.sub(r'[^\n]', ' ', content[statement.start:statement.end]))
+        position = statement.end
+    blanked.append(content[position:])
+    try:
+        return identifiers(''.join(blanked))
+    except JsxError:
+        return None
+
+
+def import_edits(content, module, required=(), prune=False):
+    """(start, end, text) edits that tidy content's named imports of module
+
+    required names are added if missing. prune drops names the rest of the
+    file never uses: every name if True, or only those in a collection.
+    Names stay in the order first written; new ones go at the end. With
+    nothing to change the list is empty.
+    """
+    statements = find_imports(content, module)
+    specifiers = []
+    bound = set()
+    for statement in statements:
+        for specifier in statement.specifiers:
+            if local_name(specifier) not in bound:
+                bound.add(local_name(specifier))
+                specifiers.append(specifier)
+    for name in required:
+        if name not in bound:
+            bound.add(name)
+            specifiers.append(name)
+
+    if prune and statements:
+        used = used_names(content, statements)
+        # A file the scanner can't follow keeps all of its imports
+        if used is not None:
+            specifiers = [
+                s for s in specifiers
+                if local_name(s) in used or local_name(s) in required
+                or (prune is not True and local_name(s) not in prune)
+            ]
+
+    if not statements:
+        if not specifiers:
+            return []
+        # A new statement goes after the file's last import, in its style
+        last = None
+        for last in _ANY_IMPORT_RE.finditer(content):
+            pass
+        offset = last.end() if last else 0
+        semicolon = ';' if last and last.group(0).rstrip().endswith(';') else ''
+        return [(offset, offset, render_import(specifiers, module, semicolon=semicolon))]
+
+    first = statements[0]
+    original = content[first.start:first.end]
+    text = ''
+    if specifiers:
+        text = render_import(specifiers, module, first.quote, first.semicolon, first.indent, first.trailing_comma)
+        # Keep the statement's own leading whitespace and missing final newline
+        text = original[:len(original) - len(original.lstrip(' \t'))] + text
+        if not original.endswith('\n'):
+            text = text[:-1]
+    edits = []
+    if text != original:
+        edits.append((first.start, first.end, text))
+    for statement in statements[1:]:
+        edits.append((statement.start, statement.end, ''))
+    return edits
+
+
+def tidy_imports(content, module, required=(), prune=False):
+    """content with import_edits() applied"""
+    buffer = EditBuffer(content)
+    for start, end, text in import_edits(content, module, required, prune):
+        buffer.replace(start, end, text)
+    return buffer.text()
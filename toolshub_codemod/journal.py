@@ -0,0 +1,252 @@
+"""
+Undo journal for codemod runs
+
+Every WriteBatch opened for a root records, just before it renames its
+files into place, one journal entry per touched file: its path, sha256
+hashes of the text before and after, and a line delta that turns the new
+text back into the old. All batches of one process share a run id and a
+journal file in JOURNAL_DIR, so a run over several roots or a --watch
+session is undone as a unit. The file is a series of gzip members, each
+holding one JSON line: a header with the run id and command line, then
+one line per commit, appended as a new member so a commit never rewrites
+the ones before it. Files the run created are deleted on undo. Old
+journals are pruned whenever a new one is started.
+
+An undo only touches files still exactly as the run left them; anything
+edited since is reported as a conflict instead of being merged.
+"""
+
+import difflib
+import gzip
+import json
+import os
+import secrets
+import sys
+import time
+
+from .cache import hash_text
+
+JOURNAL_DIR = ".toolshub-codemod-journal"
+JOURNAL_FORMAT = 2
+JOURNAL_SUFFIX = ".json.gz"
+
+# Pruning: keep at most this many journals per root, none older than this
+JOURNAL_KEEP = 20
+JOURNAL_MAX_AGE = 30 * 24 * 3600
+
+# Every batch in this process journals under the same run id
+RUN_ID = time.strftime("%Y%m%d-%H%M%S") + "-" + secrets.token_hex(2)
+
+LATEST = "latest"
+
+
+class JournalError(Exception):
+    """Raised for a run id with no readable journal"""
+
+
+def journal_dir(root):
+    return os.path.join(root, JOURNAL_DIR)
+
+
+def journal_path(root, run_id):
+    return os.path.join(journal_dir(root), run_id + JOURNAL_SUFFIX)
+
+
+def line_delta(text, target):
+    """[start, end, lines] edits that turn text into target, line by line"""
+    lines = text.splitlines(keepends=True)
+    target_lines = target.splitlines(keepends=True)
+    matcher = difflib.SequenceMatcher(None, lines, target_lines, autojunk=False)
+    return [
+        [i1, i2, target_lines[j1:j2]]
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes()
+        if tag != 'equal'
+    ]
+
+
+def apply_delta(text, delta):
+    """text with a line_delta() applied"""
+    lines = text.splitlines(keepends=True)
+    pieces = []
+    position = 0
+    for start, end, replacement in delta:
+        pieces.extend(lines[position:start])
+        pieces.extend(replacement)
+        position = end
+    pieces.extend(lines[position:])
+    return ''.join(pieces)
+
+
+def _read(path):
+    """A file's text, or None if it doesn't exist"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
+
+
+def _hash(text):
+    return None if text is None else hash_text(text)
+
+
+def load_journal(root, run_id):
+    """The journal document for run_id (or LATEST) under root"""
+    if run_id == LATEST:
+        runs = list_runs(root)
+        if not runs:
+            raise JournalError(f"no journals in {journal_dir(root)}")
+        run_id = runs[-1]
+    try:
+        lines = _read_lines(journal_path(root, run_id))
+        records = [json.loads(line) for line in lines]
+    except FileNotFoundError:
+        raise JournalError(f"no journal for run {run_id}") from None
+    except (OSError, ValueError) as e:
+        raise JournalError(f"journal for run {run_id} is unreadable: {e}") from None
+    if not records or records[0].get("format") != JOURNAL_FORMAT:
+        raise JournalError(f"journal for run {run_id} has an unknown format")
+    return {**records[0], "commits": records[1:]}
+
+
+def _read_lines(path):
+    """The complete JSON lines of a journal's gzip members, in order"""
+    lines = []
+    with gzip.open(path, 'rt', encoding='utf-8') as f:
+        try:
+            for line in f:
+                lines.append(line)
+        except EOFError:
+            # A member cut short by a crash mid-record; its files were never replaced
+            pass
+    # Likewise a last line with no newline never finished
+    if lines and not lines[-1].endswith('\n'):
+        lines.pop()
+    return lines
+
+
+def list_runs(root):
+    """Run ids with a journal under root, oldest first"""
+    try:
+        names = os.listdir(journal_dir(root))
+    except FileNotFoundError:
+        return []
+    return sorted(name[:-len(JOURNAL_SUFFIX)] for name in names if name.endswith(JOURNAL_SUFFIX))
+
+
+def prune(root, keep=JOURNAL_KEEP, max_age=JOURNAL_MAX_AGE, now=None):
+    """Delete all but the newest keep journals, and any older than max_age seconds"""
+    now = time.time() if now is None else now
+    runs = list_runs(root)
+    removed = []
+    for index, run_id in enumerate(runs):
+        path = journal_path(root, run_id)
+        try:
+            expired = now - os.path.getmtime(path) > max_age
+        except FileNotFoundError:
+            continue
+        if index < len(runs) - keep or (expired and run_id != RUN_ID):
+            os.unlink(path)
+            removed.append(run_id)
+    return removed
+
+
+class Journal:
+    """The journal a root's batches append to during this run"""
+
+    def __init__(self, root, run_id=RUN_ID):
+        self.root = root
+        self.run_id = run_id
+        self.path = journal_path(root, run_id)
+
+    def record(self, files):
+        """Durably journal (path, text before or None, text after or None) for one commit"""
+        entries = []
+        for path, before, after in files:
+            entries.append({
+                "path": os.path.relpath(path, self.root),
+                "before": _hash(before),
+                "after": _hash(after),
+                # Nothing to restore for a file the run created
+                "delta": None if before is None else line_delta(after or '', before),
+            })
+        if not entries:
+            return
+        records = []
+        new = not os.path.exists(self.path)
+        if new:
+            records.append({
+                "format": JOURNAL_FORMAT,
+                "run": self.run_id,
+                "command": [_program()] + sys.argv[1:],
+            })
+        records.append({"time": time.strftime("%Y-%m-%dT%H:%M:%S"), "files": entries})
+
+        os.makedirs(journal_dir(self.root), exist_ok=True)
+        # One gzip member per record; earlier commits are never rewritten
+        with open(self.path, 'ab') as raw:
+            for record in records:
+                line = json.dumps(record, ensure_ascii=False, separators=(',', ':')) + '\n'
+                with gzip.GzipFile(fileobj=raw, mode='wb', mtime=0) as f:
+                    f.write(line.encode('utf-8'))
+            raw.flush()
+            os.fsync(raw.fileno())
+        if new:
+            prune(self.root)
+
+
+def _program():
+    name = os.path.basename(sys.argv[0])
+    # python -m toolshub_codemod
+    return "toolshub-codemod" if name == "__main__.py" else name
+
+
+def summary(journal):
+    """(run id, time of the first commit, files touched, command line) for a listing"""
+    files = {entry["path"] for commit in journal["commits"] for entry in commit["files"]}
+    started = journal["commits"][0]["time"] if journal["commits"] else ""
+    return journal["run"], started, len(files), ' '.join(journal["command"])
+
+
+def undo_changes(root, journal):
+    """What undoing journal takes: ({path: text to restore, or None to delete}, originals, conflicts)
+
+    Commits are unwound newest first. A file that no longer matches the
+    text the run left (edited since, or touched by a later run) is a
+    conflict, and none of its entries are applied.
+    """
+    current = {}
+    originals = {}
+    conflicts = {}
+    for commit in reversed(journal["commits"]):
+        for entry in reversed(commit["files"]):
+            path = os.path.join(root, entry["path"])
+            if path in conflicts:
+                continue
+            if path not in current:
+                current[path] = originals[path] = _read(path)
+            text = current[path]
+            if _hash(text) != entry["after"]:
+                conflicts[path] = "changed since the run"
+                continue
+            if entry["before"] is None:
+                current[path] = None
+                continue
+            restored = apply_delta(text or '', entry["delta"])
+            if hash_text(restored) != entry["before"]:
+                conflicts[path] = "journal delta doesn't reproduce the original"
+                continue
+            current[path] = restored
+    restore = {
+        path: text for path, text in current.items()
+        if path not in conflicts and text != originals[path]
+    }
+    return restore, originals, conflicts
+
+
+def discard(root, run_id):
+    """Delete run_id's journal once it has been undone"""
+    try:
+        os.unlink(journal_path(root, run_id))
+    except FileNotFoundError:
+        pass
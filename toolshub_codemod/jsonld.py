@@ -0,0 +1,137 @@
+"""
+Precomputed JSON-LD for tool pages
+
+Builds each tool's HowTo and FAQPage structured data from its SEO content
+record, in the shapes generateHowToStructuredData and
+generateFAQStructuredData (src/lib/seo-utils.ts) produce at render time:
+the record's steps become HowTo steps and its use_cases become FAQ
+entries. Each tool gets one minified src/data/structured-data/<tool>.json
+holding {"howTo": ..., "faq": ...}, which a page imports and hands to
+<StructuredData> as it is.
+
+manifest.json beside the files maps each tool to the hash of the record
+it was built from and the hash of the file written, so a run only builds
+tools whose record (or this generator) changed, or whose file no longer
+matches what was written.
+"""
+
+import html
+import json
+import os
+
+from .cache import hash_text
+from .transforms import SEO_CONTENT
+from .writeback import WriteBatch, read_text
+
+JSONLD_DIR = os.path.join("src", "data", "structured-data")
+MANIFEST_FILE = "manifest.json"
+# Bump when the generated shapes change, so every tool is rebuilt
+JSONLD_VERSION = 1
+
+
+def plain_text(text):
+    """Record text as rendered: JSX entities decoded, source line breaks collapsed"""
+    return ' '.join(html.unescape(text).split())
+
+
+def howto_data(config):
+    """generateHowToStructuredData() for a record's steps"""
+    return {
+        "@context": "https://schema.org",
+        "@type": "HowTo",
+        "name": f"How to Use {plain_text(config['title'])}",
+        "description": plain_text(config["intro"]),
+        "step": [
+            {
+                "@type": "HowToStep",
+                "position": position,
+                "name": f"Step {position}",
+                "text": plain_text(step),
+            }
+            for position, step in enumerate(config["steps"], 1)
+        ],
+    }
+
+
+def faq_data(config):
+    """generateFAQStructuredData() for a record's use cases"""
+    title = plain_text(config["title"])
+    return {
+        "@context": "https://schema.org",
+        "@type": "FAQPage",
+        "mainEntity": [
+            {
+                "@type": "Question",
+                "name": f"How can the {title} help with {plain_text(name)}?",
+                "acceptedAnswer": {
+                    "@type": "Answer",
+                    "text": plain_text(answer),
+                },
+            }
+            for name, answer in config["use_cases"]
+        ],
+    }
+
+
+def render_jsonld(config):
+    """The minified file for one tool"""
+    data = {"howTo": howto_data(config), "faq": faq_data(config)}
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':')) + '\n'
+
+
+def jsonld_path(root):
+    return os.path.join(root, JSONLD_DIR)
+
+
+def load_manifest(directory):
+    """tool -> {source, output} from a previous run, or {} if there is none"""
+    try:
+        with open(os.path.join(directory, MANIFEST_FILE), 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if data.get("version") != JSONLD_VERSION:
+        return {}
+    return data.get("tools", {})
+
+
+def generate(root, batch, store=SEO_CONTENT, tools=None, force=False):
+    """Stage the JSON-LD files of root that are missing or out of date
+
+    tools limits the run to those tool keys (default: every tool in the
+    store). Returns (written, unchanged, stale): tools staged, tools
+    skipped, and manifest entries for tools no longer in the store.
+    """
+    directory = jsonld_path(root)
+    if isinstance(batch, WriteBatch):
+        # Temp files are staged beside their targets
+        os.makedirs(directory, exist_ok=True)
+    previous = load_manifest(directory)
+    manifest = {}
+    written = []
+    unchanged = 0
+    for tool in store:
+        entry = previous.get(tool)
+        if tools is not None and tool not in tools:
+            # Out of scope this run: keep whatever was recorded
+            if entry is not None:
+                manifest[tool] = entry
+            continue
+        source = store.record_hash(tool)
+        path = os.path.join(directory, f"{tool}.json")
+        if (not force and entry is not None and entry["source"] == source
+                and os.path.exists(path) and hash_text(read_text(path)) == entry["output"]):
+            manifest[tool] = entry
+            unchanged += 1
+            continue
+        content = render_jsonld(store[tool])
+        if batch.stage(path, content):
+            written.append(tool)
+        else:
+            unchanged += 1
+        manifest[tool] = {"source": source, "output": hash_text(content)}
+
+    stale = sorted(set(previous) - set(manifest))
+    data = {"version": JSONLD_VERSION, "tools": manifest}
+    batch.stage(os.path.join(directory, MANIFEST_FILE), json.dumps(data, indent=2) + '\n')
+    return written, unchanged, stale
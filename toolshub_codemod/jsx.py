@@ -0,0 +1,527 @@
+"""
+Linear-time TSX scanner for locating JSX elements in tool pages
+
+Rather than searching whole files with backtracking regexes, the scanner
+makes one forward pass over the source: JavaScript is tokenized just far
+enough to skip strings, templates, comments and regex literals, and any
+JSX found in expression position is parsed into Element nodes with exact
+offsets. Codemods use it to find the default export's return root and the
+point where generated sections are spliced in.
+
+scanbench.py times it against the old insertion regexes.
+"""
+
+import re
+
+# One alternation per token so the hot loop makes a single regex call per token;
+# whitespace and comments are folded into one "skip" run
+_TOKEN_RE = re.compile(r'''
+    (?P<skip>(?:\s+|//[^\n]*|/\*.*?\*/)+)
+  | (?P<word>[A-Za-z_$][\w$]*)
+  | (?P<string>"(?:[^"\\\n]|\\.)*"|'(?:[^'\\\n]|\\.)*')
+  | (?P<number>\d[\w.]*)
+  | (?P<other>.)
+''', re.S | re.X)
+_WS_RE = re.compile(r'\s+')
+_IDENTIFIER_RE = re.compile(r'[A-Za-z_$][\w$]*')
+_NAME_RE = re.compile(r'[A-Za-z_$][\w$.:-]*')
+_ATTR_STRING_RE = {
+    '"': re.compile(r'"[^"]*"'),
+    "'": re.compile(r"'[^']*'"),
+}
+_REGEX_RE = re.compile(r'/(?:[^/\\\[\n]|\\.|\[(?:[^\]\\\n]|\\.)*\])+/[A-Za-z]*')
+_TEMPLATE_CHUNK_RE = re.compile(r'(?:[^`\\$]|\\.|\$(?!\{))*', re.S)
+_JSX_TEXT_RE = re.compile(r'[^<{]+')
+_LINE_COMMENT_RE = re.compile(r'//[^\n]*')
+_BLOCK_COMMENT_RE = re.compile(r'/\*.*?\*/', re.S)
+_EXTENDS_RE = re.compile(r'extends(?![\w$])')
+
+# Keywords after which `/` starts a regex and `<` starts JSX
+_EXPRESSION_KEYWORDS = frozenset({
+    'return', 'typeof', 'instanceof', 'in', 'of', 'new', 'delete', 'void',
+    'throw', 'case', 'do', 'else', 'yield', 'await',
+})
+
+_OPENERS = '([{'
+_CLOSERS = ')]}'
+
+class JsxError(Exception):
+    """Raised when the scanner hits source it cannot make sense of"""
+
+
+class Node:
+    """A JSX child: an element, a {...} expression container or non-blank text"""
+
+    kind = None
+
+    def __init__(self, start, end):
+        self.start = start
+        self.end = end
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.start}, {self.end})"
+
+
+class Expression(Node):
+    kind = "expression"
+
+
+class Text(Node):
+    kind = "text"
+
+
+class Element(Node):
+    """A parsed JSX element; fragments have an empty name"""
+
+    kind = "element"
+
+    def __init__(self, name, start):
+        super().__init__(start, None)
+        self.name = name
+        self.open_end = None
+        self.close_start = None
+        self.children = []
+        # {...} attribute values, and elements given as attribute values
+        self.attributes = []
+        # Attribute name -> its value: Text for a quoted string (quotes
+        # included), Expression for {...}
+        self.props = {}
+
+    @property
+    def self_closing(self):
+        return self.close_start is None
+
+    def elements(self):
+        return [child for child in self.children if child.kind == "element"]
+
+    def last_child(self):
+        return self.children[-1] if self.children else None
+
+    def walk(self):
+        """Yield this element and every element beneath it, depth first"""
+        stack = [self]
+        while stack:
+            element = stack.pop()
+            yield element
+            stack.extend(reversed(element.elements()))
+
+    def __repr__(self):
+        return f"Element({self.name!r}, {self.start}, {self.end})"
+
+
+class Scanner:
+    """One forward pass over a TSX source, parsing JSX where it appears"""
+
+    def __init__(self, source):
+        self.source = source
+        self.length = len(source)
+
+    def tokens(self, i):
+        """Yield (kind, value, start, end) tokens from offset i
+
+        kind is one of word, number, string, template, regex, punct or jsx;
+        for jsx the value is the parsed Element. Brackets come through as
+        punct tokens so callers can track nesting themselves.
+        """
+        s = self.source
+        n = self.length
+        match_token = _TOKEN_RE.match
+        expression_allowed = True
+        while i < n:
+            match = match_token(s, i)
+            kind = match.lastgroup
+            end = match.end()
+            if kind == "skip":
+                i = end
+                continue
+
+            if kind == "word":
+                word = match.group(kind)
+                yield ("word", word, i, end)
+                expression_allowed = word in _EXPRESSION_KEYWORDS
+                i = end
+                continue
+
+            if kind == "string" or kind == "number":
+                yield (kind, match.group(kind), i, end)
+                expression_allowed = False
+                i = end
+                continue
+
+            c = s[i]
+            if c == '`':
+                end = self.skip_template(i)
+                yield ("template", s[i:end], i, end)
+                expression_allowed = False
+                i = end
+                continue
+
+            if expression_allowed:
+                if c == '/':
+                    match = _REGEX_RE.match(s, i)
+                    if match:
+                        yield ("regex", match.group(0), i, match.end())
+                        expression_allowed = False
+                        i = match.end()
+                        continue
+                elif c == '<':
+                    nxt = s[i + 1:i + 2]
+                    if (nxt == '>' or nxt.isalpha() or nxt in '_$') and not self.type_parameters_at(i):
+                        element = self.parse_element(i)
+                        yield ("jsx", element, i, element.end)
+                        expression_allowed = False
+                        i = element.end
+                        continue
+
+            if c in '"\'':
+                raise JsxError(f"unterminated string at {i}")
+            if c == '/' and s.startswith('/*', i):
+                raise JsxError(f"unterminated comment at {i}")
+            yield ("punct", c, i, i + 1)
+            expression_allowed = c not in ')]'
+            i += 1
+
+    def type_parameters_at(self, i):
+        """Whether the '<' at i opens a generic arrow's type parameters (<T,> or <T extends U>)"""
+        s = self.source
+        match = _IDENTIFIER_RE.match(s, i + 1)
+        if not match:
+            return False
+        j = self.skip_ws_and_comments(match.end())
+        return s.startswith(',', j) or _EXTENDS_RE.match(s, j) is not None
+
+    def skip_balanced(self, i):
+        """Skip JS after an opener at i-1 up to its closer, returning the offset past it"""
+        depth = 0
+        for kind, value, start, end in self.tokens(i):
+            if kind != "punct":
+                continue
+            if value in _OPENERS:
+                depth += 1
+            elif value in _CLOSERS:
+                if depth == 0:
+                    return end
+                depth -= 1
+        raise JsxError(f"unbalanced brackets after {i}")
+
+    def skip_template(self, i):
+        """Skip a template literal starting at i, including ${...} substitutions"""
+        s = self.source
+        i += 1
+        while True:
+            i = _TEMPLATE_CHUNK_RE.match(s, i).end()
+            if i >= self.length:
+                raise JsxError("unterminated template literal")
+            if s[i] == '`':
+                return i + 1
+            # `${`: substitution runs to its matching brace
+            i = self.skip_balanced(i + 2)
+
+    def skip_ws_and_comments(self, i):
+        s = self.source
+        while i < self.length:
+            if s[i].isspace():
+                i = _WS_RE.match(s, i).end()
+            elif s.startswith('//', i):
+                i = _LINE_COMMENT_RE.match(s, i).end()
+            elif s.startswith('/*', i):
+                match = _BLOCK_COMMENT_RE.match(s, i)
+                if not match:
+                    raise JsxError(f"unterminated comment at {i}")
+                i = match.end()
+            else:
+                break
+        return i
+
+    def parse_element(self, i):
+        """Parse the JSX element whose '<' is at offset i"""
+        s = self.source
+        j = self.skip_ws_and_comments(i + 1)
+        if s.startswith('>', j):
+            element = Element('', i)
+            element.open_end = j + 1
+            return self.parse_children(element, j + 1)
+
+        match = _NAME_RE.match(s, j)
+        if not match:
+            raise JsxError(f"bad tag name at {j}")
+        element = Element(match.group(0), i)
+        j = match.end()
+
+        # Attributes; name is the one whose value comes next, after its =
+        name = None
+        while True:
+            j = self.skip_ws_and_comments(j)
+            if j >= self.length:
+                raise JsxError(f"unterminated tag <{element.name}> at {i}")
+            c = s[j]
+            if c == '/' and s.startswith('/>', j):
+                element.open_end = element.end = j + 2
+                return element
+            if c == '>':
+                element.open_end = j + 1
+                return self.parse_children(element, j + 1)
+            if c == '{':
+                end = self.skip_balanced(j + 1)
+                element.attributes.append(Expression(j, end))
+                if name is not None:
+                    element.props[name] = element.attributes[-1]
+                j = end
+                name = None
+            elif c in _ATTR_STRING_RE:
+                match = _ATTR_STRING_RE[c].match(s, j)
+                if not match:
+                    raise JsxError(f"unterminated attribute string at {j}")
+                if name is not None:
+                    element.props[name] = Text(j, match.end())
+                j = match.end()
+                name = None
+            elif c == '=':
+                j += 1
+            elif c == '<':
+                value = self.parse_element(j)
+                element.attributes.append(value)
+                j = value.end
+                name = None
+            else:
+                match = _NAME_RE.match(s, j)
+                if not match:
+                    raise JsxError(f"unexpected {c!r} in <{element.name}> at {j}")
+                j = match.end()
+                # A bare attribute (no =) takes no value
+                name = match.group(0) if s.startswith('=', self.skip_ws_and_comments(j)) else None
+
+    def parse_children(self, element, j):
+        s = self.source
+        while j < self.length:
+            c = s[j]
+            if c == '<':
+                if s.startswith('/', self.skip_ws_and_comments(j + 1)):
+                    return self.parse_closing(element, j)
+                child = self.parse_element(j)
+                element.children.append(child)
+                j = child.end
+            elif c == '{':
+                end = self.skip_balanced(j + 1)
+                element.children.append(Expression(j, end))
+                j = end
+            else:
+                end = _JSX_TEXT_RE.match(s, j).end()
+                if not s[j:end].isspace():
+                    element.children.append(Text(j, end))
+                j = end
+        raise JsxError(f"unclosed <{element.name}> at {element.start}")
+
+    def parse_closing(self, element, j):
+        s = self.source
+        k = self.skip_ws_and_comments(j + 1) + 1
+        k = self.skip_ws_and_comments(k)
+        match = _NAME_RE.match(s, k)
+        name = match.group(0) if match else ''
+        if name != element.name:
+            raise JsxError(f"</{name}> at {j} closes <{element.name}> from {element.start}")
+        k = self.skip_ws_and_comments(match.end() if match else k)
+        if not s.startswith('>', k):
+            raise JsxError(f"bad closing tag at {j}")
+        element.close_start = j
+        element.end = k + 1
+        return element
+
+    def default_export_root(self):
+        """The JSX element returned at the top level of the default export function"""
+        tokens = self.tokens(0)
+        recent = []
+        for kind, value, start, end in tokens:
+            recent = (recent + [value])[-3:] if kind == "word" else []
+            if recent == ['export', 'default', 'function']:
+                break
+        else:
+            raise JsxError("no `export default function` found")
+
+        # Skip the name and parameter list, then enter the body
+        for kind, value, start, end in tokens:
+            if kind == "punct" and value == '(':
+                params_end = self.skip_balanced(end)
+                break
+        else:
+            raise JsxError("default export has no parameter list")
+        tokens = self.tokens(params_end)
+        for kind, value, start, end in tokens:
+            if kind == "punct" and value == '{':
+                break
+        else:
+            raise JsxError("default export has no body")
+
+        # Track `return` statements at the top level of the body; the last wins
+        root = None
+        depth = 0
+        after_return = False
+        wrapping_parens = 0
+        for kind, value, start, end in tokens:
+            if after_return:
+                after_return = False
+                if kind == "punct" and value == '(':
+                    wrapping_parens += 1
+                    after_return = True
+                    continue
+                if kind == "jsx":
+                    root = value
+            if kind == "punct":
+                if value in _OPENERS:
+                    depth += 1
+                elif value in _CLOSERS:
+                    if depth == 0 and wrapping_parens and value == ')':
+                        wrapping_parens -= 1
+                    elif depth == 0:
+                        break
+                    else:
+                        depth -= 1
+            elif kind == "word" and value == 'return' and depth == 0:
+                after_return = True
+        if root is None:
+            raise JsxError("default export does not return JSX")
+        return root
+
+
+def identifiers(source):
+    """Every identifier source refers to outside strings, comments and JSX text
+
+    JSX tag names count by their first dotted part. Template literals count
+    every word in them, which errs towards keeping names rather than
+    dropping ones a ${...} substitution uses.
+    """
+    scanner = Scanner(source)
+    names = set()
+    ranges = [(0, len(source))]
+    while ranges:
+        i, end = ranges.pop()
+        for kind, value, start, stop in scanner.tokens(i):
+            if start >= end:
+                break
+            if kind == "word":
+                names.add(value)
+            elif kind == "template":
+                names.update(_IDENTIFIER_RE.findall(value))
+            elif kind == "jsx":
+                elements = [value]
+                while elements:
+                    element = elements.pop()
+                    names.add(element.name.split('.')[0])
+                    for node in element.attributes + element.children:
+                        if node.kind == "element":
+                            elements.append(node)
+                        elif node.kind == "expression":
+                            ranges.append((node.start + 1, node.end - 1))
+    return names
+
+
+def class_strings(source, attributes=("className",), all_strings=False):
+    """(start, end) spans of the class lists in source's className attributes
+
+    That is the text inside className="..." and every string literal, and
+    the static text of every template literal, in a className={...}
+    expression (cn(...) arguments, ternary branches). all_strings takes
+    every string and template in the file too, for classes kept in
+    variables and lookup tables. Spans come in no particular order.
+    """
+    scanner = Scanner(source)
+    spans = []
+    # (start, end, inside a className expression)
+    ranges = [(0, len(source), all_strings)]
+    while ranges:
+        i, end, in_class = ranges.pop()
+        for kind, value, start, stop in scanner.tokens(i):
+            if start >= end:
+                break
+            if kind == "string" and in_class:
+                spans.append((start + 1, stop - 1))
+            elif kind == "template":
+                for chunk_start, chunk_end, is_substitution in _template_parts(scanner, start, stop):
+                    if is_substitution:
+                        ranges.append((chunk_start, chunk_end, in_class))
+                    elif in_class:
+                        spans.append((chunk_start, chunk_end))
+            elif kind == "jsx":
+                elements = [value]
+                while elements:
+                    element = elements.pop()
+                    class_values = {id(element.props[name]) for name in attributes if name in element.props}
+                    for name in attributes:
+                        node = element.props.get(name)
+                        if node is not None and node.kind == "text":
+                            spans.append((node.start + 1, node.end - 1))
+                    for node in element.attributes + element.children:
+                        if node.kind == "element":
+                            elements.append(node)
+                        elif node.kind == "expression":
+                            ranges.append((node.start + 1, node.end - 1, all_strings or id(node) in class_values))
+    return spans
+
+
+def _template_parts(scanner, start, end):
+    """(start, end, is_substitution) for the static chunks and ${...} bodies of a template literal"""
+    s = scanner.source
+    i = start + 1
+    while i < end:
+        chunk_end = _TEMPLATE_CHUNK_RE.match(s, i).end()
+        if chunk_end > i:
+            yield i, chunk_end, False
+        if s[chunk_end] == '`':
+            return
+        substitution_end = scanner.skip_balanced(chunk_end + 2)
+        yield chunk_end + 2, substitution_end - 1, True
+        i = substitution_end
+
+
+def default_export_root(source):
+    """Parse source and return the default export's top-level returned Element"""
+    return Scanner(source).default_export_root()
+
+
+def _trim_left(source, offset):
+    """Move offset back over whitespace, like a leading `\\s*` in a regex match"""
+    while offset > 0 and source[offset - 1].isspace():
+        offset -= 1
+    return offset
+
+
+def _last_element(element):
+    child = element.last_child()
+    return child if child is not None and child.kind == "element" else None
+
+
+def find_container(root, layout=None):
+    """Find the element generated sections are appended to
+
+    layout "ToolPageLayout" picks the first <ToolPageLayout> under the root;
+    "div" follows the root's trailing <div> chain three levels deep (the
+    page > container > content nesting the tool pages share). None tries
+    ToolPageLayout first, then div.
+    """
+    if layout in (None, "ToolPageLayout"):
+        for element in root.walk():
+            if element.name == "ToolPageLayout" and not element.self_closing:
+                return element
+        if layout:
+            return None
+
+    element = root
+    for _ in range(2):
+        if element.name != "div":
+            return None
+        element = _last_element(element)
+        if element is None:
+            return None
+    return element if element.name == "div" and not element.self_closing else None
+
+
+def find_insertion_point(source, layout=None):
+    """Offset just before the container's closing tag (and its indentation), or None"""
+    try:
+        root = default_export_root(source)
+    except JsxError:
+        return None
+    container = find_container(root, layout)
+    if container is None:
+        return None
+    return _trim_left(source, container.close_start)
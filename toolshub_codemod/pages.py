@@ -0,0 +1,134 @@
+"""
+Tool page.tsx files generated from one metadata manifest
+
+content/pages.json maps each tool key to the generateToolMetadata()
+arguments of its page: toolName, description, category and keywords
+(toolPath is always /tools/<tool>). render_page() turns an entry into the
+page word-counter/page.tsx shows, with the client import, page function
+and component named by to_pascal_case() so no fix-up pass is needed.
+
+Pages were hand-written before the manifest, so they don't all share one
+format. page_style() reads an existing page's semicolons, comment, line
+wrapping, trailing commas and final newline, and render_page() keeps them,
+so regenerating a page only changes it when its metadata does.
+"""
+
+import json
+import os
+import re
+from collections import namedtuple
+
+from .content import CONTENT_DIR
+from .engine import to_pascal_case
+
+PAGES_FILE = os.path.join(os.path.dirname(CONTENT_DIR), "pages.json")
+
+FIELDS = ("toolName", "description", "category", "keywords")
+
+PAGE_TEMPLATE = '''import {{ generateToolMetadata }} from "@/components/seo/tool-seo"{semi}
+import {class_name}Client from "./client"{semi}
+
+{comment}export const metadata = generateToolMetadata({{
+  toolName: {tool_name},
+  toolDescription:{description},
+  category: {category},
+  keywords: [
+{keywords}
+  ],
+  toolPath: {tool_path}
+}}){semi}
+
+export default function {class_name}Page() {{
+  return <{class_name}Client />{semi}
+}}
+'''
+
+SEO_COMMENT = "// Export metadata for SEO"
+
+PageStyle = namedtuple(
+    "PageStyle",
+    ["semicolons", "comment", "wrap_description", "keywords_comma", "path_comma", "final_newline"],
+)
+
+# The format of pages generated from scratch
+PAGE_STYLE = PageStyle(
+    semicolons=False, comment=False, wrap_description=False,
+    keywords_comma=False, path_comma=False, final_newline=True,
+)
+
+# A double-quoted JS string, which reads back with json.loads
+_STRING = r'"(?:[^"\\\n]|\\.)*"'
+_FIELD_RE = {
+    field: re.compile(rf'\b{key}:\s*({_STRING})')
+    for field, key in (("toolName", "toolName"), ("description", "toolDescription"), ("category", "category"))
+}
+_KEYWORDS_RE = re.compile(r'\bkeywords:\s*\[([^\]]*)\]')
+_CLIENT_IMPORT_RE = re.compile(r'^import \w+ from "\./client";', re.M)
+_PATH_COMMA_RE = re.compile(rf'\btoolPath:\s*{_STRING},')
+
+
+def load_pages(path=PAGES_FILE):
+    """Map tool key -> page metadata"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def dump_pages(pages):
+    """pages.json text, tools in key order"""
+    return json.dumps(dict(sorted(pages.items())), indent=2, ensure_ascii=False) + '\n'
+
+
+def js_string(text):
+    return json.dumps(text, ensure_ascii=False)
+
+
+def page_style(content):
+    """The PageStyle of an existing page, or PAGE_STYLE if there is none"""
+    if not content:
+        return PAGE_STYLE
+    keywords = _KEYWORDS_RE.search(content)
+    return PageStyle(
+        semicolons=_CLIENT_IMPORT_RE.search(content) is not None,
+        comment=SEO_COMMENT in content,
+        wrap_description=re.search(r'\btoolDescription:\n', content) is not None,
+        keywords_comma=keywords is not None and keywords.group(1).rstrip().endswith(','),
+        path_comma=_PATH_COMMA_RE.search(content) is not None,
+        final_newline=content.endswith('\n'),
+    )
+
+
+def render_page(tool_key, meta, style=PAGE_STYLE):
+    """The page.tsx for one manifest entry, formatted in style"""
+    missing = [field for field in FIELDS if field not in meta]
+    if missing:
+        raise ValueError(f"{tool_key} has no {', '.join(missing)}")
+    description = js_string(meta["description"])
+    content = PAGE_TEMPLATE.format(
+        class_name=to_pascal_case(tool_key),
+        semi=';' if style.semicolons else '',
+        comment=f"{SEO_COMMENT}\n" if style.comment else '',
+        tool_name=js_string(meta["toolName"]),
+        description=f"\n    {description}" if style.wrap_description else f" {description}",
+        category=js_string(meta["category"]),
+        keywords=',\n'.join(f"    {js_string(keyword)}" for keyword in meta["keywords"])
+        + (',' if style.keywords_comma else ''),
+        tool_path=js_string(f"/tools/{tool_key}") + (',' if style.path_comma else ''),
+    )
+    return content if style.final_newline else content[:-1]
+
+
+def read_page_metadata(content):
+    """The manifest entry for an existing page, or None if it doesn't call generateToolMetadata"""
+    if "generateToolMetadata(" not in content:
+        return None
+    meta = {}
+    for field, pattern in _FIELD_RE.items():
+        match = pattern.search(content)
+        if match is None:
+            return None
+        meta[field] = json.loads(match.group(1))
+    match = _KEYWORDS_RE.search(content)
+    if match is None:
+        return None
+    meta["keywords"] = [json.loads(keyword) for keyword in re.findall(_STRING, match.group(1))]
+    return meta
@@ -0,0 +1,120 @@
+"""
+Process-pool fan-out for the per-tool SEO scripts
+"""
+
+import os
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+from .cache import hash_config
+from .engine import TOOLS_DIR
+from .sections import SECTION_VERSION
+from .writeback import WriteBatch
+
+UPDATED = "updated"
+SKIPPED = "skipped"
+FAILED = "failed"
+
+# change is the worker's rewrite (a writeback.Change), staged by run_tools
+ToolResult = namedtuple("ToolResult", ["tool", "status", "message", "change"], defaults=(None,))
+
+
+def add_jobs_argument(parser):
+    """Add the shared --jobs option to a script's argument parser"""
+    parser.add_argument(
+        "--jobs", "-j", type=int, default=1, metavar="N",
+        help="process tools across N worker processes (0 = one per CPU, default: 1)",
+    )
+
+
+def client_path(tool_key, tools_dir=TOOLS_DIR):
+    """Path of a tool's client.tsx (relative to the project root by default)"""
+    return os.path.join(tools_dir, tool_key, "client.tsx")
+
+
+def run_tools(func, configs, jobs=1, cache=None, batch=None, tools_dir=TOOLS_DIR, tools=None):
+    """Call func(tool_key, config, tools_dir) for every config, yielding results in config order
+
+    With a ContentCache, tools whose client.tsx and config are unchanged since
+    the last successful run are reported as skipped without being opened.
+    tools (e.g. from --since) limits the run to those keys; the rest are
+    reported as skipped too.
+    Changes func returns are staged in batch (a WriteBatch by default, or a
+    DiffSink for a dry run) and committed together once every tool is done.
+    """
+    tool_keys = list(configs)
+    skipped = {}
+    if tools is not None:
+        for tool_key in tool_keys:
+            if tool_key not in tools:
+                skipped[tool_key] = f"✓ {tool_key} not changed"
+    config_hashes = {}
+    if cache is not None:
+        # A ContentStore can hash a record without loading it
+        config_hash = getattr(configs, "record_hash", None) or (lambda k: hash_config(configs[k]))
+        for tool_key in tool_keys:
+            if tool_key in skipped:
+                continue
+            config_hashes[tool_key] = config_hash(tool_key)
+            if cache.is_fresh(client_path(tool_key, tools_dir), config_hashes[tool_key], SECTION_VERSION):
+                skipped[tool_key] = f"✓ {tool_key} unchanged since last run"
+    pending = [k for k in tool_keys if k not in skipped]
+
+    # Changes are staged as results arrive; nothing is renamed into place
+    # until every tool has been processed, and cache entries wait for the commit
+    if batch is None:
+        batch = WriteBatch()
+    recorded = []
+    try:
+        results = _map_tools(func, pending, configs, jobs, tools_dir)
+        for tool_key in tool_keys:
+            if tool_key in skipped:
+                yield ToolResult(tool_key, SKIPPED, skipped[tool_key])
+                continue
+            result = next(results)
+            changed = result.change is not None and batch.stage(*result.change)
+            if cache is not None:
+                if result.status == FAILED:
+                    cache.forget(client_path(tool_key, tools_dir))
+                else:
+                    recorded.append((tool_key, changed))
+            yield result
+    except BaseException:
+        batch.abort()
+        raise
+    else:
+        committed = set(batch.commit())
+        for tool_key, changed in recorded:
+            # A dry run commits nothing, so changed files stay stale
+            if not changed or client_path(tool_key, tools_dir) in committed:
+                cache.record(client_path(tool_key, tools_dir), config_hashes[tool_key], SECTION_VERSION)
+    finally:
+        if cache is not None:
+            cache.save()
+
+
+def _map_tools(func, tool_keys, configs, jobs, tools_dir):
+    if jobs == 0:
+        jobs = os.cpu_count() or 1
+    if jobs <= 1 or len(tool_keys) <= 1:
+        for tool_key in tool_keys:
+            yield func(tool_key, configs[tool_key], tools_dir)
+        return
+
+    workers = min(jobs, len(tool_keys))
+    chunksize = max(1, len(tool_keys) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        # executor.map hands results back in submission order
+        yield from executor.map(
+            func, tool_keys, [configs[k] for k in tool_keys], [tools_dir] * len(tool_keys),
+            chunksize=chunksize,
+        )
+
+
+def report(results, out=None):
+    """Print each result as it arrives and return the success/skip/failure counts"""
+    counts = {UPDATED: 0, SKIPPED: 0, FAILED: 0}
+    for result in results:
+        print(result.message, file=out)
+        counts[result.status] += 1
+    return counts
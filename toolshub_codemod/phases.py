@@ -0,0 +1,80 @@
+"""
+Command line shared by the add-seo-* phase scripts
+
+Each phase script only holds its SEO_TEMPLATE (the phase's Privacy &
+Security wording, which the seo-content transform loads from it) and
+calls main() here, which runs that transform over the phase's tools in
+every root at once. Adding, regenerating and skipping sections is the
+engine's job, so the scripts and `toolshub-codemod run` can't disagree.
+"""
+
+import argparse
+import os
+import sys
+
+from .cache import add_cache_argument
+from .changes import add_since_argument, since_from_args
+from .roots import RootsRun, add_root_argument, root_labels, roots_from_args, tools_path
+from .transforms import SEO_CONTENT
+from .writeback import add_dry_run_argument
+
+
+def phase_tools(root, phase, since=None, layout=None):
+    """Tool keys of one phase under root, limited to since and to clients rendering layout"""
+    tools = [tool for tool, p in SEO_CONTENT.index().items() if p == phase]
+    if since is not None:
+        tools = [tool for tool in tools if tool in since]
+    if layout is not None:
+        tools = [tool for tool in tools if _uses_layout(tools_path(root), tool, layout)]
+    return tools
+
+
+def _uses_layout(tools_dir, tool, layout):
+    try:
+        with open(os.path.join(tools_dir, tool, "client.tsx"), 'r', encoding='utf-8') as f:
+            return f"<{layout}" in f.read()
+    except FileNotFoundError:
+        return False
+
+
+def main(phase, description, argv=None, layout=None):
+    """Run the seo-content transform over one phase's tools; returns the exit status"""
+    parser = argparse.ArgumentParser(description=description)
+    add_root_argument(parser)
+    add_cache_argument(parser)
+    add_since_argument(parser)
+    add_dry_run_argument(parser)
+    args = parser.parse_args(argv)
+    roots = roots_from_args(parser, args)
+    since = since_from_args(parser, args, roots)
+    tools = {root: phase_tools(root, phase, since and since[root], layout) for root in roots}
+    run = RootsRun(roots, ["seo-content"], dry_run=args.dry_run, use_cache=args.use_cache, tools=tools)
+    # Keep stdout a clean patch when previewing
+    log = sys.stderr if args.dry_run else sys.stdout
+    labels = root_labels(roots) if len(roots) > 1 else None
+
+    print("=" * 70, file=log)
+    print(f"Adding Comprehensive SEO Content to Phase {phase} Tools", file=log)
+    print("=" * 70, file=log)
+
+    updated = 0
+    failed = 0
+    for root, result in run:
+        where = f"[{labels[root]}] " if labels else ""
+        if result.applied:
+            updated += 1
+            print(f"✓ {where}Updated {result.tool}", file=log)
+        for error in result.errors:
+            failed += 1
+            print(f"⚠️  {where}{result.tool}: {error}", file=log)
+
+    total = sum(len(keys) for keys in tools.values())
+    verb = "would change" if args.dry_run else "updated"
+    print("=" * 70, file=log)
+    print(f"✓ {total} Phase {phase} tool(s): {updated} {verb}, {failed} problem(s)", file=log)
+    print("=" * 70, file=log)
+
+    # A dry run fails if anything would change
+    if args.dry_run:
+        return 1 if run.changed or failed else 0
+    return 1 if failed else 0
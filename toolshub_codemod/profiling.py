@@ -0,0 +1,202 @@
+"""
+Timers, counters and optional cProfile/tracemalloc capture for engine runs
+
+engine.run() times its phases (walk, read, transform, write) and each
+transform through whichever Profiler it is given; transforms time their
+own hot spots with timer() and count() against the active one. Without
+--profile the engine uses NULL_PROFILER, whose hooks do nothing.
+
+The active profiler is per thread, and a Profiler may be shared by runs
+on several threads (one per project root); their timers add up.
+"""
+
+import contextlib
+import cProfile
+import io
+import json
+import pstats
+import threading
+import time
+import tracemalloc
+
+CAPTURES = ("cprofile", "tracemalloc")
+DEFAULT_OUTPUT = "toolshub-codemod-profile.json"
+
+# Functions listed per transform in cProfile captures
+TOP_FUNCTIONS = 15
+
+
+class Profiler:
+    """Accumulates timers and counters; capture adds cProfile or tracemalloc per transform"""
+
+    def __init__(self, capture=None):
+        if capture not in (None,) + CAPTURES:
+            raise ValueError(f"unknown capture: {capture}")
+        self.capture = capture
+        self.timers = {}
+        self.counters = {}
+        self.profiles = {}
+        self.memory = {}
+        self._lock = threading.Lock()
+        if capture == "tracemalloc" and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    @contextlib.contextmanager
+    def timer(self, name):
+        """Add the time spent in the block to timer name"""
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - t0
+            with self._lock:
+                entry = self.timers.setdefault(name, [0.0, 0])
+                entry[0] += elapsed
+                entry[1] += 1
+
+    def count(self, name, n=1):
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + n
+
+    @contextlib.contextmanager
+    def transform(self, name):
+        """Time one transform call, under cProfile or tracemalloc if capturing"""
+        with self.timer(f"transform/{name}"):
+            if self.capture == "cprofile":
+                # cProfile only sees the thread that enabled it, so keep one per thread
+                with self._lock:
+                    per_thread = self.profiles.setdefault(name, {})
+                    profile = per_thread.setdefault(threading.get_ident(), cProfile.Profile())
+                profile.enable()
+                try:
+                    yield
+                finally:
+                    profile.disable()
+            elif self.capture == "tracemalloc":
+                tracemalloc.reset_peak()
+                before = tracemalloc.get_traced_memory()[0]
+                try:
+                    yield
+                finally:
+                    current, peak = tracemalloc.get_traced_memory()
+                    with self._lock:
+                        entry = self.memory.setdefault(name, {"peak_bytes": 0, "net_bytes": 0})
+                        entry["peak_bytes"] = max(entry["peak_bytes"], peak - before)
+                        entry["net_bytes"] += current - before
+            else:
+                yield
+
+    def top_functions(self, name, limit=TOP_FUNCTIONS):
+        """The cProfile rows for one transform, by cumulative time"""
+        stats = pstats.Stats(*self.profiles[name].values(), stream=io.StringIO())
+        rows = []
+        for (filename, line, function), (_, calls, tottime, cumtime, _) in stats.stats.items():
+            rows.append({
+                "function": f"{filename}:{line}({function})",
+                "calls": calls,
+                "tottime_s": tottime,
+                "cumtime_s": cumtime,
+            })
+        rows.sort(key=lambda row: row["cumtime_s"], reverse=True)
+        return rows[:limit]
+
+    def to_json(self):
+        data = {
+            "timers": {
+                name: {"seconds": seconds, "calls": calls}
+                for name, (seconds, calls) in sorted(self.timers.items())
+            },
+            "counters": dict(sorted(self.counters.items())),
+            "capture": self.capture,
+        }
+        if self.capture == "cprofile":
+            data["cprofile"] = {name: self.top_functions(name) for name in sorted(self.profiles)}
+        elif self.capture == "tracemalloc":
+            data["tracemalloc"] = dict(sorted(self.memory.items()))
+        return data
+
+    def write_json(self, path):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_json(), f, indent=2)
+
+    def print_report(self, out=None):
+        """Timers slowest first, then counters, then whatever was captured"""
+        print(f"\n{'timer':<40} {'seconds':>9} {'calls':>7} {'ms/call':>9}", file=out)
+        for name, (seconds, calls) in sorted(self.timers.items(), key=lambda item: -item[1][0]):
+            print(f"{name:<40} {seconds:>9.4f} {calls:>7} {seconds * 1000 / calls:>9.3f}", file=out)
+
+        print(f"\n{'counter':<40} {'value':>9}", file=out)
+        for name, value in sorted(self.counters.items()):
+            print(f"{name:<40} {value:>9}", file=out)
+
+        if self.capture == "cprofile":
+            for name in sorted(self.profiles):
+                print(f"\ncProfile: {name} (top {TOP_FUNCTIONS} by cumulative time)", file=out)
+                for row in self.top_functions(name):
+                    print(f"  {row['cumtime_s']:>9.4f}s {row['calls']:>7}  {row['function']}", file=out)
+        elif self.capture == "tracemalloc":
+            print(f"\n{'tracemalloc':<40} {'peak KiB':>9} {'net KiB':>9}", file=out)
+            for name, entry in sorted(self.memory.items(), key=lambda item: -item[1]["peak_bytes"]):
+                print(f"{name:<40} {entry['peak_bytes'] / 1024:>9.1f} {entry['net_bytes'] / 1024:>9.1f}", file=out)
+
+
+class NullProfiler:
+    """Profiler stand-in whose hooks cost next to nothing"""
+
+    capture = None
+    _null = contextlib.nullcontext()
+
+    def timer(self, name):
+        return self._null
+
+    def transform(self, name):
+        return self._null
+
+    def count(self, name, n=1):
+        pass
+
+
+NULL_PROFILER = NullProfiler()
+
+_local = threading.local()
+
+
+def _active():
+    return getattr(_local, "profiler", NULL_PROFILER)
+
+
+@contextlib.contextmanager
+def activate(profiler):
+    """Make profiler the one timer() and count() report to for the block, in this thread"""
+    previous = _active()
+    _local.profiler = profiler
+    try:
+        yield profiler
+    finally:
+        _local.profiler = previous
+
+
+def timer(name):
+    """Time a block against the active profiler"""
+    return _active().timer(name)
+
+
+def count(name, n=1):
+    """Bump a counter on the active profiler"""
+    _active().count(name, n)
+
+
+def add_profile_arguments(parser):
+    """Add the shared --profile options to a script's argument parser"""
+    parser.add_argument(
+        "--profile", action="store_true",
+        help="print per-phase timers and counters and write them as JSON",
+    )
+    parser.add_argument(
+        "--profile-output", default=DEFAULT_OUTPUT, metavar="FILE",
+        help="JSON file for --profile results (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--profile-capture", choices=CAPTURES,
+        help="also capture cProfile stats or tracemalloc peaks per transform",
+    )
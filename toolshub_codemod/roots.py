@@ -0,0 +1,169 @@
+"""
+Project roots: finding a checkout and running the engine over several
+
+A root is a checkout of the site, recognised by its src/app/tools
+directory. Scripts use the one they're run from (or any parent of it)
+unless --root names others. Several roots run concurrently on threads in
+one process, so the registered transforms, the phase templates and the
+SEO content store are loaded once and shared; each root keeps its own
+cache file and write batch.
+"""
+
+import os
+import queue
+import threading
+
+from . import engine
+from .cache import CACHE_FILE, ContentCache
+from .engine import TOOLS_DIR
+from .writeback import open_batch
+
+
+class RootNotFound(Exception):
+    """Raised when no directory from the start upwards holds src/app/tools"""
+
+
+def is_root(directory):
+    return os.path.isdir(os.path.join(directory, TOOLS_DIR))
+
+
+def find_root(start=None):
+    """The nearest directory at or above start (default: the CWD) holding src/app/tools"""
+    directory = os.path.abspath(start or os.getcwd())
+    while True:
+        if is_root(directory):
+            return directory
+        parent = os.path.dirname(directory)
+        if parent == directory:
+            raise RootNotFound(f"no {TOOLS_DIR} found in {os.path.abspath(start or os.getcwd())} or its parents")
+        directory = parent
+
+
+def resolve_roots(roots=None):
+    """Absolute, de-duplicated roots for --root values, or the discovered one"""
+    if not roots:
+        return [find_root()]
+    resolved = []
+    for root in roots:
+        root = os.path.abspath(root)
+        if not is_root(root):
+            raise RootNotFound(f"{root} has no {TOOLS_DIR}")
+        if root not in resolved:
+            resolved.append(root)
+    return resolved
+
+
+def tools_path(root):
+    return os.path.join(root, TOOLS_DIR)
+
+
+def cache_path(root):
+    return os.path.join(root, CACHE_FILE)
+
+
+def root_labels(roots):
+    """Short names for log lines: directory names, or full paths where those clash"""
+    names = [os.path.basename(root) for root in roots]
+    return {
+        root: name if names.count(name) == 1 else root
+        for root, name in zip(roots, names)
+    }
+
+
+def add_root_argument(parser):
+    """Add the shared --root option to a script's argument parser"""
+    parser.add_argument(
+        "--root", action="append", metavar="DIR",
+        help="project checkout to process; repeat for several "
+             "(default: the checkout containing the current directory)",
+    )
+
+
+def roots_from_args(parser, args):
+    """resolve_roots(args.root), reporting a bad root as a usage error"""
+    try:
+        return resolve_roots(args.root)
+    except RootNotFound as e:
+        parser.error(str(e))
+
+
+_DONE = object()
+
+
+class RootsRun:
+    """engine.run() over several roots at once, iterated as (root, FileResult)
+
+    Each root gets its own batch (a WriteBatch, or a DiffSink for a dry
+    run) and, with use_cache, its own cache file. tools maps a root to the
+    tool directories to limit its walk to (see changes.tools_since). One root runs in the
+    calling thread; more run on a thread each, and results are handed back
+    as they arrive. Every root commits its own batch when its walk ends;
+    stopping early (an exception or Ctrl+C in the caller, or a failing
+    root) aborts the walks still in progress.
+    """
+
+    def __init__(self, roots, transforms=None, dry_run=False, use_cache=True, profiler=None, tools=None):
+        self.roots = roots
+        self.transforms = transforms
+        self.tools = tools or {}
+        self.profiler = profiler
+        self.batches = {root: open_batch(dry_run, root, roots) for root in roots}
+        self.caches = {root: ContentCache(cache_path(root)) if use_cache else None for root in roots}
+
+    @property
+    def changed(self):
+        """Paths a dry run would change, across every root"""
+        return [path for batch in self.batches.values() for path in getattr(batch, "changed", ())]
+
+    def _run(self, root):
+        return engine.run(
+            tools_path(root), self.transforms, cache=self.caches[root], batch=self.batches[root],
+            tools=self.tools.get(root), profiler=self.profiler,
+        )
+
+    def __iter__(self):
+        if len(self.roots) == 1:
+            root = self.roots[0]
+            for result in self._run(root):
+                yield root, result
+            return
+
+        results = queue.Queue()
+        stop = threading.Event()
+
+        def worker(root):
+            walk = self._run(root)
+            try:
+                for result in walk:
+                    if stop.is_set():
+                        break
+                    results.put((root, result))
+            except BaseException as e:
+                results.put((root, e))
+            finally:
+                # Closing an unfinished walk aborts its batch
+                walk.close()
+                results.put((root, _DONE))
+
+        threads = [threading.Thread(target=worker, args=(root,), daemon=True) for root in self.roots]
+        for thread in threads:
+            thread.start()
+        error = None
+        try:
+            pending = len(threads)
+            while pending:
+                root, item = results.get()
+                if item is _DONE:
+                    pending -= 1
+                elif isinstance(item, BaseException):
+                    error = error or item
+                    stop.set()
+                elif not stop.is_set():
+                    yield root, item
+        finally:
+            # Workers stop at their next file and abort whatever they staged
+            stop.set()
+            for thread in threads:
+                thread.join()
+        if error is not None:
+            raise error
@@ -0,0 +1,98 @@
+"""
+Benchmark the JSX scanner against the regexes it replaced
+
+    python3 -m toolshub_codemod.scanbench [client.tsx ...] [--repeat N] [--whitespace WIDTH]
+
+Times jsx.find_insertion_point and the old whole-file insertion regexes
+on the same pages and checks that both find the same offset.
+"""
+
+import argparse
+import glob
+import os
+import re
+import tempfile
+import time
+
+from .jsx import find_insertion_point
+
+# Old whole-file insertion searches, kept for benchmarking and comparison
+LEGACY_INSERTION_PATTERNS = {
+    "div": re.compile(r'(\s*</div>\s*</div>\s*</div>\s*\)\s*})\s*$'),
+    "ToolPageLayout": re.compile(r'(\s*</ToolPageLayout>\s*</>?\s*\)\s*})\s*$'),
+}
+
+
+def _legacy_insertion_point(source, layout):
+    patterns = (
+        LEGACY_INSERTION_PATTERNS.values() if layout is None
+        else [LEGACY_INSERTION_PATTERNS[layout]]
+    )
+    for pattern in patterns:
+        match = pattern.search(source)
+        if match:
+            return match.start()
+    return None
+
+
+def benchmark(paths, repeat=50):
+    """Time find_insertion_point against the legacy regexes; yields one row per file"""
+    for path in paths:
+        with open(path, 'r', encoding='utf-8') as f:
+            source = f.read()
+        row = {"path": path, "bytes": len(source.encode('utf-8'))}
+        for label, func in (("scanner", find_insertion_point), ("regex", _legacy_insertion_point)):
+            best = None
+            for _ in range(repeat):
+                t0 = time.perf_counter()
+                offset = func(source, None)
+                elapsed = time.perf_counter() - t0
+                best = elapsed if best is None else min(best, elapsed)
+            row[label] = {"offset": offset, "best_ms": best * 1000}
+        yield row
+
+
+def whitespace_page(width):
+    """A small page whose closing tags sit behind a long whitespace run
+
+    The legacy regexes retry their leading \\s* from every offset in the run,
+    so their cost grows with width squared.
+    """
+    return (
+        'export default function Page() {\n  return (\n    <div>\n      <div>\n        <div>'
+        + ' ' * width
+        + '</div>\n      </div>\n    </div>\n  )\n}\n// trailing comment\n'
+    )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the JSX scanner against the insertion regexes")
+    parser.add_argument("paths", nargs="*", help="client.tsx files (default: the 5 largest tool pages)")
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--whitespace", type=int, default=0, metavar="WIDTH",
+                        help="also time a synthetic page with a WIDTH-character whitespace run")
+    args = parser.parse_args(argv)
+
+    paths = args.paths
+    if not paths:
+        paths = sorted(glob.glob(os.path.join("src", "app", "tools", "*", "client.tsx")),
+                       key=os.path.getsize, reverse=True)[:5]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        repeat = args.repeat
+        if args.whitespace:
+            synthetic = os.path.join(tmp, f"whitespace-{args.whitespace}.tsx")
+            with open(synthetic, 'w', encoding='utf-8') as f:
+                f.write(whitespace_page(args.whitespace))
+            paths = list(paths) + [synthetic]
+
+        print(f"{'file':<55} {'bytes':>7} {'scanner ms':>11} {'regex ms':>9}  offsets")
+        for row in benchmark(paths, repeat):
+            scanner, regex = row["scanner"], row["regex"]
+            same = "same" if scanner["offset"] == regex["offset"] else f"{scanner['offset']} vs {regex['offset']}"
+            path = os.path.basename(row["path"]) if row["path"].startswith(tmp) else row["path"]
+            print(f"{path:<55} {row['bytes']:>7} {scanner['best_ms']:>11.3f} {regex['best_ms']:>9.3f}  {same}")
+
+
+if __name__ == "__main__":
+    main()
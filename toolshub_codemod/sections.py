@@ -0,0 +1,222 @@
+"""
+Locate and replace injected SEO sections in client.tsx files
+
+Generated sections sit between a begin marker carrying the section
+version and a hash of the markup, and an end marker:
+
+    {/* Full-width SEO Content Section v2 3f9a0c1d2e4b */}
+    <div className="mt-12 ...">...</div>
+    {/* End Full-width SEO Content Section */}
+
+so a section is found with two string searches, and whether it is current
+is a hash comparison rather than a JSX walk and a text diff. Sections from
+before the markers carried a stamp (the marker comment alone) are still
+found by walking the JSX, and get stamped the next time they are written.
+"""
+
+import hashlib
+import os
+import re
+from collections import namedtuple
+
+from .engine import TransformError
+from .jsx import JsxError, default_export_root
+
+SEO_MARKER = 'Full-width SEO Content Section'
+
+# Server-component mode: the section lives in this file beside client.tsx
+# and reaches the client component through the seoContent prop
+SEO_COMPONENT_FILE = "seo-content.tsx"
+SEO_SLOT = "{seoContent}"
+
+# Where generated sections get their icons when the client doesn't import them
+SECTION_IMPORTS = {"Info": "lucide-react"}
+
+_TAG_NAME_RE = re.compile(r'<([A-Z]\w*)')
+_NAMED_IMPORT_RE = re.compile(r'import\s*\{([^}]*)\}\s*from\s*["\']([^"\']+)["\']')
+
+# Bump whenever the generated section markup changes so cached files are redone
+SECTION_VERSION = 2
+
+SEO_END_MARKER = 'End ' + SEO_MARKER
+_BEGIN_RE = re.compile(r'\{/\* ' + re.escape(SEO_MARKER) + r' v(\d+) ([0-9a-f]+) \*/\}')
+_END = '{/* ' + SEO_END_MARKER + ' */}'
+
+# start and end as for find_seo_section; version and digest from the begin
+# marker (None for an unstamped section)
+Section = namedtuple("Section", ["start", "end", "version", "digest"])
+
+# Characters that can't appear raw in JSX text; & and ' are left for the
+# config author, who may already have written entities like &apos;
+_JSX_TEXT_ESCAPES = str.maketrans({
+    '<': '&lt;',
+    '>': '&gt;',
+    '{': '&#123;',
+    '}': '&#125;',
+})
+
+
+def jsx_text(text):
+    """Escape config prose for use as JSX text"""
+    # Most prose has nothing to escape; skip translate()'s per-character mapping
+    if '<' in text or '>' in text or '{' in text or '}' in text:
+        return text.translate(_JSX_TEXT_ESCAPES)
+    return text
+
+
+def in_server_mode(client_source, tool_dir):
+    """Whether a tool's SEO section lives in seo-content.tsx rather than client.tsx"""
+    return SEO_SLOT in client_source or os.path.exists(os.path.join(tool_dir, SEO_COMPONENT_FILE))
+
+
+def section_digest(markup):
+    """Short hash of a section's markup, as stamped on its begin marker"""
+    return hashlib.sha256(markup.encode('utf-8')).hexdigest()[:12]
+
+
+def stamp_section(markup, indent='        '):
+    """Wrap rendered section markup (starting with a newline) in stamped markers"""
+    return (
+        f'\n{indent}{{/* {SEO_MARKER} v{SECTION_VERSION} {section_digest(markup)} */}}'
+        + markup
+        + f'\n{indent}{_END}'
+    )
+
+
+def locate_seo_section(content):
+    """Return the injected Section, or None
+
+    A stamped section runs from its begin marker to its end marker; an
+    unstamped one is the {/* marker */} expression plus the element right
+    after it. Either way the span takes the marker's line break and
+    indentation with it.
+    """
+    if SEO_MARKER not in content:
+        return None
+    begin = _BEGIN_RE.search(content)
+    if begin is not None:
+        end = content.find(_END, begin.end())
+        if end == -1:
+            return None
+        return Section(_line_start(content, begin.start()), end + len(_END),
+                       int(begin.group(1)), begin.group(2))
+    span = _find_unstamped_section(content)
+    if span is None:
+        return None
+    return Section(span[0], span[1], None, None)
+
+
+def section_is_current(content, section, markup):
+    """Whether section (from locate_seo_section) already holds markup, going by its stamp
+
+    The stamp has to match both markup and what is actually between the
+    markers, so a hand-edited section still counts as stale.
+    """
+    if section.version != SECTION_VERSION or section.digest != section_digest(markup):
+        return False
+    body_start = content.index('*/}', section.start) + 3
+    body_end = content.rindex(_END, section.start, section.end)
+    body = content[body_start:body_end].rstrip(' \t')
+    if body.endswith('\n'):
+        body = body[:-1]
+    return section_digest(body) == section.digest
+
+
+def find_seo_section(content):
+    """Return (start, end) of the injected section including its leading newline, or None"""
+    section = locate_seo_section(content)
+    return None if section is None else (section.start, section.end)
+
+
+def _line_start(content, start):
+    """start moved back over indentation and the line break before it"""
+    while start > 0 and content[start - 1] in ' \t':
+        start -= 1
+    if start > 0 and content[start - 1] == '\n':
+        start -= 1
+    return start
+
+
+def _find_unstamped_section(content):
+    try:
+        root = default_export_root(content)
+    except JsxError:
+        return None
+
+    for element in root.walk():
+        children = element.children
+        for index, child in enumerate(children[:-1]):
+            if child.kind != "expression" or SEO_MARKER not in content[child.start:child.end]:
+                continue
+            section = children[index + 1]
+            if section.kind != "element":
+                return None
+            return _line_start(content, child.start), section.end
+    return None
+
+
+def replace_seo_section(content, seo_section):
+    """Swap an existing section for seo_section, returning None if there is none to replace"""
+    span = find_seo_section(content)
+    if span is None:
+        return None
+    start, end = span
+    return content[:start] + seo_section + content[end:]
+
+
+def strip_seo_section(content, span, replacement=SEO_SLOT):
+    """Replace the section at span (from find_seo_section) with replacement on the marker's line"""
+    start, end = span
+    line_start = start + 1 if content[start] == '\n' else start
+    indent = content[line_start:len(content) - len(content[line_start:].lstrip(' \t'))]
+    return content[:start] + '\n' + indent + replacement + content[end:]
+
+
+def named_imports(content):
+    """Map each name imported with import { ... } from "module" to its module"""
+    imports = {}
+    for match in _NAMED_IMPORT_RE.finditer(content):
+        for specifier in match.group(1).split(','):
+            name = specifier.strip().split(' as ')[-1].strip()
+            if name:
+                imports[name] = match.group(2)
+    return imports
+
+
+def seo_component(name, section, client_source):
+    """Source of a server component that renders section
+
+    section is a rendered section or one cut out of client_source, marker
+    line included. Components it uses are imported from wherever
+    client_source imports them.
+    """
+    lines = section.lstrip('\n').split('\n')
+    if lines and SEO_MARKER in lines[0]:
+        lines = lines[1:]
+    if lines and SEO_END_MARKER in lines[-1]:
+        lines = lines[:-1]
+    markup = '\n'.join(lines)
+    if '{' in markup:
+        raise TransformError("SEO section has JSX expressions; move it by hand")
+
+    available = dict(SECTION_IMPORTS)
+    available.update(named_imports(client_source))
+    modules = {}
+    for tag in dict.fromkeys(_TAG_NAME_RE.findall(markup)):
+        if tag not in available:
+            raise TransformError(f"SEO section uses {tag}, which client.tsx doesn't import")
+        modules.setdefault(available[tag], []).append(tag)
+    imports = [f'import {{ {", ".join(names)} }} from "{module}"' for module, names in modules.items()]
+
+    indent = min(len(line) - len(line.lstrip(' ')) for line in lines if line.strip())
+    body = '\n'.join('    ' + line[indent:] if line.strip() else '' for line in lines)
+
+    return (
+        '\n'.join(imports) + ('\n\n' if imports else '')
+        + f"// {SEO_MARKER}, rendered on the server and passed to the client page\n"
+        + f"export default function {name}() {{\n"
+        + "  return (\n"
+        + body + "\n"
+        + "  )\n"
+        + "}\n"
+    )
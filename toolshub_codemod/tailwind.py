@@ -0,0 +1,260 @@
+"""
+Tailwind class inventory, source manifest and safelist
+
+Tailwind v4 finds classes by scanning every file it can see from the
+project root, which here includes the docs, the Python scripts, the
+content store and stray backups. The indexer reads the class lists of
+every TSX/TS file under src/ (see jsx.class_strings), plus the classes
+the SEO phase templates emit for each content record, and writes:
+
+- an inventory: every class, the files using it, and which ones only the
+  SEO configs produce (e.g. text-teal-600 for a tool whose section hasn't
+  been injected yet);
+- a block in src/app/globals.css that turns off automatic detection
+  (@import "tailwindcss" source(none)) and points an @source glob at
+  every scanned file type anywhere under src/, so a new directory or a
+  .jsx file still gets its CSS, plus an @source inline() safelist of the
+  config-only classes.
+
+@source inline() needs Tailwind 4.1; older 4.x builds get the source
+glob only. uncovered_files() finds files the globs committed in
+globals.css don't reach, for `tailwind --dry-run` and `check` to fail on.
+"""
+
+import json
+import os
+import posixpath
+import re
+
+from .jsx import JsxError, class_strings
+from .transforms import SEO_CONTENT, seo_template
+
+GLOBALS_CSS = os.path.join("src", "app", "globals.css")
+SOURCE_DIR = "src"
+SCANNED_EXTENSIONS = (".tsx", ".ts", ".jsx", ".js")
+INVENTORY_FILE = "tailwind-classes.json"
+
+BLOCK_BEGIN = "/* toolshub-codemod tailwind: begin (generated by `toolshub-codemod tailwind`, do not edit) */"
+BLOCK_END = "/* toolshub-codemod tailwind: end */"
+_BLOCK_RE = re.compile(re.escape(BLOCK_BEGIN) + r'.*?' + re.escape(BLOCK_END) + r'\n?', re.S)
+_IMPORT_RE = re.compile(r'@import\s+["\']tailwindcss["\'](?P<options>[^;]*);')
+
+# What a class token can look like; anything else in a class string
+# (prose in an all-strings scan, stray punctuation) is left out
+_CLASS_RE = re.compile(r'!?-?[a-z@\[*][\w\-:/.\[\]#%()!,=&>+~@*]*')
+_STRING_RE = re.compile(r'"(?:[^"\\\n]|\\.)*"|\'(?:[^\'\\\n]|\\.)*\'')
+_CLASS_NAME_RE = re.compile(r'className="([^"]*)"')
+_SOURCE_RE = re.compile(r'@source\s+(?P<not>not\s+)?["\'](?P<glob>[^"\']+)["\']\s*;')
+
+
+class TailwindConfigError(Exception):
+    """Raised for a globals.css the source manifest can't be written into"""
+
+
+def tailwind_version(root):
+    """Installed (or locked) tailwindcss version as a tuple, or None if unknown"""
+    candidates = [
+        (os.path.join(root, "node_modules", "tailwindcss", "package.json"), lambda data: data["version"]),
+        (os.path.join(root, "package-lock.json"),
+         lambda data: data["packages"]["node_modules/tailwindcss"]["version"]),
+    ]
+    for path, version in candidates:
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                text = version(json.load(f))
+        except (OSError, ValueError, KeyError):
+            continue
+        return tuple(int(part) for part in re.findall(r'\d+', text)[:3])
+    return None
+
+
+def class_tokens(text):
+    """The class-shaped tokens of one class list"""
+    return [token for token in text.split() if _CLASS_RE.fullmatch(token) and '${' not in token]
+
+
+def file_classes(path):
+    """Classes in one source file's className values and class tables"""
+    with open(path, 'r', encoding='utf-8') as f:
+        source = f.read()
+    try:
+        spans = class_strings(source)
+        # Lookup tables (bgColor: "...") count only for tokens also used in a className
+        table_spans = class_strings(source, all_strings=True)
+    except JsxError:
+        # Plain TS the JSX scanner can't follow: fall back to its string literals
+        spans = []
+        table_spans = [(m.start() + 1, m.end() - 1) for m in _STRING_RE.finditer(source)]
+    direct = set()
+    for start, end in spans:
+        direct.update(class_tokens(source[start:end]))
+    candidates = set()
+    for start, end in table_spans:
+        candidates.update(class_tokens(source[start:end]))
+    return direct, candidates
+
+
+def config_classes():
+    """tool -> classes its SEO phase template renders from its content record"""
+    classes = {}
+    for tool in SEO_CONTENT:
+        template = seo_template(tool)
+        if template is None:
+            continue
+        section = template.render(SEO_CONTENT[tool])
+        tokens = set()
+        for value in _CLASS_NAME_RE.findall(section):
+            tokens.update(class_tokens(value))
+        classes[tool] = tokens
+    return classes
+
+
+def source_files(root):
+    files = []
+    for directory, dirnames, filenames in os.walk(os.path.join(root, SOURCE_DIR)):
+        dirnames[:] = sorted(d for d in dirnames if not d.startswith('.') and d != "node_modules")
+        files.extend(os.path.join(directory, f) for f in sorted(filenames) if f.endswith(SCANNED_EXTENSIONS))
+    return files
+
+
+def build_inventory(root):
+    """Every class under root's src/ and in the SEO configs, with where it comes from"""
+    used = {}
+    candidates = {}
+    errors = {}
+    for path in source_files(root):
+        name = os.path.relpath(path, root)
+        try:
+            direct, found = file_classes(path)
+        except (OSError, UnicodeDecodeError) as e:
+            errors[name] = str(e)
+            continue
+        for token in direct:
+            used.setdefault(token, set()).add(name)
+        for token in found - direct:
+            candidates.setdefault(token, set()).add(name)
+    # A token only in some string counts where it is a class somewhere else
+    for token, names in candidates.items():
+        if token in used:
+            used[token].update(names)
+
+    from_configs = {}
+    for tool, tokens in config_classes().items():
+        for token in tokens:
+            from_configs.setdefault(token, set()).add(tool)
+
+    return {
+        "classes": {token: sorted(names) for token, names in sorted(used.items())},
+        "config_classes": {token: sorted(tools) for token, tools in sorted(from_configs.items())},
+        # Classes the configs produce that no scanned file has yet
+        "safelist": sorted(set(from_configs) - set(used)),
+        "errors": errors,
+    }
+
+
+def source_globs(root):
+    """@source globs, relative to globals.css, for every scanned file type under src/"""
+    css_dir = os.path.dirname(os.path.join(root, GLOBALS_CSS))
+    path = os.path.relpath(os.path.join(root, SOURCE_DIR), css_dir).replace(os.sep, '/')
+    if not path.startswith('.'):
+        path = './' + path
+    exts = ','.join(sorted(ext.lstrip('.') for ext in SCANNED_EXTENSIONS))
+    return [f"{path}/**/*.{{{exts}}}"]
+
+
+def glob_regex(glob):
+    """Compiled regex for a Tailwind @source glob, matched against /-separated paths"""
+    if not any(c in glob for c in '*?{'):
+        # A plain path: the file itself or everything under the directory
+        return re.compile(re.escape(glob.rstrip('/')) + r'(?:/.*)?')
+    pattern = []
+    braces = 0
+    i = 0
+    while i < len(glob):
+        if glob.startswith('**/', i):
+            pattern.append(r'(?:.*/)?')
+            i += 3
+            continue
+        if glob.startswith('**', i):
+            pattern.append(r'.*')
+            i += 2
+            continue
+        c = glob[i]
+        if c == '*':
+            pattern.append(r'[^/]*')
+        elif c == '?':
+            pattern.append(r'[^/]')
+        elif c == '{':
+            braces += 1
+            pattern.append('(?:')
+        elif c == '}' and braces:
+            braces -= 1
+            pattern.append(')')
+        elif c == ',' and braces:
+            pattern.append('|')
+        else:
+            pattern.append(re.escape(c))
+        i += 1
+    return re.compile(''.join(pattern))
+
+
+def committed_sources(css):
+    """(globs, excluded globs) globals.css points Tailwind at, or None if detection is automatic"""
+    match = _IMPORT_RE.search(css)
+    if match is None or "source(none)" not in match.group("options"):
+        return None
+    globs = []
+    excluded = []
+    for source in _SOURCE_RE.finditer(css):
+        (excluded if source.group("not") else globs).append(source.group("glob"))
+    return globs, excluded
+
+
+def uncovered_files(css, names):
+    """Of names (paths relative to the root), those globals.css's @source globs don't reach"""
+    sources = committed_sources(css)
+    if sources is None:
+        return []
+    css_dir = posixpath.dirname(GLOBALS_CSS.replace(os.sep, '/'))
+
+    def patterns(globs):
+        return [glob_regex(posixpath.normpath(posixpath.join(css_dir, glob))) for glob in globs]
+
+    globs, excluded = map(patterns, sources)
+    uncovered = []
+    for name in names:
+        path = name.replace(os.sep, '/')
+        if not any(p.fullmatch(path) for p in globs) or any(p.fullmatch(path) for p in excluded):
+            uncovered.append(name)
+    return uncovered
+
+
+def render_block(globs, safelist, inline=True):
+    """The generated globals.css block"""
+    lines = [BLOCK_BEGIN]
+    lines += [f'@source "{glob}";' for glob in globs]
+    if safelist and inline:
+        lines.append(f'@source inline("{" ".join(safelist)}");')
+    lines.append(BLOCK_END)
+    return '\n'.join(lines) + '\n'
+
+
+def update_globals(css, block):
+    """globals.css text with the generated block in place and automatic detection off"""
+    match = _IMPORT_RE.search(css)
+    if match is None:
+        raise TailwindConfigError('no @import "tailwindcss" in globals.css')
+    options = match.group("options")
+    if "source(" not in options:
+        options = options.rstrip() + " source(none)"
+        css = css[:match.start()] + f'@import "tailwindcss"{options};' + css[match.end():]
+        match = _IMPORT_RE.search(css)
+
+    existing = _BLOCK_RE.search(css)
+    if existing:
+        return css[:existing.start()] + block + css[existing.end():]
+    # Right after the import, where Tailwind reads its configuration
+    end = match.end()
+    if css.startswith('\n', end):
+        end += 1
+    return css[:end] + '\n' + block + css[end:]
@@ -0,0 +1,256 @@
+"""
+Precompiled SEO section template shared by every phase
+
+The section layout is parsed once into a render plan: a flat list of
+literal fragments interleaved with config slots and loops over the
+features/steps/use_cases lists. Phase-specific wording (the Privacy &
+Security paragraph) and the layout the section is spliced into are
+template parameters, so rendering a tool is a single join.
+
+Template syntax:
+
+    {{name}}                  config value, escaped for JSX text
+    {{&name}}                 config value, inserted raw
+    {{#list a,b}}...{{/list}} repeat for each item of config[list], joined
+                              with newlines; pairs unpack into a and b, and
+                              {{&index}} is the 1-based item number
+"""
+
+import functools
+import re
+
+from .jsx import find_insertion_point
+from .sections import jsx_text, stamp_section
+
+# The markup between the section markers (see sections.stamp_section)
+SECTION_LAYOUT = '''
+        <div className="mt-12 bg-white rounded-2xl p-8 border border-gray-200">
+          <div className="max-w-full">
+            <div className="flex items-center gap-2 mb-4">
+              <Info className="h-5 w-5 text-{{&color}}-600" />
+              <h2 className="text-2xl font-bold text-gray-900">About {{title}}</h2>
+            </div>
+
+            <div className="prose prose-sm text-gray-600 max-w-none">
+              <p className="mb-4">
+                {{intro}}
+              </p>
+
+              <div className="grid md:grid-cols-2 gap-6 my-6">
+                <div>
+                  <h3 className="text-lg font-bold text-gray-900 mb-3">Key Features</h3>
+                  <ul className="space-y-2">
+{{#features title,desc}}                    <li className="flex items-start gap-2">
+                      <span className="text-{{&color}}-600 mt-1">•</span>
+                      <span><strong>{{title}}:</strong> {{desc}}</span>
+                    </li>{{/features}}
+                  </ul>
+                </div>
+
+                <div>
+                  <h3 className="text-lg font-bold text-gray-900 mb-3">How to Use</h3>
+                  <ol className="space-y-2">
+{{#steps step}}                    <li className="flex items-start gap-2">
+                      <span className="font-bold text-{{&color}}-600">{{&index}}.</span>
+                      <span>{{step}}</span>
+                    </li>{{/steps}}
+                  </ol>
+                </div>
+              </div>
+
+              <h3 className="text-lg font-bold text-gray-900 mb-3">What is it?</h3>
+              <p className="mb-4">
+                {{what_is}}
+              </p>
+
+              <h3 className="text-lg font-bold text-gray-900 mb-3">Common Use Cases</h3>
+              <ul className="space-y-2 mb-4">
+{{#use_cases title,desc}}                <li className="flex items-start gap-2">
+                  <span className="text-{{&color}}-600 mt-1">•</span>
+                  <span><strong>{{title}}:</strong> {{desc}}</span>
+                </li>{{/use_cases}}
+              </ul>
+
+              <div className="bg-green-50 border border-green-200 rounded-lg p-4">
+                <h3 className="text-lg font-bold text-gray-900 mb-2">Privacy & Security</h3>
+                <p>
+{{&privacy}}
+                </p>
+              </div>
+            </div>
+          </div>
+        </div>'''
+
+PRIVACY_INDENT = ' ' * 18
+
+_TAG_RE = re.compile(r'\{\{([#/&]?)([\w]+)(?: ([\w,]+))?\}\}')
+
+
+class TemplateError(Exception):
+    """Raised for malformed template text"""
+
+
+# Plan pieces: (LITERAL, text) | (SLOT, name, escape) | (FIELD, position, escape)
+#              | (INDEX,) | (LOOP, name, arity, pieces)
+LITERAL, SLOT, FIELD, INDEX, LOOP = range(5)
+
+
+class RenderPlan:
+    """A parsed template, compiled once into a render function
+
+    Literal text (with fixed params already baked in) becomes constants of
+    the generated function, so rendering is one join over those fragments
+    with the escaped config values slotted in. Config values are strings.
+    """
+
+    def __init__(self, pieces):
+        self.pieces = pieces
+        self.render = _generate(pieces)
+
+
+def compile_template(text, params=None):
+    """Parse template text into a RenderPlan, baking in fixed params"""
+    pieces, _ = _parse(text, 0, params or {}, None, ())
+    return RenderPlan(pieces)
+
+
+def _parse(text, pos, params, loop_name, fields):
+    pieces = []
+
+    def literal(chunk):
+        if not chunk:
+            return
+        if pieces and pieces[-1][0] == LITERAL:
+            pieces[-1] = (LITERAL, pieces[-1][1] + chunk)
+        else:
+            pieces.append((LITERAL, chunk))
+
+    while True:
+        match = _TAG_RE.search(text, pos)
+        if not match:
+            if loop_name is not None:
+                raise TemplateError(f"unclosed {{{{#{loop_name}}}}}")
+            literal(text[pos:])
+            return pieces, len(text)
+        literal(text[pos:match.start()])
+        pos = match.end()
+        sigil, name, loop_fields = match.groups()
+
+        if sigil == '/':
+            if name != loop_name:
+                raise TemplateError(f"{{{{/{name}}}}} closes {{{{#{loop_name}}}}}")
+            return pieces, pos
+
+        if sigil == '#':
+            if loop_name is not None:
+                raise TemplateError("nested loops are not supported")
+            inner_fields = tuple(loop_fields.split(',')) if loop_fields else ()
+            body, pos = _parse(text, pos, params, name, inner_fields)
+            pieces.append((LOOP, name, len(inner_fields), body))
+            continue
+
+        escape = sigil != '&'
+        if name in fields:
+            pieces.append((FIELD, fields.index(name), escape))
+        elif name == 'index' and loop_name is not None:
+            pieces.append((INDEX,))
+        elif name in params:
+            # Fixed parameters become part of the surrounding literal
+            value = params[name]
+            literal(jsx_text(value) if escape else value)
+        else:
+            pieces.append((SLOT, name, escape))
+
+
+def _concat(exprs):
+    # An f-string of bare names compiles to a single BUILD_STRING
+    return 'f"' + ''.join('{' + expr + '}' for expr in exprs) + '"'
+
+
+def _generate(pieces):
+    """Build the render(values) function for a list of plan pieces"""
+    constants = {'_esc': jsx_text, '_nl': '\n'}
+    slots = {}
+    prelude = []
+
+    def constant(text):
+        name = f"_L{len(constants)}"
+        constants[name] = text
+        return name
+
+    def slot(name, escape):
+        key = (name, escape)
+        if key not in slots:
+            var = f"_s{len(slots)}"
+            slots[key] = var
+            expr = f"values[{name!r}]"
+            prelude.append(f"    {var} = {'_esc(' + expr + ')' if escape else expr}")
+        return slots[key]
+
+    def expressions(pieces):
+        exprs = []
+        for piece in pieces:
+            kind = piece[0]
+            if kind == LITERAL:
+                exprs.append(constant(piece[1]))
+            elif kind == SLOT:
+                exprs.append(slot(piece[1], piece[2]))
+            elif kind == FIELD:
+                exprs.append(f"_esc(_f{piece[1]})" if piece[2] else f"_f{piece[1]}")
+            elif kind == INDEX:
+                exprs.append("_i")
+            else:
+                _, name, arity, body = piece
+                targets = ', '.join(f"_f{i}" for i in range(arity)) if arity != 1 else "_f0"
+                if arity > 1:
+                    targets = f"({targets})"
+                item = _concat(expressions(body))
+                var = f"_loop{len(prelude)}"
+                prelude.append(
+                    f"    {var} = _nl.join([{item} for _i, {targets} in enumerate(values[{name!r}], 1)])"
+                )
+                exprs.append(var)
+        return exprs
+
+    body = "    return " + _concat(expressions(pieces))
+    source = '\n'.join(["def render(values):"] + prelude + [body])
+    namespace = dict(constants)
+    exec(compile(source, "<seo-section-template>", "exec"), namespace)
+    return namespace['render']
+
+
+@functools.lru_cache(maxsize=None)
+def _compiled_section(privacy):
+    return compile_template(SECTION_LAYOUT, {"privacy": privacy})
+
+
+class SectionTemplate:
+    """The SEO section with one phase's parameters applied
+
+    privacy is the Privacy & Security paragraph as a sequence of lines;
+    layout is passed to find_insertion_point ("div", "ToolPageLayout" or
+    None for whichever the page uses).
+    """
+
+    def __init__(self, privacy, layout=None):
+        self.privacy = '\n'.join(PRIVACY_INDENT + line for line in privacy)
+        self.layout = layout
+        self.plan = _compiled_section(self.privacy)
+
+    def render(self, config):
+        """Render the section for one tool config, markers included"""
+        return stamp_section(self.plan.render(config))
+
+    def markup(self, config):
+        """Render the section for one tool config without its markers"""
+        return self.plan.render(config)
+
+    def insertion_point(self, content):
+        return find_insertion_point(content, self.layout)
+
+    def inject(self, content, config):
+        """Splice a freshly rendered section into content, or return None if there's nowhere to put it"""
+        insertion_point = self.insertion_point(content)
+        if insertion_point is None:
+            return None
+        return content[:insertion_point] + self.render(config) + '\n      ' + content[insertion_point:]
@@ -0,0 +1,278 @@
+"""
+Built-in transforms for the codemod pipeline
+
+Registration order is pipeline order: client.tsx export renaming, SEO
+injection and lucide-react import tidying, then page.tsx import and
+Page/Client function fixing. Most touch separate parts of a file, so they
+record edits against the text as read (see edits.py) rather than copying
+it per change.
+
+In server mode the SEO section goes to a seo-content.tsx server component
+instead: seo-server-component cuts it out of (or keeps it out of)
+client.tsx and emits the component, and seo-page-slot has page.tsx render
+it into the client's seoContent prop. In remove mode seo-remove takes
+generated sections back out of client.tsx.
+"""
+
+import importlib.util
+import os
+import re
+import threading
+
+from . import profiling
+from .content import ContentStore
+from .engine import TransformError, register, to_pascal_case
+from .imports import LUCIDE, import_edits, tidy_imports
+from .sections import (
+    SECTION_IMPORTS, SECTION_VERSION, SEO_COMPONENT_FILE, SEO_MARKER, SEO_SLOT,
+    find_seo_section, in_server_mode, locate_seo_section, section_is_current, seo_component,
+    stamp_section, strip_seo_section,
+)
+
+SCRIPTS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Phase scripts that carry each phase's SEO_TEMPLATE
+SEO_PHASES = {
+    3: "add-seo-content-phase3.py",
+    4: "add-seo-phase4.py",
+    5: "add-seo-phase5.py",
+}
+
+SEO_CONTENT = ContentStore()
+
+_phase_modules = {}
+# Roots running on several threads share the loaded phase scripts
+_phase_lock = threading.Lock()
+
+
+def _load_script(filename):
+    """Import one of the hyphenated top-level scripts as a module"""
+    path = os.path.join(SCRIPTS_DIR, filename)
+    name = os.path.splitext(filename)[0].replace('-', '_')
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def seo_template(tool):
+    """The SEO_TEMPLATE of the phase that covers a tool, or None"""
+    phase = SEO_CONTENT.index().get(tool)
+    if phase is None:
+        return None
+    return phase_template(phase)
+
+
+def phase_template(phase):
+    """The SEO_TEMPLATE of one phase's script"""
+    if phase not in _phase_modules:
+        with _phase_lock:
+            if phase not in _phase_modules:
+                _phase_modules[phase] = _load_script(SEO_PHASES[phase])
+    return _phase_modules[phase].SEO_TEMPLATE
+
+
+@register("client-exports", "client.tsx", edits=True)
+def update_client_export(tool, buffer):
+    """Rename export default function XxxPage() to XxxClient()"""
+    pattern = r'export default function \w+Page\(\)'
+    replacement = f'export default function {to_pascal_case(tool)}Client()'
+    buffer.sub(pattern, replacement)
+
+
+def seo_config_hash(tool):
+    """Hash of a tool's SEO content record, or None"""
+    return SEO_CONTENT.record_hash(tool)
+
+
+@register("seo-content", "client.tsx", version=SECTION_VERSION, config=seo_config_hash,
+          mode="client", files=True, edits=True)
+def inject_seo_section(tool, buffer, files):
+    """Insert the phase SEO section before the page's closing layout tags"""
+    template = seo_template(tool)
+    if template is None:
+        return
+    config = SEO_CONTENT[tool]
+    content = buffer.original
+
+    # Moved to seo-content.tsx by a server-mode run; a second copy would render twice
+    if in_server_mode(content, files.tool_dir):
+        profiling.count("files skipped (server mode)")
+        return
+
+    # Regenerate an existing section in place so config changes don't go stale
+    if SEO_MARKER in content:
+        with profiling.timer("seo-content/render"):
+            markup = template.markup(config)
+        with profiling.timer("seo-content/replace section"):
+            section = locate_seo_section(content)
+            if section is None or section_is_current(content, section, markup):
+                profiling.count("files skipped (marker check)")
+            else:
+                buffer.replace(section.start, section.end, stamp_section(markup))
+        return
+
+    if _hand_written_section(content, config):
+        profiling.count("files skipped (hand-written section)")
+        return
+
+    with profiling.timer("seo-content/insertion point"):
+        insertion_point = template.insertion_point(content)
+    if insertion_point is None:
+        raise TransformError("could not find insertion point")
+
+    # Import the section's icons alongside the page's own
+    with profiling.timer("seo-content/imports"):
+        for module, names in _section_imports().items():
+            for start, end, text in import_edits(content, module, required=names):
+                buffer.replace(start, end, text)
+
+    with profiling.timer("seo-content/render"):
+        section = template.render(config)
+    buffer.insert(insertion_point, section + '\n      ')
+
+
+def _hand_written_section(content, config):
+    """Whether a client without a generated section already has an About section of its own"""
+    return 'About ' + config['title'] in content
+
+
+def _section_imports():
+    """Module -> the names generated sections need from it"""
+    modules = {}
+    for name, module in SECTION_IMPORTS.items():
+        modules.setdefault(module, []).append(name)
+    return modules
+
+
+_CLIENT_IMPORT_RE = re.compile(r'import .* from "\./client";?')
+_CLIENT_RETURN_RE = re.compile(r'return <\w+Client />')
+
+
+@register("seo-server-component", "client.tsx", version=SECTION_VERSION,
+          config=seo_config_hash, mode="server", files=True)
+def move_seo_section(tool, content, files):
+    """Move the SEO section out of client.tsx into a seo-content.tsx server component"""
+    template = seo_template(tool)
+    span = find_seo_section(content)
+    if span is None and SEO_SLOT not in content and template is not None \
+            and _hand_written_section(content, SEO_CONTENT[tool]):
+        return content
+    if template is not None:
+        # Render from config so the component tracks content/seo edits
+        section = template.render(SEO_CONTENT[tool])
+    elif span is not None:
+        section = content[span[0]:span[1]]
+    else:
+        return content
+    component = seo_component(f"{to_pascal_case(tool)}SeoContent", section, content)
+
+    # Don't take the section out of a client that page.tsx can't hand it back to
+    page = files.read("page.tsx") or ''
+    if './seo-content"' not in page and not (_CLIENT_IMPORT_RE.search(page) and _CLIENT_RETURN_RE.search(page)):
+        raise TransformError("page.tsx doesn't import and render the client component")
+
+    if span is not None:
+        content = strip_seo_section(content, span)
+    elif SEO_SLOT not in content:
+        # Never injected: leave the slot where the section would have gone
+        insertion_point = template.insertion_point(content)
+        if insertion_point is None:
+            raise TransformError("could not find insertion point")
+        content = content[:insertion_point] + '\n        ' + SEO_SLOT + content[insertion_point:]
+
+    if 'seoContent }' not in content:
+        signature = re.compile(r'export default function (\w+Client)\(\)')
+        if not signature.search(content):
+            raise TransformError("client component signature not recognised")
+        content = signature.sub(
+            r'export default function \1({ seoContent }: { seoContent?: React.ReactNode })',
+            content,
+            count=1,
+        )
+
+    files.emit(SEO_COMPONENT_FILE, component)
+    # The section's icons may have left with it
+    for module, names in _section_imports().items():
+        content = tidy_imports(content, module, prune=names)
+    return content
+
+
+@register("seo-remove", "client.tsx", version=SECTION_VERSION, mode="remove")
+def remove_seo_section(tool, content):
+    """Take the generated SEO section out of client.tsx"""
+    section = locate_seo_section(content)
+    if section is None:
+        if SEO_SLOT in content:
+            raise TransformError(f"SEO section is in {SEO_COMPONENT_FILE}; remove it by hand")
+        return content
+    # An unstamped section with no content record was written by hand
+    if section.version is None and seo_template(tool) is None:
+        return content
+    before = content[:section.start]
+    after = content[section.end:]
+    # Drop the blank line the section leaves behind (inject_seo_section adds one after it)
+    if after.startswith('\n') and re.search(r'\n[ \t]*\Z', before):
+        before = re.sub(r'\n[ \t]*\Z', '', before)
+    else:
+        after = re.sub(r'\A\n[ \t]*(?=\n)', '', after)
+    content = before + after
+    for module, names in _section_imports().items():
+        content = tidy_imports(content, module, prune=names)
+    return content
+
+
+@register("lucide-imports", "client.tsx")
+def tidy_lucide_imports(tool, content):
+    """Merge lucide-react imports into one statement and drop icons the page doesn't use"""
+    return tidy_imports(content, LUCIDE, prune=True)
+
+
+@register("fix-imports", "page.tsx", edits=True)
+def fix_import(tool, buffer):
+    """Point the ./client import at XxxClient"""
+    pattern = r'import .* from "./client"'
+    replacement = f'import {to_pascal_case(tool)}Client from "./client"'
+    buffer.sub(pattern, replacement)
+
+
+@register("fix-page-functions", "page.tsx", edits=True)
+def fix_page_function(tool, buffer):
+    """Name the page function XxxPage and have it render XxxClient"""
+    class_name = to_pascal_case(tool)
+
+    # Fix export default function line
+    pattern1 = r'export default function .+Page\(\) \{'
+    replacement1 = f'export default function {class_name}Page() {{'
+    buffer.sub(pattern1, replacement1)
+
+    # Fix return statement
+    pattern2 = r'return <.+Client />'
+    replacement2 = f'return <{class_name}Client />'
+    buffer.sub(pattern2, replacement2)
+
+
+@register("seo-page-slot", "page.tsx", mode="server", files=True)
+def render_seo_component(tool, content, files):
+    """Import seo-content.tsx in page.tsx and pass it to XxxClient as seoContent"""
+    if files.read(SEO_COMPONENT_FILE) is None:
+        return content
+    class_name = to_pascal_case(tool)
+    component = f"{class_name}SeoContent"
+
+    if './seo-content"' not in content:
+        match = _CLIENT_IMPORT_RE.search(content)
+        if match is None:
+            raise TransformError("no ./client import to add the seo-content import after")
+        # Match the page's own semicolon style
+        semicolon = ';' if match.group(0).endswith(';') else ''
+        content = (
+            content[:match.end()]
+            + f'\nimport {component} from "./seo-content"{semicolon}'
+            + content[match.end():]
+        )
+
+    return content.replace(
+        f'return <{class_name}Client />',
+        f'return <{class_name}Client seoContent={{<{component} />}} />',
+    )
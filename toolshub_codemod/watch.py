@@ -0,0 +1,216 @@
+"""
+File watching for `toolshub-codemod run --watch`
+
+Changes under the tools tree (and the SEO content store) are collected
+with inotify where the kernel provides it, or by polling stat() otherwise.
+Bursts of saves are debounced into one batch, which is mapped to the tools
+and transforms it affects so a re-run only touches what changed.
+"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import time
+
+from .content import INDEX_FILE
+
+# inotify(7) event masks
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_ISDIR = 0x40000000
+IN_CLOEXEC = 0o2000000
+
+FILE_EVENTS = IN_CLOSE_WRITE | IN_MOVED_TO | IN_MOVED_FROM | IN_DELETE
+DIR_EVENTS = IN_CREATE | IN_MOVED_TO | IN_ONLYDIR
+
+_EVENT = struct.Struct("iIII")
+
+# Marker returned when events were lost and everything must be rescanned
+RESCAN = object()
+
+
+class InotifyWatcher:
+    """Watches roots (and, for nested roots, their immediate subdirectories) via inotify"""
+
+    def __init__(self, roots):
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        if not hasattr(libc, "inotify_init1"):
+            raise OSError("inotify is not available")
+        self._libc = libc
+        self.fd = libc.inotify_init1(IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.dirs = {}
+        self.nested = set()
+        for directory, nested in roots:
+            self._add(directory, FILE_EVENTS | (DIR_EVENTS if nested else 0))
+            if nested:
+                self.nested.add(directory)
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.is_dir():
+                            self._add(entry.path, FILE_EVENTS)
+
+    def _add(self, directory, mask):
+        wd = self._libc.inotify_add_watch(self.fd, os.fsencode(directory), mask)
+        if wd < 0:
+            raise OSError(ctypes.get_errno(), f"cannot watch {directory}")
+        self.dirs[wd] = directory
+
+    def changes(self, timeout=None):
+        """Changed paths seen within timeout seconds (None blocks until there are some)"""
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return set()
+        data = os.read(self.fd, 64 * 1024)
+        paths = set()
+        offset = 0
+        while offset < len(data):
+            wd, mask, _, length = _EVENT.unpack_from(data, offset)
+            name = os.fsdecode(data[offset + _EVENT.size:offset + _EVENT.size + length].rstrip(b'\0'))
+            offset += _EVENT.size + length
+            if mask & IN_Q_OVERFLOW:
+                paths.add(RESCAN)
+                continue
+            if mask & IN_IGNORED:
+                self.dirs.pop(wd, None)
+                continue
+            directory = self.dirs.get(wd)
+            if directory is None:
+                continue
+            path = os.path.join(directory, name)
+            if mask & IN_ISDIR:
+                # A new tool directory: watch it and treat all of it as changed
+                if directory in self.nested and mask & (IN_CREATE | IN_MOVED_TO):
+                    self._add(path, FILE_EVENTS)
+                    paths.add(path)
+                continue
+            paths.add(path)
+        return paths
+
+    def close(self):
+        os.close(self.fd)
+
+
+class PollingWatcher:
+    """Same interface as InotifyWatcher, comparing stat() snapshots every interval seconds"""
+
+    def __init__(self, roots, interval=0.5):
+        self.roots = roots
+        self.interval = interval
+        self.snapshot = self._scan()
+
+    def _scan(self):
+        snapshot = {}
+        for directory, nested in self.roots:
+            dirs = [directory]
+            while dirs:
+                with os.scandir(dirs.pop()) as entries:
+                    for entry in entries:
+                        if entry.is_dir():
+                            if nested and os.path.dirname(entry.path) == directory:
+                                dirs.append(entry.path)
+                        else:
+                            st = entry.stat()
+                            snapshot[entry.path] = (st.st_size, st.st_mtime_ns)
+        return snapshot
+
+    def changes(self, timeout=None):
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            wait = self.interval if deadline is None else min(self.interval, deadline - time.monotonic())
+            if wait > 0:
+                time.sleep(wait)
+            snapshot = self._scan()
+            paths = {
+                path for path in snapshot.keys() | self.snapshot.keys()
+                if snapshot.get(path) != self.snapshot.get(path)
+            }
+            self.snapshot = snapshot
+            if paths or (deadline is not None and time.monotonic() >= deadline):
+                return paths
+
+    def close(self):
+        pass
+
+
+def open_watcher(roots, poll=False):
+    """An InotifyWatcher, or a PollingWatcher where inotify isn't available"""
+    if not poll:
+        try:
+            return InotifyWatcher(roots)
+        except (OSError, AttributeError):
+            pass
+    return PollingWatcher(roots)
+
+
+def debounced(watcher, quiet=0.3):
+    """Yield sets of changed paths, each gathered until quiet seconds pass without another change"""
+    while True:
+        paths = watcher.changes()
+        while True:
+            more = watcher.changes(quiet)
+            if not more:
+                break
+            paths |= more
+        yield paths
+
+
+def affected(paths, tools_dir, transforms, content_dir=None):
+    """Group changed paths into {filenames: [tools]} work for the engine
+
+    An edit to a tool's file affects that file's transforms; a new tool
+    directory affects all of them. An edit to a content record affects the
+    transforms that read per-tool config. RESCAN affects everything.
+    Returns (work, content_tools), where content_tools lists the records
+    (or INDEX_FILE) to drop from memory before re-running.
+    """
+    filenames = {t.filename for t in transforms}
+    config_files = {t.filename for t in transforms if t.config is not None}
+    tools_dir = os.path.abspath(tools_dir)
+    per_tool = {}
+    content_tools = set()
+
+    if RESCAN in paths:
+        content_tools.add(INDEX_FILE)
+        with os.scandir(tools_dir) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    per_tool[entry.name] = set(filenames)
+        paths = ()
+
+    for path in paths:
+        path = os.path.abspath(path)
+        parent, name = os.path.split(path)
+        if content_dir is not None and parent == os.path.abspath(content_dir):
+            if name == INDEX_FILE:
+                # Tools may have been added or moved between phases
+                content_tools.add(INDEX_FILE)
+                if config_files:
+                    with os.scandir(tools_dir) as entries:
+                        for entry in entries:
+                            if entry.is_dir():
+                                per_tool.setdefault(entry.name, set()).update(config_files)
+            elif name.endswith(".json"):
+                tool = name[:-len(".json")]
+                content_tools.add(tool)
+                if config_files and os.path.isdir(os.path.join(tools_dir, tool)):
+                    per_tool.setdefault(tool, set()).update(config_files)
+        elif parent == tools_dir:
+            if os.path.isdir(path):
+                per_tool.setdefault(name, set()).update(filenames)
+        elif os.path.dirname(parent) == tools_dir and name in filenames:
+            per_tool.setdefault(os.path.basename(parent), set()).add(name)
+
+    work = {}
+    for tool, names in sorted(per_tool.items()):
+        work.setdefault(frozenset(names), []).append(tool)
+    return work, content_tools
@@ -0,0 +1,287 @@
+"""
+Atomic, batched write-back for codemod output
+
+Changed files are staged as fsynced temp files next to their targets, so
+an interrupted run never leaves half-written TSX behind. The batch is
+committed at the end of a run by renaming every temp file over its target
+and then fsyncing each touched directory once. A batch opened for a root
+first writes an undo journal of what it is about to change (see
+journal.py).
+
+DiffSink has the same stage/commit/abort interface but prints a unified
+diff for each change instead, for --dry-run. When one run covers several
+roots, every diff header is relative to their common parent, so it names
+its root and the whole stream applies from there.
+"""
+
+import difflib
+import os
+import stat
+import sys
+import tempfile
+import threading
+from collections import namedtuple
+
+from .journal import Journal
+
+# tmp_path is None for a file staged for removal
+Staged = namedtuple("Staged", ["path", "tmp_path"])
+
+# A file rewrite computed by a worker process, for the parent to stage;
+# original is None when the worker no longer holds the text it read
+Change = namedtuple("Change", ["path", "content", "original"])
+
+# Mode for files that don't exist yet (mkstemp creates them 0600)
+NEW_FILE_MODE = 0o644
+
+# DiffSinks for several roots may print from several threads
+_output_lock = threading.Lock()
+
+
+def stage_file(path, content, original=None):
+    """Write content to an fsynced temp file beside path
+
+    Returns a Staged entry, or None if path already holds exactly this
+    content. original is the text the caller read from path, if any, which
+    saves re-reading the file to compare.
+    """
+    data = content.encode('utf-8')
+    if original is not None:
+        if original == content:
+            return None
+        mode = _file_mode(path)
+    else:
+        try:
+            with open(path, 'rb') as f:
+                if f.read() == data:
+                    return None
+                mode = stat.S_IMODE(os.fstat(f.fileno()).st_mode)
+        except FileNotFoundError:
+            mode = NEW_FILE_MODE
+
+    directory = os.path.dirname(path) or '.'
+    fd, tmp_path = tempfile.mkstemp(
+        dir=directory, prefix=f".{os.path.basename(path)}.", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(tmp_path, mode)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    return Staged(path, tmp_path)
+
+
+def _file_mode(path):
+    try:
+        return stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        return NEW_FILE_MODE
+
+
+def fsync_dir(directory):
+    """Make renames inside directory durable"""
+    fd = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+class WriteBatch:
+    """Staged file changes that reach disk together on commit()
+
+    Usable as a context manager: the batch commits when the block exits
+    cleanly and discards its temp files if it raises.
+    """
+
+    def __init__(self, journal=None):
+        self.staged = {}
+        self.journal = journal
+
+    def stage(self, path, content, original=None):
+        """Stage content for path; returns False if path already holds it"""
+        staged = stage_file(path, content, original)
+        if staged is None:
+            return False
+        self._replace(path, staged)
+        return True
+
+    def remove(self, path):
+        """Stage path for deletion; returns False if it doesn't exist"""
+        if not os.path.exists(path):
+            return False
+        self._replace(path, Staged(path, None))
+        return True
+
+    def _replace(self, path, staged):
+        previous = self.staged.pop(path, None)
+        if previous is not None and previous.tmp_path is not None:
+            _discard(previous.tmp_path)
+        self.staged[path] = staged
+
+    def commit(self):
+        """Rename every staged file into place, then fsync each directory once"""
+        committed = []
+        try:
+            if self.journal is not None and self.staged:
+                self.journal.record(
+                    (path, _read_or_none(path), _read_or_none(staged.tmp_path))
+                    for path, staged in self.staged.items()
+                )
+            while self.staged:
+                path, staged = next(iter(self.staged.items()))
+                if staged.tmp_path is None:
+                    os.unlink(path)
+                else:
+                    os.replace(staged.tmp_path, path)
+                del self.staged[path]
+                committed.append(path)
+        except BaseException:
+            self.abort()
+            raise
+        finally:
+            for directory in sorted({os.path.dirname(path) or '.' for path in committed}):
+                fsync_dir(directory)
+        return committed
+
+    def abort(self):
+        """Delete staged temp files, leaving every target untouched"""
+        for staged in self.staged.values():
+            if staged.tmp_path is not None:
+                _discard(staged.tmp_path)
+        self.staged.clear()
+
+    def __len__(self):
+        return len(self.staged)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.commit()
+        else:
+            self.abort()
+        return False
+
+
+def _read_or_none(path):
+    if path is None:
+        return None
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
+
+
+def _discard(tmp_path):
+    try:
+        os.unlink(tmp_path)
+    except FileNotFoundError:
+        pass
+
+
+def add_dry_run_argument(parser):
+    """Add the shared --dry-run option to a script's argument parser"""
+    parser.add_argument(
+        "--dry-run", action="store_true",
+        help="print a unified diff of every change instead of writing; exit 1 if anything would change",
+    )
+
+
+def read_text(path):
+    """A file's text, or '' if it doesn't exist"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return f.read()
+    except FileNotFoundError:
+        return ''
+
+
+def unified_diff(path, original, content, new_file=False, deleted=False):
+    """Yield the lines of a git-style unified diff from original to content"""
+    lines = difflib.unified_diff(
+        original.splitlines(keepends=True),
+        content.splitlines(keepends=True),
+        "/dev/null" if new_file else f"a/{path}",
+        "/dev/null" if deleted else f"b/{path}",
+    )
+    for line in lines:
+        if line.endswith('\n'):
+            yield line
+        else:
+            # Last line of a file without a trailing newline
+            yield line + '\n'
+            yield '\\ No newline at end of file\n'
+
+
+class DiffSink:
+    """Stands in for a WriteBatch: prints each change as a diff, writes nothing
+
+    Diff headers name files relative to root (default: the CWD), so the
+    output applies with `git apply` from there.
+    """
+
+    def __init__(self, out=None, root=None):
+        self.out = out or sys.stdout
+        self.root = root
+        self.changed = []
+
+    def stage(self, path, content, original=None):
+        """Print the diff for path right away; returns False if nothing would change"""
+        new_file = original is None and not os.path.exists(path)
+        if original is None:
+            original = read_text(path)
+        if original == content:
+            return False
+        name = os.path.relpath(path, self.root) if os.path.isabs(path) or self.root else path
+        diff = ''.join(unified_diff(name, original, content, new_file))
+        with _output_lock:
+            self.out.write(diff)
+            self.out.flush()
+        self.changed.append(path)
+        return True
+
+    def remove(self, path):
+        """Print the diff deleting path right away; returns False if it doesn't exist"""
+        if not os.path.exists(path):
+            return False
+        name = os.path.relpath(path, self.root) if os.path.isabs(path) or self.root else path
+        diff = ''.join(unified_diff(name, read_text(path), '', deleted=True))
+        with _output_lock:
+            self.out.write(diff)
+            self.out.flush()
+        self.changed.append(path)
+        return True
+
+    def commit(self):
+        return []
+
+    def abort(self):
+        pass
+
+    def __len__(self):
+        return len(self.changed)
+
+
+def open_batch(dry_run=False, root=None, roots=None):
+    """Journaled WriteBatch for a real run, DiffSink (with paths relative to root) for --dry-run
+
+    roots lists every root of a multi-root run; diffs are then relative to
+    their common parent instead, so each header carries its root's name.
+    """
+    if dry_run:
+        return DiffSink(root=diff_root(root, roots))
+    return WriteBatch(Journal(root) if root is not None else None)
+
+
+def diff_root(root, roots=None):
+    """Directory dry-run diff headers are relative to"""
+    if roots is None or len(roots) < 2:
+        return root
+    return os.path.commonpath([os.path.abspath(r) for r in roots])
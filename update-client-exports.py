@@ -1,31 +1,28 @@
 #!/usr/bin/env python3
-import os
-import re
-
-tools_dir = "/home/mobeen/Desktop/Work/Personal/timio/src/app/tools"
-
-def to_pascal_case(s):
-    """Convert kebab-case to PascalCase"""
-    return ''.join(word.capitalize() for word in s.split('-'))
-
-os.chdir(tools_dir)
-
-for tool in os.listdir('.'):
-    client_path = os.path.join(tool, 'client.tsx')
-    if os.path.isdir(tool) and os.path.exists(client_path):
-        class_name = to_pascal_case(tool)
-
-        with open(client_path, 'r') as f:
-            content = f.read()
-
-        # Replace export default function XxxPage() with XxxClient()
-        pattern = r'export default function \w+Page\(\)'
-        replacement = f'export default function {class_name}Client()'
-        new_content = re.sub(pattern, replacement, content)
-
-        if new_content != content:
-            with open(client_path, 'w') as f:
-                f.write(new_content)
-            print(f"✓ Updated {tool}")
+import argparse
+import sys
+
+from toolshub_codemod.changes import add_since_argument, since_from_args
+from toolshub_codemod.roots import RootsRun, add_root_argument, roots_from_args
+from toolshub_codemod.writeback import add_dry_run_argument
+
+parser = argparse.ArgumentParser()
+add_root_argument(parser)
+add_since_argument(parser)
+add_dry_run_argument(parser)
+args = parser.parse_args()
+roots = roots_from_args(parser, args)
+run = RootsRun(roots, ["client-exports"], dry_run=args.dry_run, use_cache=False,
+               tools=since_from_args(parser, args, roots))
+# Keep stdout a clean patch when previewing
+log = sys.stderr if args.dry_run else sys.stdout
+
+# Replace export default function XxxPage() with XxxClient()
+for root, result in run:
+    if result.applied:
+        print(f"✓ Updated {result.tool}", file=log)
+
+if args.dry_run:
+    sys.exit(1 if run.changed else 0)
 
 print("\n✓ All client exports updated successfully!")